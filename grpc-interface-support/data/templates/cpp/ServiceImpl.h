@@ -22,7 +22,7 @@
 
 namespace velocitas {
 
-class ${{ service_name_camel_case }}Service final : public ${{ package_id }}::${{ service_name }}::Service {
+class ${{ service_name_camel_case }}Service final : public ${{ package_id }}::${{ service_name }}::${{ service_base_class }} {
 public:
     ${{ service_name_camel_case }}Service() = default;
     virtual ~${{ service_name_camel_case }}Service() {};
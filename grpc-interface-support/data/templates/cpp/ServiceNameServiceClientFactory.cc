@@ -21,12 +21,62 @@
 #include <grpcpp/channel.h>
 #include <grpcpp/create_channel.h>
 #include <grpcpp/security/credentials.h>
+#include <grpcpp/support/channel_arguments.h>
+
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
 
 namespace velocitas {
 
+namespace {
+
+constexpr std::size_t CHANNEL_POOL_SIZE      = ${{ channel_pool_size }};
+constexpr bool        CACHE_SERVICE_LOCATION = ${{ cache_service_location }};
+
+struct ChannelPool {
+    std::vector<std::shared_ptr<grpc::Channel>> channels;
+    std::size_t                                 nextChannelIndex{0};
+};
+
+std::string getServiceLocation(Middleware& middleware) {
+    if (!CACHE_SERVICE_LOCATION) {
+        return middleware.getServiceLocation("${{ service_name }}");
+    }
+    static const std::string serviceLocation = middleware.getServiceLocation("${{ service_name }}");
+    return serviceLocation;
+}
+
+std::shared_ptr<grpc::Channel> createChannel(const std::string& serviceLocation, std::size_t poolIndex) {
+    grpc::ChannelArguments arguments;${{ channel_arguments }}
+    // Channels with distinct arguments do not share a subchannel, which gives
+    // each channel of the pool a connection of its own.
+    arguments.SetInt("${{ channel_pool_index_argument }}", static_cast<int>(poolIndex));
+    return grpc::CreateCustomChannel(serviceLocation, grpc::InsecureChannelCredentials(), arguments);
+}
+
+std::shared_ptr<grpc::Channel> getChannel(const std::string& serviceLocation) {
+    static std::mutex                                   mutex;
+    static std::unordered_map<std::string, ChannelPool> channelPools;
+
+    std::lock_guard<std::mutex> lock(mutex);
+    auto&                       pool = channelPools[serviceLocation];
+    if (pool.channels.empty()) {
+        for (std::size_t poolIndex = 0; poolIndex < CHANNEL_POOL_SIZE; ++poolIndex) {
+            pool.channels.push_back(createChannel(serviceLocation, poolIndex));
+        }
+    }
+    auto channel          = pool.channels[pool.nextChannelIndex];
+    pool.nextChannelIndex = (pool.nextChannelIndex + 1) % pool.channels.size();
+    return channel;
+}
+
+} // namespace
+
 std::shared_ptr<${{ package_id }}::${{ service_name }}::Stub>
 ${{ service_name_camel_case }}ServiceClientFactory::create(Middleware& middleware) {
-    auto channel = grpc::CreateChannel(middleware.getServiceLocation("${{ service_name }}"), grpc::InsecureChannelCredentials());
+    auto channel = getChannel(getServiceLocation(middleware));
     auto stub    = std::make_shared<${{ package_id }}::${{ service_name }}::Stub>(channel);
     return stub;
 }
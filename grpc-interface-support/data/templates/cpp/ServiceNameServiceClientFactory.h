@@ -32,7 +32,8 @@ class Middleware;
 class ${{ service_name_camel_case }}ServiceClientFactory {
 public:
     /**
-     * @brief Create a new ${{ service_name_camel_case }} client.
+     * @brief Create a new ${{ service_name_camel_case }} client. Clients of the same service
+     * location share a pool of channels, which are assigned round-robin.
      *
      * @param middleware  The middleware used by the Velocitas application.
      *
@@ -26,16 +26,16 @@ namespace velocitas {
 
 std::unique_ptr<grpc::Server> ${{ service_name_camel_case }}ServiceServerFactory::create(
     Middleware&                                                      middleware,
-    std::shared_ptr<${{ package_id }}::${{ service_name }}::Service>&& service) {
+    std::shared_ptr<${{ package_id }}::${{ service_name }}::${{ service_base_class }}>&& service) {
     const auto serviceLocation = middleware.getServiceLocation("${{ service_name }}");
 
     grpc::EnableDefaultHealthCheckService(true);
     grpc::reflection::InitProtoReflectionServerBuilderPlugin();
-    grpc::ServerBuilder builder;
+    grpc::ServerBuilder builder;${{ server_builder_settings }}
     // Listen on the given address without any authentication mechanism.
     builder.AddListeningPort(serviceLocation, grpc::InsecureServerCredentials());
     // Register "service" as the instance through which we'll communicate with
-    // clients. In this case it corresponds to an *synchronous* service.
+    // clients. In this case it corresponds to a *${{ server_api }}* service.
     builder.RegisterService(service.get());
     // Finally assemble the server.
     std::unique_ptr<grpc::Server> server(builder.BuildAndStart());
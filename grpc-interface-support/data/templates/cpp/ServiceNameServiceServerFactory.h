@@ -33,7 +33,7 @@ class Middleware;
 class ${{ service_name_camel_case }}ServiceServerFactory {
 public:
     static std::unique_ptr<grpc::Server> create(Middleware&                                                      middleware,
-                std::shared_ptr<${{ package_id }}::${{ service_name }}::Service>&& service);
+                std::shared_ptr<${{ package_id }}::${{ service_name }}::${{ service_base_class }}>&& service);
 
     ${{ service_name_camel_case }}ServiceServerFactory() = delete;
 };
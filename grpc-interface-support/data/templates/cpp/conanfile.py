@@ -46,7 +46,7 @@ class ${{ service_name_camel_case }}ServiceConan(ConanFile):
 
     def requirements(self):
         self.requires("grpc/1.50.1", transitive_headers=True)
-        self.requires("vehicle-app-sdk/${{ core_sdk_version }}")
+        self.requires("vehicle-app-sdk/${{ core_sdk_version }}")${{ common_types_requirement }}
 
     def build_requirements(self):
         # Declare both, grpc and protobuf, here to enable proper x-build (w/o using qemu)
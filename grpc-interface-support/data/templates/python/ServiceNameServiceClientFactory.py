@@ -12,17 +12,68 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import Dict, List, Optional, Tuple, Union
+
 import grpc
 from ${{ service_name_lower }}_service_sdk.${{ grpc_file_name_prefix }} import (
     ${{ service_name }}Stub,
 )
 from velocitas_sdk.base import Middleware
 
+CHANNEL_OPTIONS: List[Tuple[str, Union[int, str]]] = ${{ channel_options }}
+COMPRESSION: Optional[grpc.Compression] = ${{ compression }}
+CACHE_SERVICE_LOCATION = ${{ cache_service_location }}
+CHANNEL_POOL_SIZE = ${{ channel_pool_size }}
+# Channels with distinct arguments do not share a subchannel, which gives
+# each channel of a pool a connection of its own
+CHANNEL_POOL_INDEX_OPTION = "${{ channel_pool_index_argument }}"
+
 
 class ${{ service_name }}ServiceClientFactory:
+    _channels: Dict[str, List[grpc.aio.Channel]] = {}
+    _next_channel_index: Dict[str, int] = {}
+    _service_location: Optional[str] = None
+
     @staticmethod
     def create(middleware: Middleware) -> ${{ service_name }}Stub:
-        address = middleware.service_locator.get_service_location("${{ service_name }}")
-        channel = grpc.aio.insecure_channel(address)
+        address = ${{ service_name }}ServiceClientFactory._get_service_location(middleware)
+        channels = ${{ service_name }}ServiceClientFactory._channels.get(address)
+        if channels is None:
+            channels = [
+                grpc.aio.insecure_channel(
+                    address,
+                    options=[*CHANNEL_OPTIONS, (CHANNEL_POOL_INDEX_OPTION, index)],
+                    compression=COMPRESSION,
+                )
+                for index in range(CHANNEL_POOL_SIZE)
+            ]
+            ${{ service_name }}ServiceClientFactory._channels[address] = channels
+
+        index = ${{ service_name }}ServiceClientFactory._next_channel_index.get(address, 0)
+        ${{ service_name }}ServiceClientFactory._next_channel_index[address] = (
+            index + 1
+        ) % len(channels)
+        return ${{ service_name }}Stub(channels[index])
 
-        return ${{ service_name }}Stub(channel)
+    @staticmethod
+    async def close() -> None:
+        channels = [
+            channel
+            for pool in ${{ service_name }}ServiceClientFactory._channels.values()
+            for channel in pool
+        ]
+        ${{ service_name }}ServiceClientFactory._channels.clear()
+        ${{ service_name }}ServiceClientFactory._next_channel_index.clear()
+        ${{ service_name }}ServiceClientFactory._service_location = None
+        for channel in channels:
+            await channel.close()
+
+    @staticmethod
+    def _get_service_location(middleware: Middleware) -> str:
+        if ${{ service_name }}ServiceClientFactory._service_location is not None:
+            return ${{ service_name }}ServiceClientFactory._service_location
+
+        address = middleware.service_locator.get_service_location("${{ service_name }}")
+        if CACHE_SERVICE_LOCATION:
+            ${{ service_name }}ServiceClientFactory._service_location = address
+        return address
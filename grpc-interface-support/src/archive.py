@@ -0,0 +1,217 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import os
+import shutil
+import zipfile
+from typing import Any, Dict, List
+
+from cache import hash_file
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_DIR_NAME = ".extracted"
+
+
+def normalize_member_prefix(prefix: str) -> str:
+    """Normalize a path within an archive so it can be used as member prefix.
+
+    Args:
+        prefix (str): The path within the archive, e.g. "./proto/".
+
+    Returns:
+        str: The normalized prefix, e.g. "proto/". Empty for the archive root.
+    """
+    prefix = os.path.normpath(prefix).replace(os.sep, "/").strip("/")
+    return "" if prefix == "." else f"{prefix}/"
+
+
+def select_members(
+    zip_file: zipfile.ZipFile, member_prefixes: List[str]
+) -> List[zipfile.ZipInfo]:
+    """Select the proto files of an archive located below any of the prefixes.
+
+    Args:
+        zip_file (zipfile.ZipFile): The archive.
+        member_prefixes (List[str]): Paths within the archive to extract.
+            Everything is selected if the list is empty.
+
+    Returns:
+        List[zipfile.ZipInfo]: The selected members.
+    """
+    prefixes = [normalize_member_prefix(prefix) for prefix in member_prefixes] or [""]
+    return [
+        member
+        for member in zip_file.infolist()
+        if not member.is_dir()
+        and member.filename.endswith(".proto")
+        and any(member.filename.startswith(prefix) for prefix in prefixes)
+    ]
+
+
+def get_selection(member_prefixes: List[str]) -> List[str]:
+    """Get the normalized and sorted member prefixes recorded in the manifest.
+
+    Args:
+        member_prefixes (List[str]): Paths within the archive to extract.
+
+    Returns:
+        List[str]: The normalized prefixes in sorted order.
+    """
+    return sorted(normalize_member_prefix(prefix) for prefix in member_prefixes)
+
+
+class ArchiveExtractor:
+    """
+    Extracts the proto files of an archive and records a manifest of the
+    extracted files. Extraction is skipped as long as the archive did not
+    change and the extracted files still match the manifest.
+    """
+
+    def __init__(self, archive_path: str, extract_to: str):
+        self.__archive_path = archive_path
+        self.__extract_to = extract_to
+        archive_key = hashlib.sha256(
+            os.path.abspath(archive_path).encode("utf-8")
+        ).hexdigest()[:16]
+        self.__manifest_path = os.path.join(
+            extract_to,
+            MANIFEST_DIR_NAME,
+            f"{os.path.basename(archive_path)}-{archive_key}.json",
+        )
+
+    def extract(self, member_prefixes: List[str]) -> str:
+        """Extract the proto files below the given paths of the archive, unless
+        they have been extracted already.
+
+        Args:
+            member_prefixes (List[str]): Paths within the archive to extract.
+                Everything is extracted if the list is empty.
+
+        Raises:
+            RuntimeError: If a member would be extracted outside of the target.
+
+        Returns:
+            str: The path the archive is extracted to.
+        """
+        manifest = self.__load_manifest()
+        archive_stamp = self.__get_archive_stamp()
+        archive_hash = self.__get_archive_hash(manifest, archive_stamp)
+        selection = get_selection(member_prefixes)
+        if self.__is_manifest_current(manifest, archive_hash, selection):
+            return self.__extract_to
+
+        self.__remove_extracted(manifest.get("files", {}))
+        files: Dict[str, List[int]] = {}
+        with zipfile.ZipFile(self.__archive_path, "r") as zip_file:
+            for member in select_members(zip_file, selection):
+                target_path = self.__get_target_path(member.filename)
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                with zip_file.open(member) as source, open(target_path, "wb") as target:
+                    shutil.copyfileobj(source, target)
+                files[member.filename] = self.__get_file_stamp(target_path)
+
+        self.__save_manifest(
+            {
+                "version": MANIFEST_FORMAT_VERSION,
+                "archive_stamp": archive_stamp,
+                "archive_hash": archive_hash,
+                "selection": selection,
+                "files": files,
+            }
+        )
+        return self.__extract_to
+
+    def is_extracted(self, member_prefixes: List[str]) -> bool:
+        """Check whether the proto files below the given paths of the archive
+        have been extracted already, without extracting anything.
+
+        Args:
+            member_prefixes (List[str]): Paths within the archive to extract.
+                Everything is extracted if the list is empty.
+
+        Returns:
+            bool: True if `extract` would not need to extract any file.
+        """
+        manifest = self.__load_manifest()
+        archive_hash = self.__get_archive_hash(manifest, self.__get_archive_stamp())
+        return self.__is_manifest_current(
+            manifest, archive_hash, get_selection(member_prefixes)
+        )
+
+    def __get_archive_hash(
+        self, manifest: Dict[str, Any], archive_stamp: List[int]
+    ) -> str:
+        if manifest.get("archive_stamp") == archive_stamp:
+            return str(manifest["archive_hash"])
+        archive_hash: str = hash_file(self.__archive_path)
+        return archive_hash
+
+    def __is_manifest_current(
+        self, manifest: Dict[str, Any], archive_hash: str, selection: List[str]
+    ) -> bool:
+        return (
+            manifest.get("archive_hash") == archive_hash
+            and manifest.get("selection") == selection
+            and self.__is_extracted(manifest["files"])
+        )
+
+    def __get_target_path(self, member_name: str) -> str:
+        extract_to = os.path.abspath(self.__extract_to)
+        target_path = os.path.abspath(os.path.join(extract_to, member_name))
+        if os.path.commonpath([extract_to, target_path]) != extract_to:
+            raise RuntimeError(
+                f"Member {member_name!r} of {self.__archive_path!r} "
+                "would be extracted outside of the target directory!"
+            )
+        return target_path
+
+    def __get_archive_stamp(self) -> List[int]:
+        return self.__get_file_stamp(self.__archive_path)
+
+    def __get_file_stamp(self, file_path: str) -> List[int]:
+        stat = os.stat(file_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def __is_extracted(self, files: Dict[str, List[int]]) -> bool:
+        for member_name, stamp in files.items():
+            target_path = os.path.join(self.__extract_to, member_name)
+            if (
+                not os.path.isfile(target_path)
+                or self.__get_file_stamp(target_path) != stamp
+            ):
+                return False
+        return True
+
+    def __remove_extracted(self, files: Dict[str, List[int]]) -> None:
+        for member_name in files:
+            target_path = os.path.join(self.__extract_to, member_name)
+            if os.path.isfile(target_path):
+                os.remove(target_path)
+
+    def __load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.__manifest_path, encoding="utf-8") as manifest_file:
+                manifest: Dict[str, Any] = json.load(manifest_file)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_FORMAT_VERSION:
+            return {}
+        return manifest
+
+    def __save_manifest(self, manifest: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.__manifest_path), exist_ok=True)
+        with open(self.__manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
@@ -0,0 +1,281 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_file(file_path: str) -> str:
+    """Return the SHA-256 hex digest of the content of a file.
+
+    Args:
+        file_path (str): The path to the file to hash.
+
+    Returns:
+        str: The hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_directory(directory_path: str) -> str:
+    """Return a SHA-256 hex digest covering the relative paths and contents of
+    all files within a directory tree.
+
+    Args:
+        directory_path (str): The path to the directory to hash.
+
+    Returns:
+        str: The hex digest of the directory tree.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(directory_path):
+        dirs.sort()
+        for file in sorted(files):
+            file_path = os.path.join(root, file)
+            digest.update(os.path.relpath(file_path, directory_path).encode("utf-8"))
+            digest.update(hash_file(file_path).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_service_inputs(
+    proto_file_path: str,
+    imported_file_paths: List[str],
+    template_dir: str,
+    generate_client: bool,
+    generate_server: bool,
+    language: str,
+    generation_environment: Dict[str, str],
+    common_type_file_paths: Optional[List[str]] = None,
+    service_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Collect all inputs which influence the generated SDK of a single service.
+
+    Args:
+        proto_file_path (str): The proto file containing the service.
+        imported_file_paths (List[str]): All files transitively imported by the proto file.
+        template_dir (str): The directory of the templates used for generation.
+        generate_client (bool): Whether client code is generated or not.
+        generate_server (bool): Whether server code is generated or not.
+        language (str): The programming language of the generated SDK.
+        generation_environment (Dict[str, str]): Versions of the tooling and
+            SDKs which influence the generated code.
+        common_type_file_paths (Optional[List[str]]): The imported files which
+            are provided by the common types package instead of the service SDK.
+        service_options (Optional[Dict[str, Any]]): The options of the
+            service given in its interface config.
+
+    Returns:
+        Dict[str, Any]: The inputs, with files represented by their hashes.
+    """
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "proto": [proto_file_path, hash_file(proto_file_path)],
+        "imports": [[path, hash_file(path)] for path in sorted(imported_file_paths)],
+        "templates": hash_directory(template_dir),
+        "client": generate_client,
+        "server": generate_server,
+        "language": language,
+        "environment": generation_environment,
+        "common_types": sorted(common_type_file_paths or []),
+        "options": service_options or {},
+    }
+
+
+def get_common_types_inputs(
+    proto_file_paths: Dict[str, str],
+    template_dir: str,
+    language: str,
+    generation_environment: Dict[str, str],
+) -> Dict[str, Any]:
+    """Collect all inputs which influence the generated common types package.
+
+    Args:
+        proto_file_paths (Dict[str, str]): Mapping of the proto files within
+            the package to the include directory they are compiled with.
+        template_dir (str): The directory of the templates used for generation.
+        language (str): The programming language of the generated SDK.
+        generation_environment (Dict[str, str]): Versions of the tooling and
+            SDKs which influence the generated code.
+
+    Returns:
+        Dict[str, Any]: The inputs, with files represented by their hashes.
+    """
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "protos": [
+            [path, include_dir, hash_file(path)]
+            for path, include_dir in sorted(proto_file_paths.items())
+        ],
+        "templates": hash_directory(template_dir),
+        "language": language,
+        "environment": generation_environment,
+    }
+
+
+def compute_fingerprint(inputs: Dict[str, Any]) -> str:
+    """Compute the fingerprint of generation inputs.
+
+    Args:
+        inputs (Dict[str, Any]): The inputs, as collected by `get_service_inputs`
+            or `get_common_types_inputs`.
+
+    Returns:
+        str: The hex digest representing the fingerprint.
+    """
+    return hashlib.sha256(
+        json.dumps(inputs, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def compute_input_digests(inputs: Dict[str, Any]) -> Dict[str, str]:
+    """Compute a digest of each individual generation input, which allows to
+    tell which of the inputs changed if the fingerprint differs.
+
+    Args:
+        inputs (Dict[str, Any]): The inputs, as collected by `get_service_inputs`
+            or `get_common_types_inputs`.
+
+    Returns:
+        Dict[str, str]: Mapping of the input name to its hex digest.
+    """
+    return {
+        name: hashlib.sha256(
+            json.dumps(value, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        for name, value in inputs.items()
+    }
+
+
+class GenerationCache:
+    """Persistent store of the fingerprints of already generated service SDKs."""
+
+    def __init__(self, cache_file_path: str):
+        self.__cache_file_path = cache_file_path
+        self.__fingerprints: Dict[str, str] = {}
+        self.__input_digests: Dict[str, Dict[str, str]] = {}
+
+        try:
+            with open(cache_file_path, encoding="utf-8") as cache_file:
+                cache_data = json.load(cache_file)
+            if cache_data.get("version") == CACHE_FORMAT_VERSION:
+                self.__fingerprints = dict(cache_data.get("services", {}))
+                self.__input_digests = dict(cache_data.get("inputs", {}))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def is_up_to_date(self, service_name: str, fingerprint: str) -> bool:
+        """Check whether the SDK of the service was generated from the same inputs.
+
+        Args:
+            service_name (str): The name of the service.
+            fingerprint (str): The fingerprint of the current generation inputs.
+
+        Returns:
+            bool: True if the recorded fingerprint matches. False otherwise.
+        """
+        return self.__fingerprints.get(service_name) == fingerprint
+
+    def contains(self, service_name: str) -> bool:
+        """Check whether a fingerprint is recorded for the service.
+
+        Args:
+            service_name (str): The name of the service.
+
+        Returns:
+            bool: True if the SDK of the service has been generated before.
+        """
+        return service_name in self.__fingerprints
+
+    def get_service_names(self) -> List[str]:
+        """Return the names of all services with a recorded fingerprint.
+
+        Returns:
+            List[str]: The sorted service names.
+        """
+        return sorted(self.__fingerprints)
+
+    def get_changed_inputs(
+        self, service_name: str, input_digests: Dict[str, str]
+    ) -> Optional[List[str]]:
+        """Return the names of the inputs which differ from the recorded ones.
+
+        Args:
+            service_name (str): The name of the service.
+            input_digests (Dict[str, str]): The digests of the current inputs.
+
+        Returns:
+            Optional[List[str]]: The sorted names of the changed inputs or None
+                if no input digests are recorded for the service.
+        """
+        recorded_digests = self.__input_digests.get(service_name)
+        if recorded_digests is None:
+            return None
+        return sorted(
+            name
+            for name in set(recorded_digests) | set(input_digests)
+            if recorded_digests.get(name) != input_digests.get(name)
+        )
+
+    def update(
+        self,
+        service_name: str,
+        fingerprint: str,
+        input_digests: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Record the fingerprint of a successfully generated service SDK.
+
+        Args:
+            service_name (str): The name of the service.
+            fingerprint (str): The fingerprint of the generation inputs.
+            input_digests (Optional[Dict[str, str]]): The digests of the
+                individual generation inputs.
+        """
+        self.__fingerprints[service_name] = fingerprint
+        if input_digests is not None:
+            self.__input_digests[service_name] = input_digests
+        else:
+            self.__input_digests.pop(service_name, None)
+        self.__save()
+
+    def invalidate(self, service_name: str) -> None:
+        """Remove the recorded fingerprint of a service SDK.
+
+        Args:
+            service_name (str): The name of the service.
+        """
+        self.__input_digests.pop(service_name, None)
+        if self.__fingerprints.pop(service_name, None) is not None:
+            self.__save()
+
+    def __save(self) -> None:
+        os.makedirs(os.path.dirname(self.__cache_file_path), exist_ok=True)
+        with open(self.__cache_file_path, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    "version": CACHE_FORMAT_VERSION,
+                    "services": self.__fingerprints,
+                    "inputs": self.__input_digests,
+                },
+                cache_file,
+                indent=2,
+                sort_keys=True,
+            )
@@ -13,23 +13,35 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import glob
+import hashlib
+import json
 import os
 import re
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from generator import GrpcServiceSdkGenerator, GrpcServiceSdkGeneratorFactory
+from file_sync import write_file_if_changed
+from generator import (
+    COMMON_TYPES_SDK_NAME,
+    GrpcServiceSdkGenerator,
+    GrpcServiceSdkGeneratorFactory,
+)
+from import_graph import normalize_path
 from proto import ProtoFileHandle
-from shell_source import source as source_shell_script
-from velocitas_lib import get_package_path, get_workspace_dir
-from velocitas_lib.conan_utils import (
-    add_dependency_to_conanfile,
-    export_conan_project,
-    get_required_sdk_version,
+from protoc import (
+    copy_protoc_outputs,
+    get_output_stem,
+    get_plugin_args,
+    get_plugin_output_path,
+    write_plugin_launcher,
 )
+from shell_source import source as source_shell_script
+from tracing import TRACER
+from velocitas_lib import get_package_path, get_project_cache_dir, get_workspace_dir
+from velocitas_lib.conan_utils import get_required_sdk_version
 from velocitas_lib.file_utils import (
     capture_area_in_file,
     read_file,
@@ -41,6 +53,10 @@ from velocitas_lib.text_utils import (
 )
 
 CONAN_PROFILE_NAME = "host"
+TOOLING_ENVIRONMENT_FILE_NAME = "tooling-environment.json"
+PROTOC_VERSION_FILE_NAME = "protoc-version.txt"
+# The version of all generated Conan packages, see the conanfile templates
+GENERATED_PACKAGE_VERSION = "generated"
 
 
 def get_template_dir() -> str:
@@ -49,51 +65,376 @@ def get_template_dir() -> str:
     )
 
 
-class GrpcCodeExtractor:
+def get_binary_path(binary_name: str) -> str:
+    path = shutil.which(binary_name)
+    if path is None:
+        raise KeyError(f"{binary_name!r} missing!")
+    return path
+
+
+def get_plugin_args_cpp(
+    output_path: str,
+    proto_include_path: str,
+    service_options: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[str]:
+    launcher_path = write_plugin_launcher(
+        os.path.join(get_project_cache_dir(), "tooling")
+    )
+    plugin_args: List[str] = get_plugin_args(
+        launcher_path,
+        "cpp",
+        get_template_dir(),
+        output_path,
+        proto_include_path,
+        service_options,
+    )
+    return plugin_args
+
+
+def get_conan_profile_path() -> str:
+    """Return the path of the Conan profile used to install the tooling.
+
+    Returns:
+        str: The absolute path of the profile file.
     """
-    Provides methods for extracting code from generated gRPC c++ files.
+    conan_home = os.environ.get(
+        "CONAN_HOME", os.path.join(os.path.expanduser("~"), ".conan2")
+    )
+    return os.path.join(conan_home, "profiles", CONAN_PROFILE_NAME)
+
+
+def get_tooling_requirements(template_conanfile_path: str) -> List[str]:
+    """Extract the requirements of the tooling from the conanfile template of
+    the service SDKs, so protoc and the gRPC plugin match the SDK libraries.
+
+    Args:
+        template_conanfile_path (str): The path of the conanfile template.
+
+    Returns:
+        List[str]: The requirements, e.g. ["grpc/1.50.1"].
+    """
+    deps_to_extract = [
+        "grpc",
+        # "protobuf", - Removed: Let grpc recipe determine protobuf version
+    ]
+    deps_patterns = [
+        re.compile(r"^.*\"(" + dep + r"\/.*)\".*$") for dep in deps_to_extract
+    ]
+    deps_results = []
+    with open(template_conanfile_path, encoding="utf-8") as conanfile:
+        for line in conanfile:
+            for pattern in deps_patterns:
+                match = pattern.match(line)
+                if match is not None:
+                    deps_results.append(match.group(1))
+                    deps_patterns.remove(pattern)
+    return deps_results
+
+
+def get_tooling_key(requirements: List[str], profile_path: str) -> str:
+    """Compute the key of a tooling installation.
+
+    Args:
+        requirements (List[str]): The requirements of the tooling.
+        profile_path (str): The path of the Conan profile the tooling is
+            installed with.
+
+    Returns:
+        str: A key which changes whenever the requirements or the profile change.
     """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(requirements).encode("utf-8"))
+    with open(profile_path, "rb") as profile:
+        digest.update(profile.read())
+    return digest.hexdigest()[:16]
+
+
+def get_environment_changes(
+    old_environment: Dict[str, str], new_environment: Dict[str, str]
+) -> Dict[str, Dict[str, str]]:
+    """Determine the changes of an environment. Values which got a prefix
+    prepended, like PATH, are recorded as prefix only, so they can be applied
+    on top of a different original value.
+
+    Args:
+        old_environment (Dict[str, str]): The environment before the change.
+        new_environment (Dict[str, str]): The environment after the change.
+
+    Returns:
+        Dict[str, Dict[str, str]]: The values to "set" and to "prepend".
+    """
+    changes: Dict[str, Dict[str, str]] = {"set": {}, "prepend": {}}
+    for key, value in new_environment.items():
+        old_value = old_environment.get(key)
+        if value == old_value:
+            continue
+        if old_value and value.endswith(os.pathsep + old_value):
+            changes["prepend"][key] = value[: -len(old_value)]
+        else:
+            changes["set"][key] = value
+    return changes
 
-    def __init__(self, proto_file: ProtoFileHandle, base_path: str):
-        self.__proto_file = proto_file
-        self.__base_path = base_path
 
-    def get_header_stub_code(self, include_path: str = ".") -> List[str]:
-        grpc_header_path = os.path.join(
-            self.__base_path,
-            include_path,
-            f"{Path(self.__proto_file.file_path).stem}.grpc.pb.h",
-        )
+def apply_environment_changes(changes: Dict[str, Dict[str, str]]) -> None:
+    """Apply changes determined by `get_environment_changes` to the
+    environment of the current process.
+
+    Args:
+        changes (Dict[str, Dict[str, str]]): The changes to apply.
+    """
+    for key, value in changes["set"].items():
+        os.environ[key] = value
+    for key, prefix in changes["prepend"].items():
+        os.environ[key] = prefix + os.environ.get(key, "")
+
+
+def find_tooling_binary(
+    binary_name: str, changes: Dict[str, Dict[str, str]]
+) -> Optional[str]:
+    """Find a binary within the directories prepended to PATH by the
+    environment changes of the tooling installation. Binaries elsewhere on
+    PATH are ignored, as they do not belong to the installed tooling.
+
+    Args:
+        binary_name (str): The name of the binary, e.g. "protoc".
+        changes (Dict[str, Dict[str, str]]): The changes determined by
+            `get_environment_changes`.
+
+    Returns:
+        Optional[str]: The path to the binary or None if it is not found.
+    """
+    bin_dirs = [
+        directory
+        for directory in changes["prepend"].get("PATH", "").split(os.pathsep)
+        if directory
+    ]
+    if len(bin_dirs) == 0:
+        return None
+    return shutil.which(binary_name, path=os.pathsep.join(bin_dirs))
+
+
+def export_conan_project(conan_project_path: str) -> None:
+    """Export a Conan project to the local Conan cache, like
+    `velocitas_lib.conan_utils.export_conan_project` does, but with the
+    Conan invocation recorded by the tracer.
+
+    Args:
+        conan_project_path (str): The path to the directory containing the project.
+    """
+    env = os.environ.copy()
+    env["CONAN_REVISIONS_ENABLED"] = "1"
+    print("Exporting Conan project")
+    TRACER.check_call(
+        ["conan", "export", "."],
+        cwd=conan_project_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+
 
-        header_content: List[str] = capture_area_in_file(
-            open(grpc_header_path, encoding="utf-8"),
-            "virtual ~Service();",
-            "};",
+def add_dependency_to_conanfile_lines(
+    lines: List[str], dependency_name: str, dependency_version: str
+) -> None:
+    """Add a dependency to the requires section of the lines of a
+    conanfile.txt, like `velocitas_lib.conan_utils.add_dependency_to_conanfile`
+    does for the file itself. An existing entry of the dependency is replaced.
+
+    Args:
+        lines (List[str]): The lines of the conanfile.txt, modified in place.
+        dependency_name (str): The dependency to add, e.g. "grpc".
+        dependency_version (str): The version of the dependency, e.g. "1.50.1".
+    """
+    insert_index: Optional[int] = None
+    replace = False
+    in_requires_section = False
+    for index, line in enumerate(lines):
+        stripped_line = line.strip()
+        if stripped_line == "[requires]":
+            in_requires_section = True
+            insert_index = index + 1
+        elif in_requires_section and stripped_line.startswith("["):
+            in_requires_section = False
+        elif in_requires_section and stripped_line.startswith(dependency_name):
+            insert_index = index
+            replace = True
+
+    dependency_line = f"{dependency_name}/{dependency_version}\n"
+    if replace and insert_index is not None:
+        lines[insert_index] = dependency_line
+    elif insert_index is not None:
+        lines.insert(insert_index, dependency_line)
+    else:
+        lines.extend(["[requires]\n", dependency_line])
+
+
+def remove_dependency_from_conanfile_lines(
+    lines: List[str], dependency_name: str
+) -> None:
+    """Remove a dependency from the requires section of the lines of a
+    conanfile.txt.
+
+    Args:
+        lines (List[str]): The lines of the conanfile.txt, modified in place.
+        dependency_name (str): The dependency to remove, e.g. "grpc".
+    """
+    in_requires_section = False
+    kept_lines: List[str] = []
+    for line in lines:
+        stripped_line = line.strip()
+        if stripped_line.startswith("["):
+            in_requires_section = stripped_line == "[requires]"
+        elif in_requires_section and stripped_line.split("/")[0] == dependency_name:
+            continue
+        kept_lines.append(line)
+    lines[:] = kept_lines
+
+
+def remove_generated_package(package_name: str) -> None:
+    """Remove a generated package from the local Conan cache.
+
+    Args:
+        package_name (str): The name of the package.
+    """
+    try:
+        TRACER.check_call(
+            ["conan", "remove", f"{package_name}/{GENERATED_PACKAGE_VERSION}", "-c"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        return header_content
+    except subprocess.CalledProcessError:
+        # The package is not part of the local Conan cache anymore
+        pass
 
-    def get_source_stub_code(self, source_path: str = ".") -> List[str]:
-        grpc_source_path = os.path.join(
-            self.__base_path,
-            source_path,
-            f"{Path(self.__proto_file.file_path).stem}.grpc.pb.cc",
+
+def list_generated_packages() -> Set[str]:
+    """List the generated packages within the local Conan cache.
+
+    Returns:
+        Set[str]: The names of the packages.
+    """
+    try:
+        output = TRACER.check_output(
+            ["conan", "list", f"*/{GENERATED_PACKAGE_VERSION}", "--format=json"],
+            encoding="utf-8",
+            stderr=subprocess.DEVNULL,
         )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return set()
+    references = json.loads(output).get("Local Cache", {})
+    return {reference.split("/")[0] for reference in references if "/" in reference}
+
+
+class GeneratedPackageIndex:
+    """
+    Knows which generated packages are exported to the local Conan cache.
+    The cache is listed once on the first query, so checking the packages of
+    all services takes a single Conan invocation. Packages exported
+    afterwards are added via `add_package`.
+    """
+
+    def __init__(self) -> None:
+        self.__package_names: Optional[Set[str]] = None
+
+    def contains(self, package_name: str) -> bool:
+        if self.__package_names is None:
+            self.__package_names = list_generated_packages()
+        return package_name in self.__package_names
 
-        service_name = self.__proto_file.get_service_name()
+    def add_package(self, package_name: str) -> None:
+        if self.__package_names is not None:
+            self.__package_names.add(package_name)
+
+    def remove_package(self, package_name: str) -> None:
+        if self.__package_names is not None:
+            self.__package_names.discard(package_name)
+
+
+class WorkspaceReferenceUpdater:
+    """
+    Collects the references of the workspace to the generated service SDKs,
+    i.e. the requirements in `conanfile.txt` and the CMake targets in
+    `app/service-libs.cmake`, and applies them by writing each file at most
+    once. Files whose content does not change are not touched.
+    """
+
+    SERVICE_CMAKE_HEADER = (
+        "# This file is auto-generated by Velocitas tooling. Do not edit manually!\n"
+    )
+
+    def __init__(self) -> None:
+        self.__sdk_names: List[str] = []
+        self.__removed_sdk_names: List[str] = []
+        self.__reset_service_cmake = False
+
+    def add_service_sdk(self, sdk_name: str, is_first_service: bool) -> None:
+        """Add a reference to the SDK of a service.
+
+        Args:
+            sdk_name (str): The name of the Conan package and CMake target.
+            is_first_service (bool): Whether this is the first service of the
+                workspace. Its reference replaces all existing CMake targets.
+        """
+        if is_first_service:
+            self.__sdk_names = []
+            self.__reset_service_cmake = True
+        self.__sdk_names.append(sdk_name)
 
-        package_pieces = self.__proto_file.get_package().split(".")
+    def remove_service_sdk(self, sdk_name: str) -> None:
+        """Remove the reference to the SDK of a service which is no longer
+        generated.
 
-        source_content: List[str] = capture_area_in_file(
-            open(grpc_source_path, encoding="utf-8"),
-            f"{service_name}::Service::~Service() {{",
-            f"}}  // namespace {package_pieces[0]}",
+        Args:
+            sdk_name (str): The name of the Conan package and CMake target.
+        """
+        self.__removed_sdk_names.append(sdk_name)
+
+    @staticmethod
+    def get_service_cmake_block(sdk_name: str) -> str:
+        return (
+            f"\nfind_package({sdk_name} REQUIRED CONFIG)\n"
+            "set(SERVICE_LIBS ${SERVICE_LIBS}\n"
+            f"    {sdk_name}::{sdk_name}\n"
+            ")\n"
         )
 
-        # skip initial 2 lines b/c they are always empty
-        return source_content[2 : len(source_content) - 2]
+    def update_references(self) -> None:
+        """Write all collected references to the workspace files."""
+        if len(self.__sdk_names) == 0 and len(self.__removed_sdk_names) == 0:
+            return
+
+        conanfile_path = os.path.join(get_workspace_dir(), "conanfile.txt")
+        with open(conanfile_path, encoding="utf-8") as conanfile:
+            lines = conanfile.readlines()
+        for sdk_name in self.__removed_sdk_names:
+            remove_dependency_from_conanfile_lines(lines, sdk_name)
+        for sdk_name in self.__sdk_names:
+            add_dependency_to_conanfile_lines(
+                lines, sdk_name, GENERATED_PACKAGE_VERSION
+            )
+        write_file_if_changed(conanfile_path, "".join(lines))
+
+        cmake_path = os.path.join(get_workspace_dir(), "app", "service-libs.cmake")
+        cmake_content = self.SERVICE_CMAKE_HEADER
+        if not self.__reset_service_cmake:
+            cmake_content = read_file(cmake_path) or ""
+        for sdk_name in self.__removed_sdk_names:
+            cmake_content = cmake_content.replace(
+                self.get_service_cmake_block(sdk_name), ""
+            )
+        for sdk_name in self.__sdk_names:
+            cmake_content += self.get_service_cmake_block(sdk_name)
+        write_file_if_changed(cmake_path, cmake_content)
+
+        self.__sdk_names = []
+        self.__removed_sdk_names = []
+        self.__reset_service_cmake = False
 
 
 class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
+    SERVICE_OUTPUT_SUFFIXES = [".pb.h", ".pb.cc", ".grpc.pb.h", ".grpc.pb.cc"]
+    IMPORT_OUTPUT_SUFFIXES = [".pb.h", ".pb.cc"]
+
     def __init__(
         self,
         package_directory_path: str,
@@ -101,6 +442,12 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
         verbose: bool,
         proto_include_path: str,
         is_first_service: bool,
+        protoc_output_path: Optional[str] = None,
+        common_type_files: Optional[List[str]] = None,
+        service_options: Optional[Dict[str, Any]] = None,
+        imported_files: Optional[List[str]] = None,
+        reference_updater: Optional[WorkspaceReferenceUpdater] = None,
+        package_index: Optional[GeneratedPackageIndex] = None,
     ):
         self.__package_directory_path = package_directory_path
         self.__proto_file_handle = proto_file_handle
@@ -120,41 +467,79 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
             ),
         )
         self.__is_first_service = is_first_service
-
-    def __get_binary_path(self, binary_name: str) -> str:
-        path = shutil.which(binary_name)
-        if path is None:
-            raise KeyError(f"{binary_name!r} missing!")
-        return path
+        self.__protoc_output_path = protoc_output_path
+        self.__plugin_output_path = get_plugin_output_path(
+            protoc_output_path or package_directory_path,
+            self.__proto_file_handle.file_path,
+            self.__proto_include_path,
+        )
+        self.__common_type_files = {
+            normalize_path(path) for path in common_type_files or []
+        }
+        self.__service_options = service_options or {}
+        self.__imported_files = imported_files or []
+        self.__reference_updater = reference_updater
+        self.__package_index = package_index or GeneratedPackageIndex()
+        self.__sdk_name = f"{self.__service_name_lower}-service-sdk"
+
+    def __is_common_type_file(self, path: str) -> bool:
+        return normalize_path(path) in self.__common_type_files
+
+    def __copy_batch_generated_code(self, protoc_output_path: str) -> None:
+        copy_protoc_outputs(
+            protoc_output_path,
+            self.__package_directory_path,
+            self.__proto_file_handle.file_path,
+            self.__proto_include_path,
+            self.SERVICE_OUTPUT_SUFFIXES,
+        )
+        for path in self.__imported_files:
+            if self.__is_common_type_file(path):
+                continue
+            copy_protoc_outputs(
+                protoc_output_path,
+                self.__package_directory_path,
+                path,
+                self.__proto_include_path,
+                self.IMPORT_OUTPUT_SUFFIXES,
+            )
 
     def __invoke_code_generator(self) -> None:
+        if self.__protoc_output_path is not None:
+            self.__copy_batch_generated_code(self.__protoc_output_path)
+            return
+
         print("Invoking gRPC code generator")
         args = [
-            self.__get_binary_path("protoc"),
-            f"--plugin=protoc-gen-grpc={self.__get_binary_path('grpc_cpp_plugin')}",
+            get_binary_path("protoc"),
+            f"--plugin=protoc-gen-grpc={get_binary_path('grpc_cpp_plugin')}",
             f"-I{self.__proto_include_path}",
             f"--cpp_out={self.__package_directory_path}",
             f"--grpc_out={self.__package_directory_path}",
+            *get_plugin_args_cpp(
+                self.__package_directory_path,
+                self.__proto_include_path,
+                {self.__proto_file_handle.file_path: self.__service_options},
+            ),
             self.__proto_file_handle.file_path,
         ]
-        subprocess.check_call(
+        TRACER.check_call(
             args,
             cwd=self.__proto_include_path,
             env=os.environ,
             stdout=subprocess.DEVNULL if not self.__verbose else None,
         )
 
-        imports = self.__proto_file_handle.get_imports()
-
-        for element in imports:
-            path = os.path.join(self.__proto_include_path, element)
+        for path in self.__imported_files:
+            if self.__is_common_type_file(path):
+                continue
             args = [
-                self.__get_binary_path("protoc"),
+                get_binary_path("protoc"),
                 f"-I{self.__proto_include_path}",
                 f"--cpp_out={self.__package_directory_path}",
                 path,
             ]
-            subprocess.check_call(
+            TRACER.check_call(
                 args,
                 cwd=self.__proto_include_path,
                 env=os.environ,
@@ -164,22 +549,26 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
     def generate_package(self, client_required: bool, server_required: bool) -> None:
         self.__invoke_code_generator()
 
-        files_to_copy: List[CopySpec] = []
-
+        file_names: List[str] = []
         if client_required:
-            files_to_copy.extend(self.__get_service_client_files(self.__service_name))
-
+            file_names.extend(self.__get_service_client_files(self.__service_name))
         if server_required:
-            files_to_copy.extend(self.__get_service_server_files(self.__service_name))
+            file_names.extend(self.__get_service_server_files(self.__service_name))
+
+        for file_name in file_names:
+            target_dir = os.path.join(
+                self.__package_directory_path,
+                self.__get_include_dir()
+                if file_name.endswith(".h")
+                else self.__get_source_dir(),
+            )
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.copy2(os.path.join(self.__plugin_output_path, file_name), target_dir)
 
-        copy_templates(
-            get_template_dir(),
-            self.__package_directory_path,
-            files_to_copy,
-            self.__get_template_variables(),
-        )
+        self.__create_package_files()
 
     def __get_template_variables(self) -> Dict[str, str]:
+        has_common_types = len(self.__common_type_files) > 0
         return {
             "service_name": self.__service_name,
             "service_name_lower": self.__service_name_lower,
@@ -192,6 +581,22 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
                 self.__get_relative_file_dir(),
                 f"{Path(self.__proto_file_handle.file_path).stem}.grpc.pb.h",
             ),
+            "common_types_requirement": (
+                f'\n        self.requires("{COMMON_TYPES_SDK_NAME}/generated", '
+                "transitive_headers=True)"
+                if has_common_types
+                else ""
+            ),
+            "common_types_package": (
+                f"\nfind_package({COMMON_TYPES_SDK_NAME} REQUIRED CONFIG)"
+                if has_common_types
+                else ""
+            ),
+            "common_types_target": (
+                f"\n    {COMMON_TYPES_SDK_NAME}::{COMMON_TYPES_SDK_NAME}"
+                if has_common_types
+                else ""
+            ),
         }
 
     def __get_relative_file_dir(self) -> str:
@@ -209,28 +614,16 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
     def __get_source_dir(self) -> str:
         return f"src/{self.__get_relative_file_dir()}"
 
-    def __get_service_client_files(self, service_name: str) -> List[CopySpec]:
+    def __get_service_client_files(self, service_name: str) -> List[str]:
         return [
-            CopySpec(
-                "ServiceNameServiceClientFactory.h",
-                f"{self.__get_include_dir()}/{to_camel_case(service_name)}ServiceClientFactory.h",
-            ),
-            CopySpec(
-                "ServiceNameServiceClientFactory.cc",
-                f"{self.__get_source_dir()}/{to_camel_case(service_name)}ServiceClientFactory.cc",
-            ),
+            f"{to_camel_case(service_name)}ServiceClientFactory.h",
+            f"{to_camel_case(service_name)}ServiceClientFactory.cc",
         ]
 
-    def __get_service_server_files(self, service_name: str) -> List[CopySpec]:
+    def __get_service_server_files(self, service_name: str) -> List[str]:
         return [
-            CopySpec(
-                "ServiceNameServiceServerFactory.h",
-                f"{self.__get_include_dir()}/{to_camel_case(service_name)}ServiceServerFactory.h",
-            ),
-            CopySpec(
-                "ServiceNameServiceServerFactory.cc",
-                f"{self.__get_source_dir()}/{to_camel_case(service_name)}ServiceServerFactory.cc",
-            ),
+            f"{to_camel_case(service_name)}ServiceServerFactory.h",
+            f"{to_camel_case(service_name)}ServiceServerFactory.cc",
         ]
 
     def __move_generated_sources(
@@ -251,8 +644,8 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
                 [1] = a list of the paths to all sources
         """
 
-        headers = glob.glob(os.path.join(self.__output_path, "*.h"))
-        sources = glob.glob(os.path.join(self.__output_path, "*.cc"))
+        headers = sorted(glob.glob(os.path.join(self.__output_path, "*.h")))
+        sources = sorted(glob.glob(os.path.join(self.__output_path, "*.cc")))
 
         headers_relative = []
         for header in headers:
@@ -272,7 +665,7 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
 
         return headers_relative, sources_relative
 
-    def install_package(self) -> None:
+    def __create_package_files(self) -> None:
         proto_headers, proto_sources = self.__move_generated_sources(
             self.__package_directory_path,
             self.__get_include_dir(),
@@ -288,15 +681,21 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
 
         cmake_headers = [
             os.path.join(self.__get_include_dir(), file)
-            for file in os.listdir(
-                os.path.join(self.__package_directory_path, self.__get_include_dir())
+            for file in sorted(
+                os.listdir(
+                    os.path.join(
+                        self.__package_directory_path, self.__get_include_dir()
+                    )
+                )
             )
         ]
 
         cmake_sources = [
             os.path.join(self.__get_source_dir(), file)
-            for file in os.listdir(
-                os.path.join(self.__package_directory_path, self.__get_source_dir())
+            for file in sorted(
+                os.listdir(
+                    os.path.join(self.__package_directory_path, self.__get_source_dir())
+                )
             )
         ]
 
@@ -305,38 +704,17 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
         variables["proto_headers"] = "\n\t".join(proto_headers)
         variables["proto_sources"] = "\n\t".join(proto_sources)
 
-        copy_templates(
-            get_template_dir(),
-            self.__package_directory_path,
-            files_to_copy,
-            variables,
-        )
-
-        export_conan_project(self.__package_directory_path)
-
-    def __transform_header_stub_code(self, lines: List[str]) -> List[str]:
-        service_class_name = to_camel_case(self.__service_name) + "Service"
-
-        result: List[str] = []
-
-        for line in lines:
-            line = line.rstrip().replace("Service", service_class_name)
-            if line.lstrip().startswith("virtual"):
-                result.append(line.replace("virtual ", "").replace(";", " override;"))
-
-        return result
-
-    def __transform_source_stub_code(self, lines: List[str]) -> List[str]:
-        service_class_name = to_camel_case(self.__service_name) + "Service"
-
-        result: List[str] = []
-
-        for line in lines:
-            result.append(
-                line.replace(f"{self.__service_name}::Service", service_class_name)
+        with TRACER.stage("copy_templates"):
+            copy_templates(
+                get_template_dir(),
+                self.__package_directory_path,
+                files_to_copy,
+                variables,
             )
 
-        return result
+    def install_package(self) -> None:
+        export_conan_project(self.__package_directory_path)
+        self.__package_index.add_package(self.__sdk_name)
 
     def __create_or_update_service_header(self) -> None:
         app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
@@ -344,44 +722,20 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
         service_header_file_path = os.path.join(
             app_source_dir, service_header_file_name
         )
-
-        if os.path.exists(service_header_file_path):
-            self.__update_service_header()
-        else:
-            self.__create_service_header()
-
-    def __create_service_header(self) -> None:
-        header_stub_code = GrpcCodeExtractor(
-            self.__proto_file_handle, self.__package_directory_path
-        ).get_header_stub_code(self.__get_include_dir())
-
-        header_stub_code = self.__transform_header_stub_code(header_stub_code)
-
-        app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
-        service_header_file_name = f"{to_camel_case(self.__service_name)}ServiceImpl.h"
-        variables = self.__get_template_variables()
-        variables["service_header_code"] = "\n".join(header_stub_code)
-
-        copy_templates(
-            get_template_dir(),
-            app_source_dir,
-            [CopySpec("ServiceImpl.h", service_header_file_name)],
-            variables,
+        generated_header_file_path = os.path.join(
+            self.__plugin_output_path, service_header_file_name
         )
 
-    def __update_service_header(self) -> None:
-        header_generated_code = GrpcCodeExtractor(
-            self.__proto_file_handle, self.__package_directory_path
-        ).get_header_stub_code(self.__get_include_dir())
-
-        header_generated_code = self.__transform_header_stub_code(header_generated_code)
+        if not os.path.exists(service_header_file_path):
+            os.makedirs(app_source_dir, exist_ok=True)
+            shutil.copy2(generated_header_file_path, service_header_file_path)
+            return
 
-        app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
-        service_header_file_name = f"{to_camel_case(self.__service_name)}ServiceImpl.h"
-        service_header_file_path = os.path.join(
-            app_source_dir, service_header_file_name
+        header_generated_code = capture_area_in_file(
+            open(generated_header_file_path, encoding="utf-8"),
+            "// <auto-generated>",
+            "// </auto-generated>",
         )
-
         auto_generated_code = capture_area_in_file(
             open(service_header_file_path, encoding="utf-8"),
             "// <auto-generated>",
@@ -406,52 +760,148 @@ class CppGrpcServiceSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
         if os.path.exists(service_source_file_path):
             return
 
-        source_code = GrpcCodeExtractor(
-            self.__proto_file_handle, self.__package_directory_path
-        ).get_source_stub_code(self.__get_source_dir())
+        shutil.copy2(
+            os.path.join(self.__plugin_output_path, service_source_file_name),
+            service_source_file_path,
+        )
+
+    def update_package_references(self) -> None:
+        """Update all references to the generated package. If the generator
+        has a reference updater, the update is deferred until the updater
+        applies the references of all services."""
+
+        if self.__reference_updater is not None:
+            self.__reference_updater.add_service_sdk(
+                self.__sdk_name, self.__is_first_service
+            )
+            return
+
+        reference_updater = WorkspaceReferenceUpdater()
+        reference_updater.add_service_sdk(self.__sdk_name, self.__is_first_service)
+        reference_updater.update_references()
 
-        source_code = self.__transform_source_stub_code(source_code)
+    def update_auto_generated_code(self) -> None:
+        self.__create_or_update_service_header()
+        self.__create_service_source()
 
-        variables = self.__get_template_variables()
-        variables["service_source_code"] = "\n".join(source_code)
+    def is_package_installed(self) -> bool:
+        return self.__package_index.contains(self.__sdk_name)
 
-        copy_templates(
-            get_template_dir(),
-            app_source_dir,
-            [CopySpec("ServiceImpl.cpp", service_source_file_path)],
-            variables,
+    def is_auto_generated_code_present(self) -> bool:
+        app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
+        service_name_camel_case = to_camel_case(self.__service_name)
+        return all(
+            os.path.isfile(os.path.join(app_source_dir, file_name))
+            for file_name in [
+                f"{service_name_camel_case}ServiceImpl.h",
+                f"{service_name_camel_case}ServiceImpl.cpp",
+            ]
         )
 
-    def __update_service_cmake(self, sdk_name: str) -> None:
-        cmake_filename = os.path.join(get_workspace_dir(), "app", "service-libs.cmake")
-        mode = "w" if self.__is_first_service else "a"
-        with open(cmake_filename, mode, encoding="utf-8") as f:
-            if self.__is_first_service:
-                f.write(
-                    "# This file is auto-generated by Velocitas tooling. Do not edit manually!\n"
+
+class CppCommonTypesSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
+    """Generates the code of proto files which are imported by several
+    services into a single Conan package with its own CMake target, so the
+    messages are compiled and linked only once."""
+
+    def __init__(
+        self,
+        package_directory_path: str,
+        proto_files: Dict[str, str],
+        verbose: bool,
+        package_index: Optional[GeneratedPackageIndex] = None,
+    ):
+        self.__package_directory_path = package_directory_path
+        self.__proto_files = proto_files
+        self.__verbose = verbose
+        self.__package_index = package_index or GeneratedPackageIndex()
+
+    def __invoke_code_generator(self, output_path: str) -> None:
+        batches: Dict[str, List[str]] = {}
+        for proto_file, proto_include_path in self.__proto_files.items():
+            batches.setdefault(proto_include_path, []).append(proto_file)
+
+        for proto_include_path, proto_files in batches.items():
+            TRACER.check_call(
+                [
+                    get_binary_path("protoc"),
+                    f"-I{proto_include_path}",
+                    f"--cpp_out={output_path}",
+                    *proto_files,
+                ],
+                cwd=proto_include_path,
+                env=os.environ,
+                stdout=subprocess.DEVNULL if not self.__verbose else None,
+            )
+
+    def generate_package(self, client_required: bool, server_required: bool) -> None:
+        with tempfile.TemporaryDirectory() as protoc_output_path:
+            self.__invoke_code_generator(protoc_output_path)
+            for proto_file, proto_include_path in self.__proto_files.items():
+                copy_protoc_outputs(
+                    protoc_output_path,
+                    os.path.join(self.__package_directory_path, "include"),
+                    proto_file,
+                    proto_include_path,
+                    [".pb.h"],
+                )
+                copy_protoc_outputs(
+                    protoc_output_path,
+                    os.path.join(self.__package_directory_path, "src"),
+                    proto_file,
+                    proto_include_path,
+                    [".pb.cc"],
                 )
-            f.write("\n")
-            f.write(f"find_package({sdk_name} REQUIRED CONFIG)\n")
-            f.write("set(SERVICE_LIBS ${SERVICE_LIBS}\n")
-            f.write(f"    {sdk_name}::{sdk_name}\n")
-            f.write(")\n")
 
-    def update_package_references(self) -> None:
-        """Update all references to the generated package."""
+        cmake_sources = sorted(
+            os.path.join(
+                "src", f"{get_output_stem(proto_file, proto_include_path)}.pb.cc"
+            )
+            for proto_file, proto_include_path in self.__proto_files.items()
+        )
+        with TRACER.stage("copy_templates"):
+            copy_templates(
+                get_template_dir(),
+                self.__package_directory_path,
+                [
+                    CopySpec(
+                        os.path.join("common_types", "CMakeLists.txt"), "CMakeLists.txt"
+                    ),
+                    CopySpec(
+                        os.path.join("common_types", "conanfile.py"), "conanfile.py"
+                    ),
+                ],
+                {
+                    "common_types_sdk_name": COMMON_TYPES_SDK_NAME,
+                    "cmake_sources": "\n\t".join(cmake_sources),
+                },
+            )
 
-        sdk_name = f"{self.__service_name_lower}-service-sdk"
+    def install_package(self) -> None:
+        export_conan_project(self.__package_directory_path)
+        self.__package_index.add_package(COMMON_TYPES_SDK_NAME)
 
-        add_dependency_to_conanfile(sdk_name, "generated")
-        self.__update_service_cmake(sdk_name)
+    def update_package_references(self) -> None:
+        """The package is required by the service SDKs, hence the workspace
+        does not need to reference it."""
+        pass
 
     def update_auto_generated_code(self) -> None:
-        self.__create_or_update_service_header()
-        self.__create_service_source()
+        pass
+
+    def is_package_installed(self) -> bool:
+        return self.__package_index.contains(COMMON_TYPES_SDK_NAME)
+
+    def is_auto_generated_code_present(self) -> bool:
+        return True
 
 
 class CppGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # type: ignore
     def __init__(self, verbose: bool):
         self._verbose = verbose
+        self._generation_environment: Optional[Dict[str, str]] = None
+        self._reference_updater = WorkspaceReferenceUpdater()
+        self._package_index = GeneratedPackageIndex()
 
     def create_service_generator(
         self,
@@ -459,6 +909,10 @@ class CppGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # type
         proto_file_handle: ProtoFileHandle,
         proto_include_path: str,
         is_first_service: bool,
+        protoc_output_path: Optional[str] = None,
+        common_type_files: Optional[List[str]] = None,
+        service_options: Optional[Dict[str, Any]] = None,
+        imported_files: Optional[List[str]] = None,
     ) -> GrpcServiceSdkGenerator:
         return CppGrpcServiceSdkGenerator(
             output_path,
@@ -466,31 +920,63 @@ class CppGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # type
             self._verbose,
             proto_include_path,
             is_first_service,
+            protoc_output_path,
+            common_type_files,
+            service_options,
+            imported_files,
+            self._reference_updater,
+            self._package_index,
+        )
+
+    def remove_service_package(self, service_name: str) -> None:
+        sdk_name = f"{service_name.lower()}-service-sdk"
+        remove_generated_package(sdk_name)
+        self._package_index.remove_package(sdk_name)
+        self._reference_updater.remove_service_sdk(sdk_name)
+
+    def remove_common_types_package(self) -> None:
+        remove_generated_package(COMMON_TYPES_SDK_NAME)
+        self._package_index.remove_package(COMMON_TYPES_SDK_NAME)
+
+    def create_common_types_generator(
+        self, output_path: str, proto_files: Dict[str, str]
+    ) -> GrpcServiceSdkGenerator:
+        return CppCommonTypesSdkGenerator(
+            output_path, proto_files, self._verbose, self._package_index
+        )
+
+    def generate_code_batch(
+        self,
+        proto_files: List[str],
+        proto_include_path: str,
+        output_path: str,
+        service_options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        print("Invoking gRPC code generator")
+        TRACER.check_call(
+            [
+                get_binary_path("protoc"),
+                f"--plugin=protoc-gen-grpc={get_binary_path('grpc_cpp_plugin')}",
+                f"-I{proto_include_path}",
+                f"--cpp_out={output_path}",
+                f"--grpc_out={output_path}",
+                *get_plugin_args_cpp(output_path, proto_include_path, service_options),
+                *proto_files,
+            ],
+            cwd=proto_include_path,
+            env=os.environ,
+            stdout=subprocess.DEVNULL if not self._verbose else None,
         )
 
     def __create_conan_profile(self) -> None:
-        subprocess.check_call(
+        TRACER.check_call(
             ["conan", "profile", "detect", "--name", CONAN_PROFILE_NAME, "--force"],
         )
 
     def __install_protoc_via_conan(self, conan_build_dir: str) -> None:
-        deps_to_extract = [
-            "grpc",
-            # "protobuf", - Removed: Let grpc recipe determine protobuf version
-        ]
-        deps_patterns = [
-            re.compile(r"^.*\"(" + dep + r"\/.*)\".*$") for dep in deps_to_extract
-        ]
-        deps_results = []
-        with open(
-            os.path.join(get_template_dir(), "conanfile.py"), encoding="utf-8"
-        ) as conanfile:
-            for line in conanfile:
-                for pattern in deps_patterns:
-                    match = pattern.match(line)
-                    if match is not None:
-                        deps_results.append(match.group(1))
-                        deps_patterns.remove(pattern)
+        deps_results = get_tooling_requirements(
+            os.path.join(get_template_dir(), "conanfile.py")
+        )
 
         tooling_conanfile_path = os.path.join(conan_build_dir, "conanfile.txt")
         with open(
@@ -502,7 +988,7 @@ class CppGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # type
             )
             tooling_conanfile.write("[generators]\nCMakeDeps\nCMakeToolchain\n")
 
-        subprocess.check_call(
+        TRACER.check_call(
             [
                 "conan",
                 "install",
@@ -519,18 +1005,130 @@ class CppGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # type
 
     def __extend_environment_with_protoc_and_plugin(
         self, conan_install_dir: str
-    ) -> None:
+    ) -> Dict[str, Dict[str, str]]:
         variables = source_shell_script(
             os.path.join(conan_install_dir, "conanbuild.sh"),
             "bash",
             ignore_locals=True,
         )
-        for key, value in variables.items():
-            os.environ[key] = value
+        changes = get_environment_changes(dict(os.environ), variables)
+        apply_environment_changes(changes)
+        return changes
+
+    def __reuse_installed_tooling(self, tooling_dir: str) -> bool:
+        try:
+            with open(
+                os.path.join(tooling_dir, TOOLING_ENVIRONMENT_FILE_NAME),
+                encoding="utf-8",
+            ) as environment_file:
+                changes = json.load(environment_file)
+        except (FileNotFoundError, ValueError):
+            return False
+
+        if any(
+            find_tooling_binary(binary_name, changes) is None
+            for binary_name in ["protoc", "grpc_cpp_plugin"]
+        ):
+            # The binaries have been removed from the Conan cache meanwhile
+            return False
+        apply_environment_changes(changes)
+        return True
+
+    def generate_descriptor_set(
+        self, proto_files: List[str], proto_include_path: str, output_file: str
+    ) -> None:
+        TRACER.check_call(
+            [
+                get_binary_path("protoc"),
+                f"-I{proto_include_path}",
+                f"--descriptor_set_out={output_file}",
+                "--include_imports",
+                *proto_files,
+            ],
+            cwd=proto_include_path,
+            env=os.environ,
+            stdout=subprocess.DEVNULL if not self._verbose else None,
+            stderr=subprocess.DEVNULL if not self._verbose else None,
+        )
+
+    def get_template_dir(self) -> str:
+        return get_template_dir()
+
+    def install_pending_packages(self) -> None:
+        """Conan packages are exported by `install_package` right away."""
+        pass
+
+    def update_pending_package_references(self) -> None:
+        self._reference_updater.update_references()
+
+    def get_generation_environment(self) -> Dict[str, str]:
+        if self._generation_environment is None:
+            protoc_version = self.__read_protoc_version(self.__get_tooling_dir())
+            if protoc_version is None:
+                protoc_version = self.__query_protoc_version()
+            self._generation_environment = {
+                "protoc": protoc_version,
+                "core_sdk_version": str(get_required_sdk_version()),
+            }
+        return self._generation_environment
+
+    def __query_protoc_version(self) -> str:
+        output: str = TRACER.check_output(["protoc", "--version"], encoding="utf-8")
+        return output.strip()
+
+    def __read_protoc_version(self, tooling_dir: str) -> Optional[str]:
+        """Return the version of protoc recorded when the tooling was installed."""
+        try:
+            with open(
+                os.path.join(tooling_dir, PROTOC_VERSION_FILE_NAME), encoding="utf-8"
+            ) as version_file:
+                return version_file.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def __record_protoc_version(self, tooling_dir: str) -> None:
+        """Record the version of the installed protoc, so the generation
+        inputs can be evaluated without running it."""
+        write_file_if_changed(
+            os.path.join(tooling_dir, PROTOC_VERSION_FILE_NAME),
+            self.__query_protoc_version() + "\n",
+        )
+
+    def __get_tooling_dir(self) -> str:
+        tooling_key = get_tooling_key(
+            get_tooling_requirements(os.path.join(get_template_dir(), "conanfile.py")),
+            get_conan_profile_path(),
+        )
+        return os.path.join(get_project_cache_dir(), "tooling", tooling_key)
+
+    def is_tooling_installed(self) -> bool:
+        tooling_dir = self.__get_tooling_dir()
+        return (
+            os.path.isfile(get_conan_profile_path())
+            and self.__read_protoc_version(tooling_dir) is not None
+            and self.__reuse_installed_tooling(tooling_dir)
+        )
 
     def install_tooling(self) -> None:
-        self.__create_conan_profile()
+        if not os.path.isfile(get_conan_profile_path()):
+            self.__create_conan_profile()
+
+        tooling_dir = self.__get_tooling_dir()
+        if self.__reuse_installed_tooling(tooling_dir):
+            print(f"Reusing gRPC tooling installed at {tooling_dir}")
+            if self.__read_protoc_version(tooling_dir) is None:
+                self.__record_protoc_version(tooling_dir)
+            return
 
-        conan_install_dir = tempfile.mkdtemp()
-        self.__install_protoc_via_conan(conan_install_dir)
-        self.__extend_environment_with_protoc_and_plugin(conan_install_dir)
+        if os.path.isdir(tooling_dir):
+            shutil.rmtree(tooling_dir)
+        os.makedirs(tooling_dir)
+        self.__install_protoc_via_conan(tooling_dir)
+        changes = self.__extend_environment_with_protoc_and_plugin(tooling_dir)
+        with open(
+            os.path.join(tooling_dir, TOOLING_ENVIRONMENT_FILE_NAME),
+            "w",
+            encoding="utf-8",
+        ) as environment_file:
+            json.dump(changes, environment_file, indent=2, sort_keys=True)
+        self.__record_protoc_version(tooling_dir)
@@ -0,0 +1,129 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import fnmatch
+import os
+import re
+from typing import Iterator, List, Set, Tuple
+
+from archive import MANIFEST_DIR_NAME
+
+DEFAULT_IGNORE_PATTERNS = [
+    ".git",
+    MANIFEST_DIR_NAME,
+    "build",
+    "node_modules",
+    "third_party",
+]
+
+# Comments and string literals, which may contain the word "service" as well
+PROTO_NOISE_PATTERN = re.compile(
+    r"//[^\n]*|/\*.*?\*/|\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'", re.DOTALL
+)
+SERVICE_DECLARATION_PATTERN = re.compile(r"\bservice\s+[A-Za-z_]\w*\s*\{")
+
+
+def is_ignored(relative_path: str, ignore_patterns: List[str]) -> bool:
+    """Check whether a path matches any of the ignore patterns. Patterns are
+    matched against the name of the entry and its path relative to the root.
+
+    Args:
+        relative_path (str): The path relative to the root of the walk.
+        ignore_patterns (List[str]): Glob patterns, e.g. "build" or "vendor/*".
+
+    Returns:
+        bool: True if the path shall be ignored. False otherwise.
+    """
+    relative_path = relative_path.replace(os.sep, "/")
+    name = relative_path.rsplit("/", maxsplit=1)[-1]
+    return any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative_path, pattern)
+        for pattern in ignore_patterns
+    )
+
+
+def iter_proto_files(tree_root: str, ignore_patterns: List[str]) -> Iterator[str]:
+    """Lazily walk a directory tree, yielding all proto files which are not
+    ignored. Ignored directories are not descended into. Symlinked
+    directories are followed, but each directory is only walked once, so
+    symlink cycles do not cause an endless walk. The order matches a
+    top-down `os.walk`.
+
+    Args:
+        tree_root (str): The directory to walk.
+        ignore_patterns (List[str]): Glob patterns of files and directories to skip.
+
+    Yields:
+        str: The paths of the proto files.
+    """
+    visited_dirs: Set[Tuple[int, int]] = set()
+    pending_dirs = [tree_root]
+    while len(pending_dirs) > 0:
+        current_dir = pending_dirs.pop()
+        sub_dirs: List[str] = []
+        try:
+            stat = os.stat(current_dir)
+            if (stat.st_dev, stat.st_ino) in visited_dirs:
+                continue
+            visited_dirs.add((stat.st_dev, stat.st_ino))
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    relative_path = os.path.relpath(entry.path, tree_root)
+                    if is_ignored(relative_path, ignore_patterns):
+                        continue
+                    if entry.is_dir():
+                        sub_dirs.append(entry.path)
+                    elif entry.name.endswith(".proto") and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+        pending_dirs.extend(reversed(sub_dirs))
+
+
+def may_define_service(file_path: str) -> bool:
+    """Cheaply check whether a proto file contains a service declaration,
+    without parsing it. Comments and string literals are skipped.
+
+    Args:
+        file_path (str): The path to the proto file.
+
+    Returns:
+        bool: True if the file declares a service. False otherwise.
+    """
+    with open(file_path, encoding="utf-8", errors="replace") as file:
+        content = file.read()
+    if "service" not in content:
+        return False
+    return (
+        SERVICE_DECLARATION_PATTERN.search(PROTO_NOISE_PATTERN.sub(" ", content))
+        is not None
+    )
+
+
+def discover_service_files(tree_root: str, ignore_patterns: List[str]) -> Iterator[str]:
+    """Lazily discover the proto files below a directory which declare a service.
+
+    Args:
+        tree_root (str): The directory to walk.
+        ignore_patterns (List[str]): Glob patterns of files and directories to skip,
+            in addition to the defaults.
+
+    Yields:
+        str: The paths of the proto files declaring a service.
+    """
+    for proto_file in iter_proto_files(
+        tree_root, DEFAULT_IGNORE_PATTERNS + ignore_patterns
+    ):
+        if may_define_service(proto_file):
+            yield proto_file
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Writing of generated files which leaves files with unchanged content
+untouched. Build tools like Ninja, CMake and Conan decide by the modification
+time whether a file changed, so rewriting identical content would trigger
+needless reconfigurations and rebuilds."""
+
+import filecmp
+import os
+import shutil
+import tempfile
+from typing import Set, Tuple
+
+
+def get_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_file_if_changed(file_path: str, content: str) -> bool:
+    """Atomically replace the content of a file, unless it is identical already.
+
+    Args:
+        file_path (str): The path of the file to write.
+        content (str): The new content of the file.
+
+    Returns:
+        bool: True if the file has been written. False if it is unchanged.
+    """
+    try:
+        with open(file_path, encoding="utf-8") as file:
+            if file.read() == content:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            file.write(content)
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temporary_path)
+        else:
+            os.chmod(temporary_path, 0o666 & ~get_umask())
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    return True
+
+
+def create_staging_dir(target_dir: str) -> str:
+    """Create an empty directory to generate the content of a directory into,
+    before it is applied by `sync_directory`. The staging directory is
+    created next to the target directory, so files can be moved instead of
+    copied.
+
+    Args:
+        target_dir (str): The directory which will be synchronized.
+
+    Returns:
+        str: The path of the staging directory.
+    """
+    parent_dir = os.path.dirname(os.path.abspath(target_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    return tempfile.mkdtemp(
+        prefix=f".{os.path.basename(target_dir)}-staging-", dir=parent_dir
+    )
+
+
+def sync_directory(source_dir: str, target_dir: str) -> Tuple[int, int, int]:
+    """Make the target directory identical to the source directory. Files
+    whose content changed are moved from the source directory into place and
+    get a fresh modification time. Files with unchanged content are left
+    untouched. Files and directories not present in the source are removed.
+
+    Args:
+        source_dir (str): The directory with the new content, e.g. created by
+            `create_staging_dir`. Changed files are moved out of it.
+        target_dir (str): The directory to update.
+
+    Returns:
+        Tuple[int, int, int]: A tuple consisting of
+            [0] = The number of new or changed files.
+            [1] = The number of unchanged files.
+            [2] = The number of removed files and directories.
+    """
+    changed_files = 0
+    unchanged_files = 0
+    source_paths: Set[str] = set()
+    for root, _, files in os.walk(source_dir):
+        relative_root = os.path.relpath(root, source_dir)
+        target_root = os.path.normpath(os.path.join(target_dir, relative_root))
+        if os.path.islink(target_root) or os.path.isfile(target_root):
+            os.remove(target_root)
+        os.makedirs(target_root, exist_ok=True)
+        source_paths.add(os.path.normpath(relative_root))
+
+        for file in files:
+            source_path = os.path.join(root, file)
+            target_path = os.path.join(target_root, file)
+            source_paths.add(os.path.normpath(os.path.join(relative_root, file)))
+            if os.path.isdir(target_path) and not os.path.islink(target_path):
+                shutil.rmtree(target_path)
+            elif os.path.isfile(target_path) and filecmp.cmp(
+                source_path, target_path, shallow=False
+            ):
+                unchanged_files += 1
+                continue
+            os.replace(source_path, target_path)
+            # The generator might have preserved an older time, e.g. via copy2
+            os.utime(target_path)
+            changed_files += 1
+
+    removed_paths = 0
+    for root, dirs, files in os.walk(target_dir, topdown=False):
+        relative_root = os.path.relpath(root, target_dir)
+        for name in files + dirs:
+            if os.path.normpath(os.path.join(relative_root, name)) in source_paths:
+                continue
+            path = os.path.join(root, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                os.rmdir(path)
+            else:
+                os.remove(path)
+            removed_paths += 1
+    return changed_files, unchanged_files, removed_paths
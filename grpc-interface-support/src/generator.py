@@ -13,9 +13,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
 
 import proto
 
+COMMON_TYPES_SDK_NAME = "common-types-sdk"
+
 
 class GrpcServiceSdkGenerator(ABC):
     """Generator base class for service SDKs"""
@@ -45,6 +48,26 @@ class GrpcServiceSdkGenerator(ABC):
         """Update auto-generated code within the Velocitas workspace."""
         pass
 
+    @abstractmethod
+    def is_package_installed(self) -> bool:
+        """Check whether the package installed by `install_package` is still
+        available, e.g. it has not been removed from the environment since.
+
+        Returns:
+            bool: True if the package is installed. False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def is_auto_generated_code_present(self) -> bool:
+        """Check whether the code created by `update_auto_generated_code`
+        still exists within the Velocitas workspace.
+
+        Returns:
+            bool: True if the code exists. False otherwise.
+        """
+        pass
+
 
 class GrpcServiceSdkGeneratorFactory(ABC):
     """Factory for creating service generators."""
@@ -54,6 +77,106 @@ class GrpcServiceSdkGeneratorFactory(ABC):
         """Install required tooling for all created generators."""
         pass
 
+    @abstractmethod
+    def is_tooling_installed(self) -> bool:
+        """Check whether the required tooling is installed already and make it
+        available like `install_tooling` would, but without installing anything.
+
+        Returns:
+            bool: True if the tooling is available. False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def install_pending_packages(self) -> None:
+        """Install all packages whose installation has been deferred by the
+        generators' `install_package`. Called once after all SDKs are generated.
+        """
+        pass
+
+    @abstractmethod
+    def update_pending_package_references(self) -> None:
+        """Apply all workspace references to the packages which have been
+        deferred by the generators' `update_package_references`. Called once
+        after all packages are installed.
+        """
+        pass
+
+    @abstractmethod
+    def remove_service_package(self, service_name: str) -> None:
+        """Uninstall the package of a service which is no longer generated
+        and remove the references of the workspace to it. The service
+        implementation of the app is kept, as it may contain manual code.
+        Workspace references may be deferred like those of
+        `update_package_references`.
+
+        Args:
+            service_name (str): The name of the service.
+        """
+        pass
+
+    @abstractmethod
+    def remove_common_types_package(self) -> None:
+        """Uninstall the common types package, as no proto file is shared by
+        several services anymore."""
+        pass
+
+    @abstractmethod
+    def get_template_dir(self) -> str:
+        """Return the directory containing the templates used by the generators.
+
+        Returns:
+            str: The absolute path to the template directory.
+        """
+        pass
+
+    @abstractmethod
+    def get_generation_environment(self) -> Dict[str, str]:
+        """Return the versions of the tooling and SDKs which influence the
+        generated code. Must only be called after the tooling is installed.
+
+        Returns:
+            Dict[str, str]: A mapping of tool or SDK name to its version.
+        """
+        pass
+
+    @abstractmethod
+    def generate_code_batch(
+        self,
+        proto_files: List[str],
+        proto_include_path: str,
+        output_path: str,
+        service_options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """Invoke the code generator once for all given proto files, generating
+        every kind of output any of the service generators may need.
+
+        Args:
+            proto_files (List[str]): The proto files to compile.
+            proto_include_path (str): The path which is used to look for imports.
+            output_path (str): Path where the generated code shall be written to.
+            service_options (Optional[Dict[str, Dict[str, Any]]]): Mapping of
+                proto file to the options of the service it defines.
+        """
+        pass
+
+    @abstractmethod
+    def generate_descriptor_set(
+        self, proto_files: List[str], proto_include_path: str, output_file: str
+    ) -> None:
+        """Invoke protoc once to write a FileDescriptorSet of the given proto
+        files, including all of their imports.
+
+        Args:
+            proto_files (List[str]): The proto files to describe.
+            proto_include_path (str): The path which is used to look for imports.
+            output_file (str): Path of the descriptor set file to write.
+
+        Raises:
+            subprocess.CalledProcessError: If protoc fails.
+        """
+        pass
+
     @abstractmethod
     def create_service_generator(
         self,
@@ -61,6 +184,10 @@ class GrpcServiceSdkGeneratorFactory(ABC):
         proto_file_handle: proto.ProtoFileHandle,
         proto_include_path: str,
         is_first_service: bool,
+        protoc_output_path: Optional[str] = None,
+        common_type_files: Optional[List[str]] = None,
+        service_options: Optional[Dict[str, Any]] = None,
+        imported_files: Optional[List[str]] = None,
     ) -> GrpcServiceSdkGenerator:
         """Create a new service SDK generator for a specific service.
 
@@ -72,9 +199,39 @@ class GrpcServiceSdkGeneratorFactory(ABC):
             is_first_service (bool): Indicates whether this is the first service
                 to be generated. This can be used to determine whether the
                 generator needs to initialize some common part or not.
+            protoc_output_path (Optional[str]): Output path of a previous
+                `generate_code_batch` invocation covering the proto file and its
+                imports. If given, the generator takes its generated code from
+                there instead of invoking the code generator itself.
+            common_type_files (Optional[List[str]]): Imported proto files which
+                are provided by the common types package. Their code is not
+                part of the service SDK, which depends on that package instead.
+            service_options (Optional[Dict[str, Any]]): The options of the
+                service given in its interface config, e.g. `serverMode`.
+            imported_files (Optional[List[str]]): All proto files transitively
+                imported by the proto file, as resolved by the import graph.
+                Their generated code is part of the service SDK.
 
         Returns:
             GrpcServiceSdkGenerator: A new GrpcServiceSdkGenerator which can
                 generate a service SDK for the provided proto file.
         """
         pass
+
+    @abstractmethod
+    def create_common_types_generator(
+        self, output_path: str, proto_files: Dict[str, str]
+    ) -> GrpcServiceSdkGenerator:
+        """Create a generator for the common types package, which contains the
+        code of proto files imported by more than one service exactly once.
+        The client and server flags of `generate_package` have no effect.
+
+        Args:
+            output_path (str): Path where the package shall be generated at.
+            proto_files (Dict[str, str]): Mapping of the proto files to include
+                to the include directory they are compiled with.
+
+        Returns:
+            GrpcServiceSdkGenerator: A new generator for the common types package.
+        """
+        pass
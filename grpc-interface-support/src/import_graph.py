@@ -0,0 +1,205 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Set
+
+import proto
+
+GRAPH_FORMAT_VERSION = 1
+
+
+def normalize_path(file_path: str) -> str:
+    """Normalize a path so it can be used as a node of the import graph.
+
+    Args:
+        file_path (str): The path to normalize.
+
+    Returns:
+        str: The absolute, normalized path.
+    """
+    return os.path.normpath(os.path.abspath(file_path))
+
+
+def get_file_stamp(file_path: str) -> List[int]:
+    """Return the modification time and size of a file, used to detect
+    changes without reading the file.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        List[int]: The modification time in nanoseconds and the size in bytes.
+    """
+    stat = os.stat(file_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class ProtoImportGraph:
+    """Import graph of a proto catalogue with forward and reverse edges.
+    Nodes are normalized paths of proto files. Imports which cannot be
+    resolved within the include directory are not part of the graph."""
+
+    def __init__(self, imports: Dict[str, List[str]], stamps: Dict[str, List[int]]):
+        self.__imports = imports
+        self.__stamps = stamps
+        self.__importers: Dict[str, List[str]] = {}
+        for file, imported_files in imports.items():
+            for imported_file in imported_files:
+                self.__importers.setdefault(imported_file, []).append(file)
+
+    @staticmethod
+    def build(proto_include_dirs: Dict[str, str]) -> "ProtoImportGraph":
+        """Build the import graph of a catalogue, following imports to files
+        outside of the catalogue as well.
+
+        Args:
+            proto_include_dirs (Dict[str, str]): Mapping of proto file to the
+                include directory it is compiled with.
+
+        Returns:
+            ProtoImportGraph: The import graph.
+        """
+        imports: Dict[str, List[str]] = {}
+        stamps: Dict[str, List[int]] = {}
+        pending = [
+            (normalize_path(file), include_dir)
+            for file, include_dir in proto_include_dirs.items()
+        ]
+        while len(pending) > 0:
+            file, include_dir = pending.pop(0)
+            if file in imports:
+                continue
+
+            imports[file] = []
+            stamps[file] = get_file_stamp(file)
+            for element in proto.parse_proto_file(file).imports:
+                import_path = normalize_path(os.path.join(include_dir, element))
+                if os.path.isfile(import_path) and import_path != file:
+                    imports[file].append(import_path)
+                    pending.append((import_path, include_dir))
+
+        return ProtoImportGraph(imports, stamps)
+
+    @staticmethod
+    def load_or_build(
+        proto_include_dirs: Dict[str, str], cache_dir: str, store: bool = True
+    ) -> "ProtoImportGraph":
+        """Load the import graph of a catalogue from the cache directory. The
+        graph is rebuilt and stored if any of its files changed since.
+
+        Args:
+            proto_include_dirs (Dict[str, str]): Mapping of proto file to the
+                include directory it is compiled with.
+            cache_dir (str): The directory where import graphs are cached.
+            store (bool): Store a rebuilt graph in the cache directory.
+
+        Returns:
+            ProtoImportGraph: The import graph.
+        """
+        catalogue_key = hashlib.sha256(
+            json.dumps(sorted(proto_include_dirs.items())).encode("utf-8")
+        ).hexdigest()
+        cache_file_path = os.path.join(cache_dir, f"{catalogue_key}.json")
+
+        graph = ProtoImportGraph.load(cache_file_path)
+        if graph is None or not graph.is_up_to_date():
+            graph = ProtoImportGraph.build(proto_include_dirs)
+            if store:
+                graph.save(cache_file_path)
+        return graph
+
+    @staticmethod
+    def load(cache_file_path: str) -> Optional["ProtoImportGraph"]:
+        """Load an import graph stored by `save`.
+
+        Args:
+            cache_file_path (str): The path of the stored graph.
+
+        Returns:
+            Optional[ProtoImportGraph]: The graph or None if it does not exist
+                or has an outdated format.
+        """
+        try:
+            with open(cache_file_path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get("version") != GRAPH_FORMAT_VERSION:
+            return None
+        return ProtoImportGraph(data["imports"], data["stamps"])
+
+    def save(self, cache_file_path: str) -> None:
+        """Store the import graph.
+
+        Args:
+            cache_file_path (str): The path to store the graph at.
+        """
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        with open(cache_file_path, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    "version": GRAPH_FORMAT_VERSION,
+                    "imports": self.__imports,
+                    "stamps": self.__stamps,
+                },
+                cache_file,
+            )
+
+    def is_up_to_date(self) -> bool:
+        """Check whether none of the files of the graph changed since it was built.
+
+        Returns:
+            bool: True if all files are unchanged. False otherwise.
+        """
+        for file, stamp in self.__stamps.items():
+            if not os.path.isfile(file) or get_file_stamp(file) != stamp:
+                return False
+        return True
+
+    def get_transitive_imports(self, file_path: str) -> List[str]:
+        """Get all files transitively imported by a file.
+
+        Args:
+            file_path (str): The path to the proto file.
+
+        Returns:
+            List[str]: The imported files in the order of discovery.
+        """
+        return self.__traverse(self.__imports, normalize_path(file_path))
+
+    def get_dependents(self, file_path: str) -> Set[str]:
+        """Get all files which transitively import a file, including the file itself.
+
+        Args:
+            file_path (str): The path to the proto file.
+
+        Returns:
+            Set[str]: The file and all files depending on it.
+        """
+        file = normalize_path(file_path)
+        return {file, *self.__traverse(self.__importers, file)}
+
+    def __traverse(self, edges: Dict[str, List[str]], start: str) -> List[str]:
+        visited: List[str] = []
+        pending = [start]
+        while len(pending) > 0:
+            current = pending.pop(0)
+            for neighbour in edges.get(current, []):
+                if neighbour not in visited and neighbour != start:
+                    visited.append(neighbour)
+                    pending.append(neighbour)
+        return visited
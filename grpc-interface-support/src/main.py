@@ -15,30 +15,67 @@
 import argparse
 import os
 import shutil
+import subprocess
+import sys
+import tempfile
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import proto
+from archive import ArchiveExtractor
+from cache import (
+    GenerationCache,
+    compute_fingerprint,
+    compute_input_digests,
+    get_common_types_inputs,
+    get_service_inputs,
+)
 from cpp import CppGrpcServiceSdkGeneratorFactory
-from generator import GrpcServiceSdkGeneratorFactory
+from discovery import discover_service_files
+from file_sync import create_staging_dir, sync_directory
+from generator import GrpcServiceSdkGenerator, GrpcServiceSdkGeneratorFactory
+from import_graph import ProtoImportGraph, normalize_path
+from output_capture import redirect_output
+from protoc import get_output_stem
 from python import PythonGrpcServiceSdkGeneratorFactory
+from tracing import TRACE_ENV_VAR, TRACER
 from velocitas_lib import (
-    discover_files_in_filetree,
-    extract_zip,
     get_programming_language,
     get_project_cache_dir,
     get_workspace_dir,
+    is_uri,
     obtain_local_file_path,
 )
 from velocitas_lib.functional_interface import get_interfaces_for_type
+from watcher import (
+    PollingProtoFileWatcher,
+    ProtoFileWatcher,
+    create_proto_file_watcher,
+)
 
 DEPENDENCY_TYPE_KEY = "grpc-interface"
 DOWNLOAD_PATH = os.path.join(get_project_cache_dir(), "downloads")
+GENERATION_CACHE_PATH = os.path.join(
+    get_project_cache_dir(), "services", "generation-cache.json"
+)
+IMPORT_GRAPH_CACHE_DIR = os.path.join(get_project_cache_dir(), "import-graphs")
+COMMON_TYPES_SDK_DIR = os.path.join(get_project_cache_dir(), "services", "common-types")
+COMMON_TYPES_CACHE_KEY = "common-types"
+TRACE_DIR = os.path.join(get_project_cache_dir(), "traces")
+# Quiet time in seconds after which a burst of proto file changes is regenerated
+WATCH_DEBOUNCE_INTERVAL = 0.3
+# Up to date SDKs are reported this way by --plan, which does not invoke the
+# package managers to check whether the packages are still installed
+UNVERIFIED_INSTALLATION_REASON = "up to date (installation not verified)"
+# Keys of a grpc-interface config which tune the generated code of its services
+SERVICE_OPTION_KEYS = ["serverMode", "serverOptions", "channelOptions"]
 
 
-def create_service_sdk_dir(proto_file_handle: proto.ProtoFileHandle) -> str:
-    """Create a directory for the service SDK.
+def get_service_sdk_dir(proto_file_handle: proto.ProtoFileHandle) -> str:
+    """Get the directory of the service SDK.
 
     Args:
         proto_file_handle (proto.ProtoFileHandle):
@@ -48,14 +85,32 @@ def create_service_sdk_dir(proto_file_handle: proto.ProtoFileHandle) -> str:
         str: The absolute path to the SDK directory.
     """
     service_name = proto_file_handle.get_service_name()
-    service_sdk_path = os.path.join(
-        get_project_cache_dir(), "services", service_name.lower()
-    )
-    if os.path.isdir(service_sdk_path):
-        shutil.rmtree(service_sdk_path)
-    os.makedirs(service_sdk_path, exist_ok=True)
+    return os.path.join(get_project_cache_dir(), "services", service_name.lower())
+
 
-    return service_sdk_path
+def generate_into_directory(
+    sdk_dir: str, generate: Callable[[str], None]
+) -> Tuple[int, int, int]:
+    """Generate the content of an SDK directory into a staging directory and
+    only replace the files whose content changed. Unchanged files keep their
+    modification time, so builds depending on them are not triggered again.
+
+    Args:
+        sdk_dir (str): The SDK directory to update.
+        generate (Callable[[str], None]): Generates the content into the
+            directory passed to it.
+
+    Returns:
+        Tuple[int, int, int]: The number of changed, unchanged and removed
+            files, see `sync_directory`.
+    """
+    staging_dir = create_staging_dir(sdk_dir)
+    try:
+        generate(staging_dir)
+        file_counts: Tuple[int, int, int] = sync_directory(staging_dir, sdk_dir)
+        return file_counts
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
 
 def get_absolute_proto_include_path(relative_path: str) -> str:
@@ -83,12 +138,198 @@ def get_absolute_proto_include_path(relative_path: str) -> str:
         )
 
 
-def generate_services(
+class ServiceGenerationTask:
+    """Inputs and state of the SDK generation of a single service."""
+
+    def __init__(
+        self,
+        proto_file_handle: proto.ProtoFileHandle,
+        proto_include_dir: str,
+        generate_client: bool,
+        generate_server: bool,
+        is_first_service: bool,
+        service_options: Optional[Dict[str, Any]] = None,
+    ):
+        self.proto_file_handle = proto_file_handle
+        self.proto_include_dir = proto_include_dir
+        self.generate_client = generate_client
+        self.generate_server = generate_server
+        self.is_first_service = is_first_service
+        self.service_options = service_options or {}
+        self.service_sdk_dir = get_service_sdk_dir(proto_file_handle)
+        self.imported_files: List[str] = []
+        self.common_type_files: List[str] = []
+        self.fingerprint = ""
+        self.input_digests: Dict[str, str] = {}
+        self.is_up_to_date = False
+        # Why the SDK is regenerated or kept as it is
+        self.reason = ""
+        self.is_package_generated = False
+        self.protoc_output_dir: Optional[str] = None
+
+    def create_generator(
+        self,
+        factory: GrpcServiceSdkGeneratorFactory,
+        output_dir: Optional[str] = None,
+    ) -> GrpcServiceSdkGenerator:
+        """Create the SDK generator for the service of this task.
+
+        Args:
+            factory (GrpcServiceSdkGeneratorFactory): The factory to create the generator with.
+            output_dir (Optional[str]): The directory to generate the package into.
+                Defaults to the SDK directory of the service.
+
+        Returns:
+            GrpcServiceSdkGenerator: The generator for the service.
+        """
+        return factory.create_service_generator(
+            output_dir or self.service_sdk_dir,
+            self.proto_file_handle,
+            self.proto_include_dir,
+            self.is_first_service,
+            self.protoc_output_dir,
+            self.common_type_files,
+            self.service_options,
+            self.imported_files,
+        )
+
+
+def get_service_options(if_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the options of a grpc-interface config which apply to the
+    generated code of its services, e.g. `"serverMode": "async"`.
+
+    Args:
+        if_config (Dict[str, Any]): The grpc-interface config.
+
+    Returns:
+        Dict[str, Any]: The options which are set in the config.
+    """
+    return {key: if_config[key] for key in SERVICE_OPTION_KEYS if key in if_config}
+
+
+def get_archive_member_prefixes(if_config: Dict[str, Any]) -> List[str]:
+    """Get the paths within a zipped source which are required for generation:
+    The `pathInZip` and the `protoIncludeDir`, if it refers to the archive.
+
+    Args:
+        if_config (Dict[str, Any]): The grpc-interface config.
+
+    Returns:
+        List[str]: The paths within the archive. Empty if the whole archive
+            is required.
+    """
+    if "pathInZip" not in if_config:
+        return []
+
+    prefixes = [if_config["pathInZip"]]
+    include_dir = if_config.get("protoIncludeDir")
+    if (
+        include_dir is not None
+        and not os.path.isabs(include_dir)
+        and not os.path.isdir(os.path.join(get_workspace_dir(), include_dir))
+    ):
+        prefixes.append(include_dir)
+    return prefixes
+
+
+def obtain_existing_file_path(path_or_uri: str) -> Optional[str]:
+    """Return the absolute path to the file, specified by a absolute/relative
+    local path or with an URI, without downloading it.
+
+    Args:
+        path_or_uri (str): Absolute/relative local path or URI.
+
+    Returns:
+        Optional[str]: The path to the file or to its previous download.
+            None if there is no such file.
+    """
+    if is_uri(path_or_uri):
+        candidates = [os.path.join(DOWNLOAD_PATH, path_or_uri.split("/")[-1])]
+    else:
+        candidates = [path_or_uri, os.path.join(get_workspace_dir(), path_or_uri)]
+    return next(
+        (candidate for candidate in candidates if os.path.isfile(candidate)), None
+    )
+
+
+def locate_source(if_config: Dict[str, Any], is_read_only: bool) -> Optional[str]:
+    """Locate the proto sources of a grpc-interface config, downloading and
+    extracting them if necessary.
+
+    Args:
+        if_config (Dict[str, Any]): The grpc-interface config.
+        is_read_only (bool): Neither download nor extract the sources but only
+            use a previous download or extraction.
+
+    Returns:
+        Optional[str]: The directory containing the proto files or the path
+            of a single proto file. None if the sources are not available
+            locally in read-only mode.
+    """
+    path_in_zip = if_config.get("pathInZip", None)
+    src: str = if_config["src"]
+    if os.path.isdir(src):
+        return src
+    workspace_path: str = os.path.join(get_workspace_dir(), src)
+    if os.path.isdir(workspace_path):
+        return workspace_path
+
+    path: Optional[str]
+    if is_read_only:
+        path = obtain_existing_file_path(src)
+        if path is None:
+            return None
+    else:
+        path = obtain_local_file_path(src)
+    if not zipfile.is_zipfile(path):
+        return path
+
+    extractor = ArchiveExtractor(path, DOWNLOAD_PATH)
+    member_prefixes = get_archive_member_prefixes(if_config)
+    if not is_read_only:
+        path = extractor.extract(member_prefixes)
+    elif extractor.is_extracted(member_prefixes):
+        path = DOWNLOAD_PATH
+    else:
+        return None
+    return path if path_in_zip is None else os.path.join(path, path_in_zip)
+
+
+def discover_proto_files(
+    if_config: Dict[str, Any], is_read_only: bool = False
+) -> Iterator[str]:
+    """Lazily discover the proto files referenced by a grpc-interface config.
+    Within directories, only files declaring a service are considered.
+    Import-only files are reached via the imports of these files.
+
+    Args:
+        if_config (Dict[str, Any]): The grpc-interface config.
+        is_read_only (bool): Neither download nor extract the sources.
+
+    Raises:
+        RuntimeError: If the sources are not available locally in read-only mode.
+
+    Yields:
+        str: The paths of the discovered proto files.
+    """
+    path = locate_source(if_config, is_read_only)
+    if path is None:
+        raise RuntimeError(f"Sources of {if_config['src']} are not available locally!")
+    if os.path.isfile(path):
+        yield path
+        return
+
+    yield from discover_service_files(path, if_config.get("ignorePatterns", []))
+
+
+def prepare_services(
     factory: GrpcServiceSdkGeneratorFactory,
     if_config: Dict[str, Any],
     is_first_config: bool,
-) -> None:
-    """Generate SDKs for the services defined in the AppManifest.
+    is_read_only: bool = False,
+) -> Tuple[List[ServiceGenerationTask], ProtoImportGraph]:
+    """Discover the services of a grpc-interface config and create the tasks
+    for generating their SDKs.
 
     Raises:
         RuntimeError: If there is no service defined in any proto files given.
@@ -97,109 +338,651 @@ def generate_services(
         factory (GrpcPackageGeneratorFactory):
             The factory from which to generate an SDK generator for a single service.
         if_config (Dict[str, Any]): The grpc-interface config.
-    """
+        is_first_config (bool): Indicates whether this is the first config
+            to be generated.
+        is_read_only (bool): Parse uncached proto files individually instead
+            of extracting their metadata with protoc, neither download nor
+            extract the sources and do not store the import graph in the cache.
 
-    path_in_zip = if_config.get("pathInZip", None)
-    path = if_config["src"]
-    proto_files = []
-
-    if os.path.isdir(path):
-        pass
-    elif os.path.isdir(os.path.join(get_workspace_dir(), path)):
-        path = os.path.join(get_workspace_dir(), path)
-    else:
-        path = obtain_local_file_path(path)
-        if zipfile.is_zipfile(path):
-            path = extract_zip(path, DOWNLOAD_PATH)
-            if path_in_zip is not None:
-                path = os.path.join(path, path_in_zip)
-        else:
-            proto_files.append(path)
+    Returns:
+        Tuple[List[ServiceGenerationTask], ProtoImportGraph]: A tuple consisting of
+            [0] = The tasks of all services of the config.
+            [1] = The import graph of the proto files of the config.
+    """
 
-    proto_service_files = discover_files_in_filetree(path, ".proto")
-    proto_files.extend(proto_service_files) if proto_service_files else None
+    proto_files = list(discover_proto_files(if_config, is_read_only))
 
     is_client = "required" in if_config
     is_server = "provided" in if_config
+    service_options = get_service_options(if_config)
     skipped_files = 0
 
-    is_first_service = is_first_config
+    configured_include_dir: Optional[str] = None
+    if "protoIncludeDir" in if_config:
+        configured_include_dir = get_absolute_proto_include_path(
+            if_config["protoIncludeDir"]
+        )
+    proto_include_dirs = {
+        proto_file: configured_include_dir or str(Path(proto_file).parent)
+        for proto_file in proto_files
+    }
+    if not is_read_only:
+        extract_proto_metadata(factory, proto_include_dirs)
+    import_graph = ProtoImportGraph.load_or_build(
+        proto_include_dirs, IMPORT_GRAPH_CACHE_DIR, store=not is_read_only
+    )
+
+    tasks: List[ServiceGenerationTask] = []
     for proto_file in proto_files:
         try:
             proto_service_file = proto.ProtoFileHandle(proto_file)
-            proto_include_dir = str(Path(proto_service_file.file_path).parent)
-            if "protoIncludeDir" in if_config:
-                proto_include_dir = get_absolute_proto_include_path(
-                    if_config["protoIncludeDir"]
-                )
-            generate_single_service(
-                proto_service_file,
-                factory,
-                is_client,
-                is_server,
-                proto_include_dir,
-                is_first_service,
-            )
-            is_first_service = False
         except RuntimeError:
             print(
                 f"File {proto_file} has no services defined. If it is an import file ignore this error!"
             )
             skipped_files += 1
+            continue
+
+        task = ServiceGenerationTask(
+            proto_service_file,
+            proto_include_dirs[proto_file],
+            is_client,
+            is_server,
+            is_first_config and len(tasks) == 0,
+            service_options,
+        )
+        task.imported_files = import_graph.get_transitive_imports(proto_file)
+        tasks.append(task)
 
     if skipped_files == len(proto_files):
         raise RuntimeError("No services defined!")
 
+    return tasks, import_graph
 
-def generate_single_service(
-    proto_file_handle: proto.ProtoFileHandle,
+
+def find_common_types(tasks: List[ServiceGenerationTask]) -> Dict[str, str]:
+    """Find the proto files which are imported by more than one service. A file
+    is only considered if all services compile it with the same include
+    directory and no other shared file has the same output path.
+
+    Args:
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+
+    Returns:
+        Dict[str, str]: Mapping of the shared proto files to the include
+            directory they are compiled with.
+    """
+    importers: Dict[str, Set[str]] = {}
+    include_dirs: Dict[str, Set[str]] = {}
+    for task in tasks:
+        for file in task.imported_files:
+            importers.setdefault(file, set()).add(task.service_sdk_dir)
+            include_dirs.setdefault(file, set()).add(task.proto_include_dir)
+
+    files_by_stem: Dict[str, List[str]] = {}
+    for file, file_include_dirs in include_dirs.items():
+        if len(importers[file]) > 1 and len(file_include_dirs) == 1:
+            stem = get_output_stem(file, next(iter(file_include_dirs)))
+            files_by_stem.setdefault(stem, []).append(file)
+
+    return {
+        files[0]: next(iter(include_dirs[files[0]]))
+        for files in files_by_stem.values()
+        if len(files) == 1
+    }
+
+
+def get_outdated_reason(
+    cache: GenerationCache, name: str, inputs: Dict[str, Any], sdk_dir: str
+) -> Optional[str]:
+    """Check whether an SDK has already been generated from identical inputs.
+
+    Args:
+        cache (GenerationCache): The cache of already generated SDKs.
+        name (str): The name of the SDK within the cache.
+        inputs (Dict[str, Any]): The current generation inputs of the SDK.
+        sdk_dir (str): The directory of the generated SDK.
+
+    Returns:
+        Optional[str]: Why the SDK needs to be regenerated or None if it is
+            up to date.
+    """
+    if not cache.contains(name):
+        return "not generated yet"
+    if not cache.is_up_to_date(name, compute_fingerprint(inputs)):
+        changed_inputs = cache.get_changed_inputs(name, compute_input_digests(inputs))
+        if changed_inputs:
+            return f"changed inputs: {', '.join(changed_inputs)}"
+        return "changed inputs"
+    if not os.path.isdir(sdk_dir):
+        return "SDK directory is missing"
+    return None
+
+
+def get_missing_installation_reason(
+    generator: GrpcServiceSdkGenerator, generate_server: bool
+) -> Optional[str]:
+    """Check whether an SDK, which is up to date, is still installed. The
+    package may have been removed from the environment or the service stubs
+    from the app since the SDK has been generated.
+
+    Args:
+        generator (GrpcServiceSdkGenerator): The generator of the SDK.
+        generate_server (bool): Whether service stubs are generated for the app.
+
+    Returns:
+        Optional[str]: Why the SDK needs to be regenerated or None if it is
+            still installed.
+    """
+    if not generator.is_package_installed():
+        return "package is not installed"
+    if generate_server and not generator.is_auto_generated_code_present():
+        return "service stubs are missing in the app"
+    return None
+
+
+def evaluate_common_types(
+    factory: GrpcServiceSdkGeneratorFactory,
+    proto_files: Dict[str, str],
+    cache: GenerationCache,
+    verify_installation: bool = True,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Check whether the common types package is up to date.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        proto_files (Dict[str, str]): Mapping of the shared proto files to the
+            include directory they are compiled with.
+        cache (GenerationCache): The cache of already generated SDKs.
+        verify_installation (bool): Check whether the package is still
+            installed, which may require invoking the package manager.
+
+    Returns:
+        Tuple[Dict[str, Any], Optional[str]]: A tuple consisting of
+            [0] = The generation inputs of the package.
+            [1] = Why the package needs to be regenerated or None if it is
+                up to date.
+    """
+    inputs: Dict[str, Any] = get_common_types_inputs(
+        proto_files,
+        factory.get_template_dir(),
+        get_programming_language(),
+        factory.get_generation_environment(),
+    )
+    reason = get_outdated_reason(
+        cache, COMMON_TYPES_CACHE_KEY, inputs, COMMON_TYPES_SDK_DIR
+    )
+    if reason is None and verify_installation:
+        reason = get_missing_installation_reason(
+            factory.create_common_types_generator(COMMON_TYPES_SDK_DIR, proto_files),
+            False,
+        )
+    return inputs, reason
+
+
+def generate_common_types(
     factory: GrpcServiceSdkGeneratorFactory,
-    generate_client: bool,
-    generate_server: bool,
-    proto_include_dir: str,
-    is_first_service: bool,
+    proto_files: Dict[str, str],
+    cache: GenerationCache,
+) -> Optional[Dict[str, Any]]:
+    """Generate and install the package containing the proto files which are
+    imported by several services, unless it is up to date already.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        proto_files (Dict[str, str]): Mapping of the shared proto files to the
+            include directory they are compiled with.
+        cache (GenerationCache): The cache of already generated SDKs.
+
+    Returns:
+        Optional[Dict[str, Any]]: The generation inputs of the package if it
+            has been generated, to be recorded in the cache once the package
+            is installed.
+    """
+    if len(proto_files) == 0:
+        return None
+
+    inputs, reason = evaluate_common_types(factory, proto_files, cache)
+    if reason is None:
+        print("Common types SDK is up to date (cache hit)")
+        return None
+
+    cache.invalidate(COMMON_TYPES_CACHE_KEY)
+    print(f"Generating common types SDK for {', '.join(sorted(proto_files))}")
+    with TRACER.stage("generate_package", service="common-types") as event_args:
+        file_counts = generate_into_directory(
+            COMMON_TYPES_SDK_DIR,
+            lambda output_dir: factory.create_common_types_generator(
+                output_dir, proto_files
+            ).generate_package(False, False),
+        )
+        event_args.update(zip(["changed", "unchanged", "removed"], file_counts))
+
+    generator = factory.create_common_types_generator(COMMON_TYPES_SDK_DIR, proto_files)
+    with TRACER.stage("install_package", service="common-types"):
+        generator.install_package()
+    with TRACER.stage("update_package_references", service="common-types"):
+        generator.update_package_references()
+    return inputs
+
+
+def generate_services(
+    factory: GrpcServiceSdkGeneratorFactory,
+    tasks: List[ServiceGenerationTask],
+    cache: GenerationCache,
+    jobs: int = 1,
 ) -> None:
-    """Generate an SDK for a single service.
+    """Generate SDKs for the services defined in the AppManifest.
 
     Args:
-        proto_file_handle (proto:ProtoFileHandle): A file containing the service to generate.
         factory (GrpcPackageGeneratorFactory):
             The factory from which to generate an SDK generator for a single service.
-        generate_client (bool):     Whether to create client code or not.
-        generate_server (bool):     Whether to create server code or not.
-        proto_include_dir (str):    The directory in which to search for imports.
-        is_first_service (bool):    Indicates whether this is the first service
-            to be generated. This can be used to determine whether the
-            generator needs to initialize some common part or not.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+        cache (GenerationCache): The cache of already generated service SDKs.
+        jobs (int): The maximum number of services to generate in parallel.
+    """
+    protoc_output_dir = tempfile.mkdtemp()
+    try:
+        generate_code_batches(factory, tasks, protoc_output_dir)
+        with TRACER.stage("generate_packages", jobs=jobs):
+            generate_packages(factory, tasks, cache, jobs)
+        for task in tasks:
+            finish_single_service(factory, task)
+    finally:
+        shutil.rmtree(protoc_output_dir, ignore_errors=True)
+
+
+def extract_proto_metadata(
+    factory: GrpcServiceSdkGeneratorFactory, proto_include_dirs: Dict[str, str]
+) -> None:
+    """Extract the metadata of all proto files which are not yet in the parse
+    cache from a FileDescriptorSet, written by a single protoc invocation per
+    include directory. If protoc fails, e.g. due to an unresolvable import,
+    the files are parsed individually later on.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        proto_include_dirs (Dict[str, str]): Mapping of proto file to the
+            include directory it is compiled with.
+    """
+    uncached_files: Dict[str, List[str]] = {}
+    for proto_file, proto_include_dir in proto_include_dirs.items():
+        if not proto.is_in_parse_cache(proto_file):
+            uncached_files.setdefault(proto_include_dir, []).append(proto_file)
+
+    for proto_include_dir, proto_files in uncached_files.items():
+        with tempfile.TemporaryDirectory() as descriptor_set_dir:
+            descriptor_set_path = os.path.join(descriptor_set_dir, "descriptors.pb")
+            try:
+                with TRACER.stage(
+                    "generate_descriptor_set",
+                    include_dir=proto_include_dir,
+                    files=len(proto_files),
+                ):
+                    factory.generate_descriptor_set(
+                        proto_files, proto_include_dir, descriptor_set_path
+                    )
+                proto.load_descriptor_set_into_parse_cache(
+                    descriptor_set_path, proto_include_dir
+                )
+            except (subprocess.CalledProcessError, ImportError):
+                print(
+                    f"Unable to create descriptor set for {proto_include_dir}, "
+                    "falling back to parsing proto files individually."
+                )
+
+
+def generate_code_batches(
+    factory: GrpcServiceSdkGeneratorFactory,
+    tasks: List[ServiceGenerationTask],
+    protoc_output_dir: str,
+) -> None:
+    """Invoke the code generator once per include directory for all outdated
+    services and their transitive imports. Each service generator afterwards
+    picks the code it needs from the batch output instead of invoking the code
+    generator itself.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+        protoc_output_dir (str): The directory to write the generated code to.
     """
+    batches: Dict[str, List[ServiceGenerationTask]] = {}
+    for task in tasks:
+        if not task.is_up_to_date:
+            batches.setdefault(task.proto_include_dir, []).append(task)
 
-    service_sdk_dir = create_service_sdk_dir(proto_file_handle)
-    print(f"Generating service SDK for {proto_file_handle.file_path}")
+    for index, (proto_include_dir, batch_tasks) in enumerate(batches.items()):
+        proto_files: List[str] = []
+        for task in batch_tasks:
+            for file in [task.proto_file_handle.file_path, *task.imported_files]:
+                if file not in proto_files and file not in task.common_type_files:
+                    proto_files.append(file)
 
-    generator = factory.create_service_generator(
-        service_sdk_dir, proto_file_handle, proto_include_dir, is_first_service
+        batch_output_dir = os.path.join(protoc_output_dir, str(index))
+        os.makedirs(batch_output_dir)
+        with TRACER.stage(
+            "generate_code_batch", include_dir=proto_include_dir, files=len(proto_files)
+        ):
+            factory.generate_code_batch(
+                proto_files,
+                proto_include_dir,
+                batch_output_dir,
+                {
+                    task.proto_file_handle.file_path: task.service_options
+                    for task in batch_tasks
+                    if task.service_options
+                },
+            )
+        for task in batch_tasks:
+            task.protoc_output_dir = batch_output_dir
+
+
+def evaluate_cache(
+    factory: GrpcServiceSdkGeneratorFactory,
+    task: ServiceGenerationTask,
+    cache: GenerationCache,
+    verify_installation: bool = True,
+) -> None:
+    """Compute the fingerprint of the task and check whether the service SDK
+    has already been generated from identical inputs and is still installed.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        task (ServiceGenerationTask): The task to evaluate.
+        cache (GenerationCache): The cache of already generated service SDKs.
+        verify_installation (bool): Check whether the package is still
+            installed, which may require invoking the package manager.
+    """
+    proto_file_handle = task.proto_file_handle
+    inputs: Dict[str, Any] = get_service_inputs(
+        proto_file_handle.file_path,
+        task.imported_files,
+        factory.get_template_dir(),
+        task.generate_client,
+        task.generate_server,
+        get_programming_language(),
+        factory.get_generation_environment(),
+        task.common_type_files,
+        task.service_options,
+    )
+    task.fingerprint = compute_fingerprint(inputs)
+    task.input_digests = compute_input_digests(inputs)
+    reason = get_outdated_reason(
+        cache, proto_file_handle.get_service_name(), inputs, task.service_sdk_dir
+    )
+    if reason is None and verify_installation:
+        reason = get_missing_installation_reason(
+            task.create_generator(factory), task.generate_server
+        )
+    task.is_up_to_date = reason is None
+    task.reason = reason or (
+        "up to date" if verify_installation else UNVERIFIED_INSTALLATION_REASON
     )
-    generator.generate_package(generate_client, generate_server)
-    generator.install_package()
-    generator.update_package_references()
-    if generate_server:
-        generator.update_auto_generated_code()
 
 
-def generate_sdks(verbose: bool) -> None:
-    """Generate service SDKs for all grpc-interfaces defined in the AppManifest.json.
+def select_affected_services(
+    tasks: List[ServiceGenerationTask],
+    changed_files: List[str],
+    import_graph: ProtoImportGraph,
+) -> None:
+    """Restrict the regeneration to the services which are affected by changes
+    of the given proto files. Whether an affected service is regenerated is
+    still decided by the cache evaluation, so e.g. saving a file without
+    changing its content does not regenerate anything. All other services
+    are kept as they are.
 
     Args:
-        verbose (bool): Enable verbose logging.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+        changed_files (List[str]): The changed proto files.
+        import_graph (ProtoImportGraph): The import graph of the catalogue.
     """
-    interfaces = get_interfaces_for_type(DEPENDENCY_TYPE_KEY)
+    affected_files: Set[str] = set()
+    for changed_file in changed_files:
+        affected_files.update(import_graph.get_dependents(changed_file))
 
-    if len(interfaces) <= 0:
+    affected_services = []
+    for task in tasks:
+        is_affected = normalize_path(task.proto_file_handle.file_path) in affected_files
+        if is_affected:
+            affected_services.append(task.proto_file_handle.get_service_name())
+            continue
+        if os.path.isdir(task.service_sdk_dir):
+            task.reason = "not affected by the changed proto files"
+        else:
+            task.reason = "SDK directory is missing"
+        task.is_up_to_date = os.path.isdir(task.service_sdk_dir)
+
+    print(
+        f"Services affected by changes of {', '.join(changed_files)}: "
+        f"{', '.join(affected_services) if affected_services else 'none'}"
+    )
+
+
+def generate_single_package(
+    factory: GrpcServiceSdkGeneratorFactory, task: ServiceGenerationTask
+) -> None:
+    """Generate the SDK package of a single service, replacing only changed files.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        task (ServiceGenerationTask): The task to generate the package for.
+    """
+    with TRACER.stage(
+        "generate_package", service=task.proto_file_handle.get_service_name()
+    ) as event_args:
+        file_counts = generate_into_directory(
+            task.service_sdk_dir,
+            lambda output_dir: task.create_generator(
+                factory, output_dir
+            ).generate_package(task.generate_client, task.generate_server),
+        )
+        event_args.update(zip(["changed", "unchanged", "removed"], file_counts))
+
+
+def generate_single_package_in_worker(
+    factory: GrpcServiceSdkGeneratorFactory, task: ServiceGenerationTask
+) -> Tuple[str, Optional[BaseException], List[Dict[str, Any]]]:
+    """Generate the SDK package of a single service within a worker process,
+    capturing all output of the worker and its subprocesses.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        task (ServiceGenerationTask): The task to generate the package for.
+
+    Returns:
+        Tuple[str, Optional[BaseException], List[Dict[str, Any]]]: A tuple consisting of
+            [0] = The captured output.
+            [1] = The error raised during generation, if any.
+            [2] = The trace events recorded by the worker.
+    """
+    # Drop events inherited from the main process, it keeps its own copy
+    TRACER.take_events()
+    error: Optional[BaseException] = None
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as output_file:
+        with redirect_output(output_file.fileno()):
+            try:
+                generate_single_package(factory, task)
+            except Exception as exception:
+                error = exception
+
+        output_file.seek(0)
+        return output_file.read(), error, TRACER.take_events()
+
+
+def generate_packages(
+    factory: GrpcServiceSdkGeneratorFactory,
+    tasks: List[ServiceGenerationTask],
+    cache: GenerationCache,
+    jobs: int,
+) -> None:
+    """Generate the SDK packages of all outdated services. Services with a
+    unique SDK directory are generated in parallel by up to `jobs` worker
+    processes. Their output is printed in the order of the tasks.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+        cache (GenerationCache): The cache of already generated service SDKs.
+        jobs (int): The maximum number of services to generate in parallel.
+    """
+    outdated_tasks = [task for task in tasks if not task.is_up_to_date]
+    for task in outdated_tasks:
+        cache.invalidate(task.proto_file_handle.get_service_name())
+
+    sdk_dirs = [task.service_sdk_dir for task in outdated_tasks]
+    parallel_tasks = [
+        task for task in outdated_tasks if sdk_dirs.count(task.service_sdk_dir) == 1
+    ]
+
+    if jobs <= 1 or len(parallel_tasks) <= 1:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(parallel_tasks))) as executor:
+        futures = [
+            executor.submit(generate_single_package_in_worker, factory, task)
+            for task in parallel_tasks
+        ]
+        for task, future in zip(parallel_tasks, futures):
+            print(f"Generating service SDK for {task.proto_file_handle.file_path}")
+            output, error, events = future.result()
+            TRACER.add_events(events)
+            print(output, end="", flush=True)
+            if error is not None:
+                raise error
+            task.is_package_generated = True
+
+
+def finish_single_service(
+    factory: GrpcServiceSdkGeneratorFactory,
+    task: ServiceGenerationTask,
+) -> None:
+    """Finish the generation of a single service by installing its package and
+    updating the shared workspace files. Runs sequentially for all services.
+    If the SDK has already been generated from identical inputs, only the
+    package references are updated.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        task (ServiceGenerationTask): The task to finish.
+    """
+    proto_file_handle = task.proto_file_handle
+    service_name = proto_file_handle.get_service_name()
+    generator = task.create_generator(factory)
+
+    if task.is_up_to_date:
+        print(
+            f"Service SDK for {proto_file_handle.file_path} is up to date (cache hit)"
+        )
+        with TRACER.stage("update_package_references", service=service_name):
+            generator.update_package_references()
         return
 
+    if not task.is_package_generated:
+        print(f"Generating service SDK for {proto_file_handle.file_path}")
+        generate_single_package(factory, task)
+
+    with TRACER.stage("install_package", service=service_name):
+        generator.install_package()
+    with TRACER.stage("update_package_references", service=service_name):
+        generator.update_package_references()
+    if task.generate_server:
+        with TRACER.stage("update_auto_generated_code", service=service_name):
+            generator.update_auto_generated_code()
+
+
+def record_generated_sdks(
+    cache: GenerationCache,
+    tasks: List[ServiceGenerationTask],
+    common_types_inputs: Optional[Dict[str, Any]],
+) -> None:
+    """Record the fingerprints of all SDKs generated by this run in the cache.
+    Must only be called once all packages are installed.
+
+    Args:
+        cache (GenerationCache): The cache of already generated SDKs.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+        common_types_inputs (Optional[Dict[str, Any]]): The generation inputs
+            of the common types package if it has been generated.
+    """
+    if common_types_inputs is not None:
+        cache.update(
+            COMMON_TYPES_CACHE_KEY,
+            compute_fingerprint(common_types_inputs),
+            compute_input_digests(common_types_inputs),
+        )
+    for task in tasks:
+        if not task.is_up_to_date:
+            cache.update(
+                task.proto_file_handle.get_service_name(),
+                task.fingerprint,
+                task.input_digests,
+            )
+
+
+def find_stale_sdks(
+    cache: GenerationCache,
+    tasks: List[ServiceGenerationTask],
+    common_types: Dict[str, str],
+) -> List[str]:
+    """Find the SDKs recorded in the cache which are no longer generated,
+    because their service has been removed from the AppManifest or its proto
+    files.
+
+    Args:
+        cache (GenerationCache): The cache of already generated SDKs.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+        common_types (Dict[str, str]): The shared proto files.
+
+    Returns:
+        List[str]: The sorted names of the stale SDKs within the cache.
+    """
+    current_names = {task.proto_file_handle.get_service_name() for task in tasks}
+    if len(common_types) > 0:
+        current_names.add(COMMON_TYPES_CACHE_KEY)
+    return [name for name in cache.get_service_names() if name not in current_names]
+
+
+def remove_stale_sdks(
+    factory: GrpcServiceSdkGeneratorFactory,
+    cache: GenerationCache,
+    stale_names: List[str],
+) -> None:
+    """Uninstall stale SDKs, remove the references of the workspace to them
+    and remove their sources from the project cache. Workspace references
+    may be removed deferred by the factory's `update_pending_package_references`.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        cache (GenerationCache): The cache of already generated SDKs.
+        stale_names (List[str]): The names of the stale SDKs within the cache.
+    """
+    for name in stale_names:
+        print(f"Removing SDK of {name}, which is no longer generated")
+        if name == COMMON_TYPES_CACHE_KEY:
+            factory.remove_common_types_package()
+        else:
+            factory.remove_service_package(name)
+        shutil.rmtree(
+            os.path.join(get_project_cache_dir(), "services", name.lower()),
+            ignore_errors=True,
+        )
+        cache.invalidate(name)
+
+
+def get_factory(verbose: bool) -> Optional[GrpcServiceSdkGeneratorFactory]:
+    """Get the generator factory for the programming language of the project.
+
+    Args:
+        verbose (bool): Enable verbose logging.
+
+    Returns:
+        Optional[GrpcServiceSdkGeneratorFactory]: The factory or None if the
+            programming language is not supported.
+    """
     LANGUAGE_FACTORIES = {
-        "cpp": CppGrpcServiceSdkGeneratorFactory(verbose),
-        "python": PythonGrpcServiceSdkGeneratorFactory(verbose),
+        "cpp": CppGrpcServiceSdkGeneratorFactory,
+        "python": PythonGrpcServiceSdkGeneratorFactory,
     }
 
     if get_programming_language() not in LANGUAGE_FACTORIES:
@@ -207,22 +990,449 @@ def generate_sdks(verbose: bool) -> None:
             "gRPC interface not yet supported for programming language "
             f"{get_programming_language()!r}"
         )
+        return None
+
+    return LANGUAGE_FACTORIES[get_programming_language()](verbose)
+
+
+def generate_sdks(
+    verbose: bool,
+    use_cache: bool = True,
+    jobs: int = 1,
+    changed_files: Optional[List[str]] = None,
+) -> None:
+    """Generate service SDKs for all grpc-interfaces defined in the AppManifest.json.
+
+    Args:
+        verbose (bool): Enable verbose logging.
+        use_cache (bool): Skip services whose SDK has already been generated
+            from identical inputs.
+        jobs (int): The maximum number of services to generate in parallel.
+        changed_files (Optional[List[str]]): If given, only the services
+            affected by changes of these proto files are regenerated.
+    """
+    interfaces = get_interfaces_for_type(DEPENDENCY_TYPE_KEY)
+
+    if len(interfaces) <= 0:
+        return
+
+    factory = get_factory(verbose)
+    if factory is None:
         return
 
-    factory = LANGUAGE_FACTORIES[get_programming_language()]
+    try:
+        with TRACER.stage("generate_sdks", language=get_programming_language()):
+            print("Installing tooling...")
+            with TRACER.stage("install_tooling"):
+                factory.install_tooling()
+            run_generation_pipeline(factory, interfaces, use_cache, jobs, changed_files)
+    finally:
+        if TRACER.is_enabled():
+            write_trace()
+
+
+def evaluate_services(
+    factory: GrpcServiceSdkGeneratorFactory,
+    interfaces: List[Dict[str, Any]],
+    cache: GenerationCache,
+    use_cache: bool,
+    changed_files: Optional[List[str]],
+    is_tooling_installed: bool = True,
+    is_read_only: bool = False,
+) -> Tuple[List[ServiceGenerationTask], Dict[str, str]]:
+    """Discover the services of all grpc-interfaces and decide which of their
+    SDKs need to be regenerated.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        interfaces (List[Dict[str, Any]]): The grpc-interfaces of the AppManifest.
+        cache (GenerationCache): The cache of already generated SDKs.
+        use_cache (bool): Skip services whose SDK has already been generated
+            from identical inputs.
+        changed_files (Optional[List[str]]): If given, only the services
+            affected by changes of these proto files are regenerated.
+        is_tooling_installed (bool): Whether the tooling is installed. If not,
+            neither protoc is run nor the cache is evaluated, as the version
+            of the tooling is part of the generation inputs.
+        is_read_only (bool): Evaluate the services without running protoc or
+            package managers and without storing parsed proto files or
+            import graphs.
+
+    Returns:
+        Tuple[List[ServiceGenerationTask], Dict[str, str]]: A tuple consisting of
+            [0] = The tasks of all services.
+            [1] = The shared proto files, see `find_common_types`.
+    """
+    prepared_configs = []
+    for index, grpc_service in enumerate(interfaces):
+        with TRACER.stage("prepare_services", src=grpc_service["config"]["src"]):
+            prepared_configs.append(
+                prepare_services(
+                    factory, grpc_service["config"], index == 0, is_read_only
+                )
+            )
+    tasks = [task for config_tasks, _ in prepared_configs for task in config_tasks]
+
+    with TRACER.stage("evaluate_cache", services=len(tasks)):
+        common_types = find_common_types(tasks)
+        for task in tasks:
+            task.common_type_files = [
+                file for file in task.imported_files if file in common_types
+            ]
+            if is_tooling_installed:
+                evaluate_cache(factory, task, cache, not is_read_only)
+            else:
+                task.reason = "gRPC tooling is not installed yet"
+
+    if not use_cache:
+        for task in tasks:
+            task.is_up_to_date = False
+            task.reason = "regeneration forced by --no-cache"
+    if changed_files is not None:
+        for config_tasks, import_graph in prepared_configs:
+            select_affected_services(config_tasks, changed_files, import_graph)
+
+    return tasks, common_types
+
+
+def run_generation_pipeline(
+    factory: GrpcServiceSdkGeneratorFactory,
+    interfaces: List[Dict[str, Any]],
+    use_cache: bool,
+    jobs: int,
+    changed_files: Optional[List[str]],
+) -> List[ServiceGenerationTask]:
+    """Run all stages of the SDK generation for the given grpc-interfaces.
+    The tooling must have been installed before.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        interfaces (List[Dict[str, Any]]): The grpc-interfaces of the AppManifest.
+        use_cache (bool): Skip services whose SDK has already been generated
+            from identical inputs.
+        jobs (int): The maximum number of services to generate in parallel.
+        changed_files (Optional[List[str]]): If given, only the services
+            affected by changes of these proto files are regenerated.
+
+    Returns:
+        List[ServiceGenerationTask]: The tasks of all services.
+    """
+    if not use_cache and os.path.isfile(GENERATION_CACHE_PATH):
+        os.remove(GENERATION_CACHE_PATH)
+    cache = GenerationCache(GENERATION_CACHE_PATH)
+
+    tasks, common_types = evaluate_services(
+        factory, interfaces, cache, use_cache, changed_files
+    )
+    remove_stale_sdks(factory, cache, find_stale_sdks(cache, tasks, common_types))
+
+    common_types_inputs = generate_common_types(factory, common_types, cache)
+    generate_services(factory, tasks, cache, jobs)
+    with TRACER.stage("install_pending_packages"):
+        factory.install_pending_packages()
+    with TRACER.stage("update_pending_package_references"):
+        factory.update_pending_package_references()
+    record_generated_sdks(cache, tasks, common_types_inputs)
+    return tasks
+
+
+def get_watch_directories(
+    interfaces: List[Dict[str, Any]], tasks: List[ServiceGenerationTask]
+) -> List[str]:
+    """Get the local directories containing the proto files of the services:
+    The `src` directories of the grpc-interfaces and the directories of all
+    service files and their transitive imports. Downloaded sources are not
+    watched.
+
+    Args:
+        interfaces (List[Dict[str, Any]]): The grpc-interfaces of the AppManifest.
+        tasks (List[ServiceGenerationTask]): The tasks of all services.
+
+    Returns:
+        List[str]: The sorted directories.
+    """
+    directories: Set[str] = set()
+    for interface in interfaces:
+        path = interface["config"]["src"]
+        for candidate in [path, os.path.join(get_workspace_dir(), path)]:
+            if os.path.isdir(candidate):
+                directories.add(normalize_path(candidate))
+                break
+    for task in tasks:
+        for file in [task.proto_file_handle.file_path, *task.imported_files]:
+            directory = os.path.dirname(normalize_path(file))
+            if not directory.startswith(normalize_path(DOWNLOAD_PATH)):
+                directories.add(directory)
+    return sorted(directories)
+
+
+def regenerate_on_change(
+    factory: GrpcServiceSdkGeneratorFactory,
+    interfaces: List[Dict[str, Any]],
+    jobs: int,
+    changed_files: Optional[List[str]],
+) -> Optional[List[ServiceGenerationTask]]:
+    """Run the generation within watch mode. Errors, e.g. syntax errors in a
+    proto file which is being edited, are printed instead of being raised.
+
+    Args:
+        factory (GrpcServiceSdkGeneratorFactory): The factory used for generation.
+        interfaces (List[Dict[str, Any]]): The grpc-interfaces of the AppManifest.
+        jobs (int): The maximum number of services to generate in parallel.
+        changed_files (Optional[List[str]]): If given, only the services
+            affected by changes of these proto files are regenerated.
+
+    Returns:
+        Optional[List[ServiceGenerationTask]]: The tasks of all services or
+            None if the generation failed.
+    """
+    start_time = time.monotonic()
+    try:
+        with TRACER.stage("generate_sdks", language=get_programming_language()):
+            tasks = run_generation_pipeline(
+                factory, interfaces, True, jobs, changed_files
+            )
+    except Exception as error:
+        print(f"Generation failed: {error}")
+        return None
+    finally:
+        if TRACER.is_enabled():
+            write_trace()
+            TRACER.take_events()
+    print(f"Service SDKs are up to date ({time.monotonic() - start_time:.1f}s)")
+    return tasks
+
+
+def watch_sdks(
+    verbose: bool,
+    jobs: int = 1,
+    debounce_interval: float = WATCH_DEBOUNCE_INTERVAL,
+) -> None:
+    """Generate the service SDKs and regenerate the ones affected by changes
+    of their proto files until interrupted. The tooling, the generation
+    environment and the parsed proto files are kept in memory in between.
+
+    Args:
+        verbose (bool): Enable verbose logging.
+        jobs (int): The maximum number of services to generate in parallel.
+        debounce_interval (float): The quiet time in seconds after which a
+            burst of changes is regenerated.
+    """
+    interfaces = get_interfaces_for_type(DEPENDENCY_TYPE_KEY)
+    factory = get_factory(verbose) if len(interfaces) > 0 else None
+    if factory is None:
+        return
 
     print("Installing tooling...")
     factory.install_tooling()
+    tasks = regenerate_on_change(factory, interfaces, jobs, None) or []
+
+    watcher = create_proto_file_watcher()
+    watched_directories: Set[str] = set()
+    try:
+        while True:
+            watcher = watch_directories(
+                watcher, watched_directories, get_watch_directories(interfaces, tasks)
+            )
+            changed_files = sorted(watcher.wait_for_changes(debounce_interval))
+            print(f"Detected changes of {', '.join(changed_files)}")
+            tasks = (
+                regenerate_on_change(factory, interfaces, jobs, changed_files) or tasks
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def watch_directories(
+    watcher: ProtoFileWatcher, watched_directories: Set[str], directories: List[str]
+) -> ProtoFileWatcher:
+    """Add the directories which are not watched yet to a watcher. If they
+    cannot be watched, e.g. as the inotify watch limit is reached, a polling
+    watcher is used for all directories instead.
+
+    Args:
+        watcher (ProtoFileWatcher): The current watcher.
+        watched_directories (Set[str]): The directories watched already.
+            The added directories are added to it.
+        directories (List[str]): The directories to watch.
+
+    Returns:
+        ProtoFileWatcher: The watcher watching the directories.
+    """
+    new_directories = [
+        directory for directory in directories if directory not in watched_directories
+    ]
+    if len(new_directories) == 0:
+        return watcher
+
+    try:
+        watcher.watch(new_directories)
+    except OSError as error:
+        print(f"Unable to watch for changes ({error}), falling back to polling")
+        watcher.close()
+        watcher = PollingProtoFileWatcher()
+        watcher.watch(sorted(watched_directories.union(new_directories)))
+    watched_directories.update(new_directories)
+    print(f"Watching {', '.join(new_directories)} for changes...")
+    return watcher
 
-    is_first_config = True
-    for grpc_service in interfaces:
-        if_config = grpc_service["config"]
-        generate_services(factory, if_config, is_first_config)
-        is_first_config = False
+
+def plan_sdks(
+    verbose: bool,
+    use_cache: bool = True,
+    changed_files: Optional[List[str]] = None,
+) -> bool:
+    """Print which SDKs a generation would regenerate, keep or remove and why,
+    without running protoc or any installer and without modifying the cache.
+
+    Args:
+        verbose (bool): Enable verbose logging.
+        use_cache (bool): Plan as if the cache was disabled.
+        changed_files (Optional[List[str]]): Plan as if only the services
+            affected by changes of these proto files were regenerated.
+
+    Returns:
+        bool: True if any SDK would be regenerated or removed.
+    """
+    interfaces = get_interfaces_for_type(DEPENDENCY_TYPE_KEY)
+    factory = get_factory(verbose) if len(interfaces) > 0 else None
+    if factory is None:
+        print("Nothing to generate")
+        return False
+
+    proto.get_parse_cache().disable_persistence()
+    cache = GenerationCache(GENERATION_CACHE_PATH)
+    is_tooling_installed = factory.is_tooling_installed()
+    unavailable_sources = [
+        interface["config"]["src"]
+        for interface in interfaces
+        if locate_source(interface["config"], is_read_only=True) is None
+    ]
+    tasks, common_types = evaluate_services(
+        factory,
+        [
+            interface
+            for interface in interfaces
+            if interface["config"]["src"] not in unavailable_sources
+        ],
+        cache,
+        use_cache,
+        changed_files,
+        is_tooling_installed,
+        is_read_only=True,
+    )
+    # The services of unavailable sources are unknown, so none of the cached
+    # SDKs can be told to be stale
+    stale_names = (
+        find_stale_sdks(cache, tasks, common_types)
+        if use_cache and len(unavailable_sources) == 0
+        else []
+    )
+
+    # Rows of action, SDK name and reason
+    plan: List[Tuple[str, str, str]] = []
+    if len(common_types) > 0:
+        common_types_reason: Optional[str] = "gRPC tooling is not installed yet"
+        if is_tooling_installed:
+            _, common_types_reason = evaluate_common_types(
+                factory, common_types, cache, verify_installation=False
+            )
+        if not use_cache:
+            common_types_reason = "regeneration forced by --no-cache"
+        plan.append(
+            (
+                "skip" if common_types_reason is None else "regenerate",
+                COMMON_TYPES_CACHE_KEY,
+                common_types_reason or UNVERIFIED_INSTALLATION_REASON,
+            )
+        )
+    for task in tasks:
+        plan.append(
+            (
+                "skip" if task.is_up_to_date else "regenerate",
+                task.proto_file_handle.get_service_name(),
+                task.reason,
+            )
+        )
+    for src in unavailable_sources:
+        plan.append(("regenerate", src, "source not available locally"))
+    for name in stale_names:
+        plan.append(("remove", name, "no longer part of the AppManifest"))
+
+    name_width = max(len(name) for _, name, _ in plan)
+    for action, name, reason in plan:
+        print(f"{action:<10}  {name:<{name_width}}  {reason}")
+
+    counts = {
+        action: sum(1 for row in plan if row[0] == action)
+        for action in ["regenerate", "skip", "remove"]
+    }
+    print(
+        f"{counts['regenerate']} to regenerate, {counts['skip']} to skip, "
+        f"{counts['remove']} to remove"
+    )
+    return counts["regenerate"] + counts["remove"] > 0
+
+
+def write_trace() -> None:
+    """Write the trace of this run to the project cache and print its summary."""
+    trace_path = TRACER.write(TRACE_DIR)
+    print(f"Generation trace written to {trace_path}")
+    print(TRACER.get_summary())
 
 
 if __name__ == "__main__":
     argument_parser = argparse.ArgumentParser()
     argument_parser.add_argument("-v", "--verbose", action="store_true")
+    argument_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate all service SDKs, even if their inputs did not change.",
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Maximum number of services to generate in parallel. Defaults "
+        "to 1, as packaging the code generated by protoc takes only a few "
+        "milliseconds per service.",
+    )
+    argument_parser.add_argument(
+        "--changed",
+        action="append",
+        metavar="FILE",
+        help="Only regenerate the services affected by a change of the given "
+        "proto file. Can be given multiple times.",
+    )
+    argument_parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record the duration of each generation stage and subprocess and "
+        "write it as Chrome trace to the project cache. Can also be enabled by "
+        f"setting {TRACE_ENV_VAR}=1.",
+    )
+    argument_parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Only print which service SDKs would be regenerated, skipped or "
+        "removed and why. Exits with 2 if any SDK would be regenerated or "
+        "removed, otherwise with 0.",
+    )
+    argument_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate the service SDKs affected by changes "
+        "of proto files within the local sources of the grpc-interfaces.",
+    )
     args = argument_parser.parse_args()
-    generate_sdks(args.verbose)
+    if args.trace:
+        TRACER.enable()
+    if args.plan:
+        sys.exit(2 if plan_sdks(args.verbose, not args.no_cache, args.changed) else 0)
+    if args.watch:
+        watch_sdks(args.verbose, args.jobs)
+        sys.exit(0)
+    generate_sdks(args.verbose, not args.no_cache, args.jobs, args.changed)
@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def redirect_output(file_descriptor: int) -> Iterator[None]:
+    """Redirect stdout and stderr of the current process to a file descriptor.
+    Unlike `contextlib.redirect_stdout` this also covers output written by
+    native code and by subprocesses.
+
+    Args:
+        file_descriptor (int): The file descriptor to redirect the output to.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    original_stdout = os.dup(1)
+    original_stderr = os.dup(2)
+    os.dup2(file_descriptor, 1)
+    os.dup2(file_descriptor, 2)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(original_stdout, 1)
+        os.dup2(original_stderr, 2)
+        os.close(original_stdout)
+        os.close(original_stderr)
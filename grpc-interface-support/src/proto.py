@@ -12,28 +12,274 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional
 
 from proto_schema_parser import ast
 from proto_schema_parser.parser import Parser
+from velocitas_lib import get_project_cache_dir
+
+PARSE_CACHE_FORMAT_VERSION = 2
+
+
+class ProtoFileMetadata:
+    """The information extracted from a single proto file."""
+
+    def __init__(
+        self,
+        service_names: List[str],
+        package: Optional[str],
+        imports: List[str],
+        service_methods: Optional[Dict[str, List[str]]] = None,
+    ):
+        self.service_names = service_names
+        self.package = package
+        self.imports = imports
+        self.service_methods = service_methods if service_methods is not None else {}
+
+    def serialize(self) -> str:
+        """Serialize the metadata into a compact JSON record.
+
+        Returns:
+            str: The serialized record.
+        """
+        return json.dumps(
+            {
+                "v": PARSE_CACHE_FORMAT_VERSION,
+                "s": self.service_names,
+                "p": self.package,
+                "i": self.imports,
+                "m": self.service_methods,
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def deserialize(record: str) -> Optional["ProtoFileMetadata"]:
+        """Deserialize metadata from a record created by `serialize`.
+
+        Args:
+            record (str): The serialized record.
+
+        Returns:
+            Optional[ProtoFileMetadata]: The metadata or None if the record
+                is invalid or has an outdated format.
+        """
+        try:
+            data = json.loads(record)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or data.get("v") != PARSE_CACHE_FORMAT_VERSION:
+            return None
+        return ProtoFileMetadata(data["s"], data["p"], data["i"], data["m"])
+
+
+class ProtoParseCache:
+    """Cache of parsed proto file metadata, keyed by the hash of the file
+    content. Records are kept in memory and, if a cache directory is given,
+    persisted as one file per content hash."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.__cache_dir = cache_dir
+        self.__is_persistent = cache_dir is not None
+        self.__records: Dict[str, ProtoFileMetadata] = {}
+
+    def disable_persistence(self) -> None:
+        """Keep added records in memory only. Persisted records are still read."""
+        self.__is_persistent = False
+
+    def get(self, content_hash: str) -> Optional[ProtoFileMetadata]:
+        """Return the cached metadata of a proto file.
+
+        Args:
+            content_hash (str): The hash of the file content.
+
+        Returns:
+            Optional[ProtoFileMetadata]: The metadata or None on a cache miss.
+        """
+        metadata = self.__records.get(content_hash)
+        if metadata is None and self.__cache_dir is not None:
+            try:
+                with open(
+                    os.path.join(self.__cache_dir, f"{content_hash}.json"),
+                    encoding="utf-8",
+                ) as record_file:
+                    metadata = ProtoFileMetadata.deserialize(record_file.read())
+            except FileNotFoundError:
+                pass
+            if metadata is not None:
+                self.__records[content_hash] = metadata
+        return metadata
+
+    def put(self, content_hash: str, metadata: ProtoFileMetadata) -> None:
+        """Add the metadata of a proto file to the cache.
+
+        Args:
+            content_hash (str): The hash of the file content.
+            metadata (ProtoFileMetadata): The metadata to cache.
+        """
+        self.__records[content_hash] = metadata
+        if not self.__is_persistent or self.__cache_dir is None:
+            return
+
+        # write to a temporary file first, parallel generation workers may
+        # store the same record concurrently
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.__cache_dir)
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as record_file:
+            record_file.write(metadata.serialize())
+        os.replace(temp_path, os.path.join(self.__cache_dir, f"{content_hash}.json"))
+
+
+_parse_cache: Optional[ProtoParseCache] = None
+
+
+def get_parse_cache() -> ProtoParseCache:
+    """Return the parse cache of this process. Records are persisted in the
+    project cache if one is available.
+
+    Returns:
+        ProtoParseCache: The parse cache.
+    """
+    global _parse_cache
+    if _parse_cache is None:
+        try:
+            cache_dir: Optional[str] = os.path.join(
+                get_project_cache_dir(), "proto-parse-cache"
+            )
+        except ValueError:
+            # Not running within a Velocitas project, e.g. in unit tests
+            cache_dir = None
+        _parse_cache = ProtoParseCache(cache_dir)
+    return _parse_cache
+
+
+def get_content_hash(file_path: str) -> str:
+    """Return the hash of the content of a proto file, used as key of the parse cache.
+
+    Args:
+        file_path (str): The path to the proto file.
+
+    Returns:
+        str: The hex digest of the file content.
+    """
+    with open(file_path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def is_in_parse_cache(file_path: str) -> bool:
+    """Check whether the metadata of a proto file is already in the parse cache.
+
+    Args:
+        file_path (str): The path to the proto file.
+
+    Returns:
+        bool: True if the metadata is cached. False otherwise.
+    """
+    return get_parse_cache().get(get_content_hash(file_path)) is not None
+
+
+def parse_proto_file(file_path: str) -> ProtoFileMetadata:
+    """Extract the services, package and imports of a proto file in a single
+    parse. The result is served from the parse cache if the file content has
+    been parsed before.
+
+    Args:
+        file_path (str): The path to the proto file.
+
+    Returns:
+        ProtoFileMetadata: The metadata of the proto file.
+    """
+    with open(file_path, "rb") as file:
+        content = file.read()
+
+    content_hash = hashlib.sha256(content).hexdigest()
+    parse_cache = get_parse_cache()
+    metadata = parse_cache.get(content_hash)
+    if metadata is not None:
+        return metadata
+
+    parsed_data = Parser().parse(content.decode("utf-8"))
+    service_names: List[str] = []
+    service_methods: Dict[str, List[str]] = {}
+    package: Optional[str] = None
+    imports: List[str] = []
+    for element in parsed_data.file_elements:
+        if isinstance(element, ast.Service):
+            service_names.append(str(element.name))
+            service_methods[str(element.name)] = [
+                str(method.name)
+                for method in element.elements
+                if isinstance(method, ast.Method)
+            ]
+        elif isinstance(element, ast.Package):
+            package = str(element.name)
+        elif isinstance(element, ast.Import):
+            imports.append(str(element.name))
+
+    metadata = ProtoFileMetadata(service_names, package, imports, service_methods)
+    parse_cache.put(content_hash, metadata)
+    return metadata
+
+
+def load_descriptor_set_into_parse_cache(
+    descriptor_set_path: str, proto_include_dir: str
+) -> int:
+    """Add the metadata of all proto files contained in a FileDescriptorSet
+    (as written by `protoc --descriptor_set_out --include_imports`) to the
+    parse cache, so the files do not need to be parsed individually.
+
+    Args:
+        descriptor_set_path (str): The path to the serialized FileDescriptorSet.
+        proto_include_dir (str): The include directory the descriptor set
+            was created with.
+
+    Returns:
+        int: The number of proto files added to the parse cache.
+    """
+    from google.protobuf import descriptor_pb2
+
+    descriptor_set = descriptor_pb2.FileDescriptorSet()
+    with open(descriptor_set_path, "rb") as descriptor_set_file:
+        descriptor_set.ParseFromString(descriptor_set_file.read())
+
+    parse_cache = get_parse_cache()
+    added_files = 0
+    for file_descriptor in descriptor_set.file:
+        file_path = os.path.join(proto_include_dir, file_descriptor.name)
+        # skip files provided by protoc itself, e.g. well-known types
+        if not os.path.isfile(file_path):
+            continue
+
+        metadata = ProtoFileMetadata(
+            [service.name for service in file_descriptor.service],
+            file_descriptor.package if file_descriptor.package else None,
+            list(file_descriptor.dependency),
+            {
+                service.name: [method.name for method in service.method]
+                for service in file_descriptor.service
+            },
+        )
+        parse_cache.put(get_content_hash(file_path), metadata)
+        added_files += 1
+
+    return added_files
 
 
 class ProtoFileHandle:
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.__service_name = None
-        self.__imports: List[str] = []
 
-        with open(file_path, "r") as file:
-            parsed_data = Parser().parse(file.read())
+        metadata = parse_proto_file(file_path)
+        self.__service_names = metadata.service_names
+        self.__service_methods = metadata.service_methods
+        self.__package = metadata.package
+        self.__imports = metadata.imports
 
-        for element in parsed_data.file_elements:
-            if isinstance(element, ast.Service):
-                self.__service_name = str(element.name)
-            if isinstance(element, ast.Import):
-                self.__imports.append(str(element.name))
-
-        if self.__service_name is None:
+        if len(self.__service_names) == 0:
             raise RuntimeError("No service name found in proto file!")
 
     def get_package(self) -> str:
@@ -45,19 +291,14 @@ class ProtoFileHandle:
         Returns:
             str: The package of the proto file.
         """
-        package_id = None
-        with open(self.file_path, encoding="utf-8") as file:
-            for line in file:
-                if line.startswith("package"):
-                    package_id = line.split(" ")[1][:-2]
-
-        if package_id is None:
+        if self.__package is None:
             raise RuntimeError("No package ID found in proto file!")
 
-        return package_id
+        return self.__package
 
     def get_service_name(self) -> str:
-        """Get the name of the service.
+        """Get the name of the service. If the proto file defines multiple
+        services, the last one is returned.
 
         Raises:
             RuntimeError: In case there is no defined service in the proto file.
@@ -65,9 +306,25 @@ class ProtoFileHandle:
         Returns:
             str: The name of the service.
         """
-        if self.__service_name is None:
+        if len(self.__service_names) == 0:
             raise RuntimeError("No service name found in proto file!")
-        return self.__service_name
+        return self.__service_names[-1]
+
+    def get_service_names(self) -> List[str]:
+        """Get the names of all services defined in the proto file.
+
+        Returns:
+            List[str]: The names of the services.
+        """
+        return self.__service_names
+
+    def get_method_names(self) -> List[str]:
+        """Get the names of the methods of the service.
+
+        Returns:
+            List[str]: The names of the methods in order of definition.
+        """
+        return self.__service_methods.get(self.get_service_name(), [])
 
     def get_imports(self) -> List[str]:
         """Get the name of the imports.
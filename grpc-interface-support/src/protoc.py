@@ -0,0 +1,160 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from protoc_gen_velocitas import (
+    PLUGIN_NAME,
+    encode_parameter,
+    encode_service_options,
+)
+
+PLUGIN_LAUNCHER_NAME = f"protoc-gen-{PLUGIN_NAME}"
+PLUGIN_OUTPUT_DIR_NAME = f".{PLUGIN_NAME}"
+
+
+def get_output_stem(proto_file_path: str, proto_include_path: str) -> str:
+    """Return the path of the protoc outputs of a proto file without suffix,
+    relative to the output directory.
+
+    Args:
+        proto_file_path (str): The path to the proto file.
+        proto_include_path (str): The include path the proto file was compiled with.
+
+    Returns:
+        str: The relative path, e.g. "bcm/horn/v1/horn" for "<include>/bcm/horn/v1/horn.proto".
+    """
+    relative_path = os.path.relpath(proto_file_path, proto_include_path)
+    return os.path.splitext(relative_path)[0]
+
+
+def copy_protoc_outputs(
+    protoc_output_path: str,
+    target_path: str,
+    proto_file_path: str,
+    proto_include_path: str,
+    suffixes: List[str],
+) -> None:
+    """Copy the outputs of a batched protoc invocation which belong to a single
+    proto file to the target directory, keeping their relative location.
+
+    Args:
+        protoc_output_path (str): The output directory of the batched invocation.
+        target_path (str): The directory to copy the outputs to.
+        proto_file_path (str): The proto file whose outputs shall be copied.
+        proto_include_path (str): The include path the proto file was compiled with.
+        suffixes (List[str]): The suffixes of the outputs to copy, e.g. [".pb.h", ".pb.cc"].
+    """
+    output_stem = get_output_stem(proto_file_path, proto_include_path)
+    for suffix in suffixes:
+        source = os.path.join(protoc_output_path, f"{output_stem}{suffix}")
+        target = os.path.join(target_path, f"{output_stem}{suffix}")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(source, target)
+
+
+def write_plugin_launcher(directory_path: str) -> str:
+    """Write the executable which protoc invokes to run the Velocitas plugin
+    with the current interpreter. An up to date launcher is kept as is.
+
+    Args:
+        directory_path (str): The directory to write the launcher to.
+
+    Returns:
+        str: The path of the launcher.
+    """
+    plugin_path = os.path.join(os.path.dirname(__file__), "protoc_gen_velocitas.py")
+    content = f'#!/bin/sh\nexec "{sys.executable}" "{plugin_path}" "$@"\n'
+    launcher_path = os.path.join(directory_path, PLUGIN_LAUNCHER_NAME)
+    try:
+        with open(launcher_path, encoding="utf-8") as launcher:
+            if launcher.read() == content and os.access(launcher_path, os.X_OK):
+                return launcher_path
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(directory_path, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory_path)
+    with os.fdopen(file_descriptor, "w", encoding="utf-8") as launcher:
+        launcher.write(content)
+    os.chmod(temp_path, 0o755)
+    os.replace(temp_path, launcher_path)
+    return launcher_path
+
+
+def get_plugin_args(
+    launcher_path: str,
+    language: str,
+    template_dir: str,
+    output_path: str,
+    proto_include_path: str,
+    service_options: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[str]:
+    """Return the protoc arguments which run the Velocitas plugin. Its outputs
+    are written to a separate directory within the output directory, which is
+    created if needed.
+
+    Args:
+        launcher_path (str): The path of the launcher of the plugin.
+        language (str): The language to generate the files for, e.g. "python".
+        template_dir (str): The directory of the templates of the language.
+        output_path (str): The output directory of the protoc invocation.
+        proto_include_path (str): The include path the proto files are compiled with.
+        service_options (Optional[Dict[str, Dict[str, Any]]]): Mapping of
+            proto file to the options of the service it defines.
+
+    Returns:
+        List[str]: The arguments to pass to protoc.
+    """
+    plugin_output_path = os.path.join(output_path, PLUGIN_OUTPUT_DIR_NAME)
+    os.makedirs(plugin_output_path, exist_ok=True)
+    parameter = {"language": language, "templates": template_dir}
+    if service_options:
+        stem_options = {
+            get_output_stem(proto_file, proto_include_path).replace(
+                os.sep, "/"
+            ): options
+            for proto_file, options in service_options.items()
+        }
+        parameter["options"] = encode_service_options(stem_options)
+    return [
+        f"--plugin={PLUGIN_LAUNCHER_NAME}={launcher_path}",
+        f"--{PLUGIN_NAME}_opt={encode_parameter(parameter)}",
+        f"--{PLUGIN_NAME}_out={plugin_output_path}",
+    ]
+
+
+def get_plugin_output_path(
+    protoc_output_path: str, proto_file_path: str, proto_include_path: str
+) -> str:
+    """Return the directory containing the outputs of the Velocitas plugin
+    for a single proto file.
+
+    Args:
+        protoc_output_path (str): The output directory of the protoc invocation.
+        proto_file_path (str): The path to the proto file.
+        proto_include_path (str): The include path the proto file was compiled with.
+
+    Returns:
+        str: The path of the directory.
+    """
+    return os.path.join(
+        protoc_output_path,
+        PLUGIN_OUTPUT_DIR_NAME,
+        get_output_stem(proto_file_path, proto_include_path),
+    )
@@ -0,0 +1,938 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# protoc plugin which generates the client and server factories and the
+# service implementation stubs of the Velocitas service SDKs. It is invoked by
+# protoc within the same run which generates the gRPC code. The protobuf wire
+# format is decoded by hand, so the plugin does not depend on the protobuf
+# runtime, which is not available in every environment.
+
+import base64
+import json
+import os
+import sys
+import urllib.parse
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from velocitas_lib.text_utils import to_camel_case
+
+PLUGIN_NAME = "velocitas"
+
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_FIXED64 = 1
+WIRE_TYPE_LENGTH_DELIMITED = 2
+WIRE_TYPE_FIXED32 = 5
+
+# CodeGeneratorResponse.Feature.FEATURE_PROTO3_OPTIONAL
+FEATURE_PROTO3_OPTIONAL = 1
+
+SERVER_MODE_SYNC = "sync"
+SERVER_MODE_ASYNC = "async"
+SERVER_MODE_CALLBACK = "callback"
+
+# Options of `serverOptions` which map to a sync server option of the C++ builder
+CPP_SYNC_SERVER_OPTIONS = {
+    "minPollers": "MIN_POLLERS",
+    "maxPollers": "MAX_POLLERS",
+    "numCompletionQueues": "NUM_CQS",
+}
+SERVER_OPTION_KEYS = [
+    "resourceQuotaMaxThreads",
+    "resourceQuotaMemoryBytes",
+    *CPP_SYNC_SERVER_OPTIONS,
+]
+
+# Options of `channelOptions` which map directly to a gRPC channel argument
+CHANNEL_ARGUMENTS = {
+    "keepaliveTimeMs": "grpc.keepalive_time_ms",
+    "keepaliveTimeoutMs": "grpc.keepalive_timeout_ms",
+    "keepalivePermitWithoutCalls": "grpc.keepalive_permit_without_calls",
+    "maxSendMessageLength": "grpc.max_send_message_length",
+    "maxReceiveMessageLength": "grpc.max_receive_message_length",
+}
+CHANNEL_OPTION_KEYS = [
+    *CHANNEL_ARGUMENTS,
+    "compression",
+    "serviceConfig",
+    "cacheServiceLocation",
+    "poolSize",
+]
+# Channel argument distinguishing the channels of a pool from each other
+CHANNEL_POOL_INDEX_ARGUMENT = "velocitas.channel_pool_index"
+CHANNEL_COMPRESSIONS = ["none", "deflate", "gzip"]
+PYTHON_COMPRESSIONS = {
+    "none": "grpc.Compression.NoCompression",
+    "deflate": "grpc.Compression.Deflate",
+    "gzip": "grpc.Compression.Gzip",
+}
+CPP_COMPRESSIONS = {
+    "none": "GRPC_COMPRESS_NONE",
+    "deflate": "GRPC_COMPRESS_DEFLATE",
+    "gzip": "GRPC_COMPRESS_GZIP",
+}
+
+FieldValue = Union[int, bytes]
+Fields = Dict[int, List[FieldValue]]
+
+
+def decode_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Decode a base 128 varint.
+
+    Args:
+        data (bytes): The encoded data.
+        position (int): The position of the varint within the data.
+
+    Raises:
+        ValueError: If the varint is truncated.
+
+    Returns:
+        Tuple[int, int]: A tuple consisting of
+            [0] = The decoded value.
+            [1] = The position after the varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80 == 0:
+            return value, position
+        shift += 7
+
+
+def decode_message(data: bytes) -> Fields:
+    """Decode the fields of a serialized protobuf message. Varints are
+    decoded to int, all other values are kept as raw bytes.
+
+    Args:
+        data (bytes): The serialized message.
+
+    Raises:
+        ValueError: If the message is malformed or uses groups.
+
+    Returns:
+        Fields: Mapping of field number to all values of the field in order.
+    """
+    fields: Fields = {}
+    position = 0
+    while position < len(data):
+        key, position = decode_varint(data, position)
+        field_number = key >> 3
+        wire_type = key & 0x7
+        value: FieldValue
+        if wire_type == WIRE_TYPE_VARINT:
+            value, position = decode_varint(data, position)
+        elif wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            length, position = decode_varint(data, position)
+            value = data[position : position + length]
+            position += length
+        elif wire_type == WIRE_TYPE_FIXED64:
+            value = data[position : position + 8]
+            position += 8
+        elif wire_type == WIRE_TYPE_FIXED32:
+            value = data[position : position + 4]
+            position += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+
+        if position > len(data):
+            raise ValueError(f"Truncated value of field {field_number}")
+        fields.setdefault(field_number, []).append(value)
+    return fields
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as base 128 varint.
+
+    Args:
+        value (int): The value to encode.
+
+    Returns:
+        bytes: The encoded value.
+    """
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value == 0:
+            encoded.append(byte)
+            return bytes(encoded)
+        encoded.append(byte | 0x80)
+
+
+def encode_field(field_number: int, value: Union[int, str, bytes]) -> bytes:
+    """Encode a single field of a protobuf message.
+
+    Args:
+        field_number (int): The number of the field.
+        value (Union[int, str, bytes]): The value. Integers are encoded as
+            varint, strings and bytes as length delimited values.
+
+    Returns:
+        bytes: The encoded field.
+    """
+    if isinstance(value, int):
+        return encode_varint(field_number << 3 | WIRE_TYPE_VARINT) + encode_varint(
+            value
+        )
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return (
+        encode_varint(field_number << 3 | WIRE_TYPE_LENGTH_DELIMITED)
+        + encode_varint(len(value))
+        + value
+    )
+
+
+def get_string(fields: Fields, field_number: int) -> str:
+    values = fields.get(field_number, [b""])
+    value = values[-1]
+    return value.decode("utf-8") if isinstance(value, bytes) else ""
+
+
+def get_strings(fields: Fields, field_number: int) -> List[str]:
+    return [
+        value.decode("utf-8")
+        for value in fields.get(field_number, [])
+        if isinstance(value, bytes)
+    ]
+
+
+def get_messages(fields: Fields, field_number: int) -> List[Fields]:
+    return [
+        decode_message(value)
+        for value in fields.get(field_number, [])
+        if isinstance(value, bytes)
+    ]
+
+
+def get_bool(fields: Fields, field_number: int) -> bool:
+    return bool(fields.get(field_number, [0])[-1])
+
+
+class MethodDescriptor:
+    """The parts of a MethodDescriptorProto the generated code depends on."""
+
+    def __init__(
+        self,
+        name: str,
+        input_type: str,
+        output_type: str,
+        client_streaming: bool = False,
+        server_streaming: bool = False,
+    ):
+        self.name = name
+        self.input_type = input_type
+        self.output_type = output_type
+        self.client_streaming = client_streaming
+        self.server_streaming = server_streaming
+
+    @staticmethod
+    def decode(fields: Fields) -> "MethodDescriptor":
+        return MethodDescriptor(
+            get_string(fields, 1),
+            get_string(fields, 2),
+            get_string(fields, 3),
+            get_bool(fields, 5),
+            get_bool(fields, 6),
+        )
+
+
+class ServiceDescriptor:
+    """The parts of a ServiceDescriptorProto the generated code depends on."""
+
+    def __init__(self, name: str, methods: List[MethodDescriptor]):
+        self.name = name
+        self.methods = methods
+
+    @staticmethod
+    def decode(fields: Fields) -> "ServiceDescriptor":
+        return ServiceDescriptor(
+            get_string(fields, 1),
+            [MethodDescriptor.decode(method) for method in get_messages(fields, 2)],
+        )
+
+
+class FileDescriptor:
+    """The parts of a FileDescriptorProto the generated code depends on."""
+
+    def __init__(self, name: str, package: str, services: List[ServiceDescriptor]):
+        self.name = name
+        self.package = package
+        self.services = services
+
+    @staticmethod
+    def decode(fields: Fields) -> "FileDescriptor":
+        return FileDescriptor(
+            get_string(fields, 1),
+            get_string(fields, 2),
+            [ServiceDescriptor.decode(service) for service in get_messages(fields, 6)],
+        )
+
+    def get_output_stem(self) -> str:
+        """Return the path of the outputs of the file without suffix, e.g.
+        "bcm/horn/v1/horn" for "bcm/horn/v1/horn.proto"."""
+        return os.path.splitext(self.name)[0]
+
+
+class CodeGeneratorRequest:
+    """The parts of a CodeGeneratorRequest the plugin depends on."""
+
+    def __init__(
+        self,
+        files_to_generate: List[str],
+        parameter: str,
+        proto_files: List[FileDescriptor],
+    ):
+        self.files_to_generate = files_to_generate
+        self.parameter = parameter
+        self.proto_files = proto_files
+
+    @staticmethod
+    def decode(data: bytes) -> "CodeGeneratorRequest":
+        fields = decode_message(data)
+        return CodeGeneratorRequest(
+            get_strings(fields, 1),
+            get_string(fields, 2),
+            [FileDescriptor.decode(file) for file in get_messages(fields, 15)],
+        )
+
+
+def encode_response(files: Dict[str, str], error: str = "") -> bytes:
+    """Encode a CodeGeneratorResponse.
+
+    Args:
+        files (Dict[str, str]): Mapping of output path to file content.
+        error (str): The error message, if generation failed.
+
+    Returns:
+        bytes: The serialized response.
+    """
+    response = b""
+    if error:
+        response += encode_field(1, error)
+    response += encode_field(2, FEATURE_PROTO3_OPTIONAL)
+    for name, content in files.items():
+        response += encode_field(15, encode_field(1, name) + encode_field(15, content))
+    return response
+
+
+def encode_parameter(options: Dict[str, str]) -> str:
+    """Encode the options to be passed via `--velocitas_opt`. The values are
+    percent-encoded, so they may contain commas and equal signs.
+
+    Args:
+        options (Dict[str, str]): Mapping of option name to value.
+
+    Returns:
+        str: Comma separated options, e.g. "language=python,templates=/t".
+    """
+    return ",".join(
+        f"{key}={urllib.parse.quote(value, safe='/')}" for key, value in options.items()
+    )
+
+
+def parse_parameter(parameter: str) -> Dict[str, str]:
+    """Parse the parameter passed via `--velocitas_opt`.
+
+    Args:
+        parameter (str): Comma separated options as encoded by
+            `encode_parameter`, e.g. "language=python,templates=/t".
+
+    Returns:
+        Dict[str, str]: Mapping of option name to value.
+    """
+    options: Dict[str, str] = {}
+    for option in parameter.split(","):
+        if option:
+            key, _, value = option.partition("=")
+            options[key.strip()] = urllib.parse.unquote(value.strip())
+    return options
+
+
+def encode_service_options(service_options: Dict[str, Dict[str, Any]]) -> str:
+    """Encode the options of the services to be passed as plugin parameter.
+
+    Args:
+        service_options (Dict[str, Dict[str, Any]]): Mapping of the output
+            stem of a proto file to the options of its service.
+
+    Returns:
+        str: The encoded options, which contain neither commas nor colons.
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps(service_options, sort_keys=True).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_service_options(value: str) -> Dict[str, Dict[str, Any]]:
+    """Decode options encoded by `encode_service_options`.
+
+    Args:
+        value (str): The encoded options.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Mapping of the output stem of a proto file
+            to the options of its service.
+    """
+    service_options: Dict[str, Dict[str, Any]] = json.loads(
+        base64.urlsafe_b64decode(value.encode("ascii"))
+    )
+    return service_options
+
+
+def get_server_mode(options: Dict[str, Any], supported_modes: List[str]) -> str:
+    """Return the server mode selected by the `serverMode` option.
+
+    Args:
+        options (Dict[str, Any]): The options of the service.
+        supported_modes (List[str]): The modes supported by the language.
+
+    Raises:
+        ValueError: If the mode is not supported.
+
+    Returns:
+        str: The server mode, "sync" if none is selected.
+    """
+    server_mode = str(options.get("serverMode", SERVER_MODE_SYNC))
+    if server_mode not in supported_modes:
+        raise ValueError(
+            f"Unsupported serverMode {server_mode!r}, expected one of "
+            f"{', '.join(supported_modes)}"
+        )
+    return server_mode
+
+
+def get_channel_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the validated `channelOptions` of a service.
+
+    Args:
+        options (Dict[str, Any]): The options of the service.
+
+    Raises:
+        ValueError: If an option is unknown or has an invalid value.
+
+    Returns:
+        Dict[str, Any]: The channel options, empty if none are set.
+    """
+    channel_options: Dict[str, Any] = options.get("channelOptions", {})
+    unknown_keys = sorted(set(channel_options) - set(CHANNEL_OPTION_KEYS))
+    if len(unknown_keys) > 0:
+        raise ValueError(f"Unknown channelOptions {', '.join(unknown_keys)}")
+    for key in CHANNEL_ARGUMENTS:
+        if key in channel_options and not isinstance(channel_options[key], int):
+            raise ValueError(f"channelOptions {key} must be an integer")
+    compression = channel_options.get("compression", "none")
+    if compression not in CHANNEL_COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression {compression!r}, expected one of "
+            f"{', '.join(CHANNEL_COMPRESSIONS)}"
+        )
+    if not isinstance(channel_options.get("serviceConfig", {}), dict):
+        raise ValueError("channelOptions serviceConfig must be an object")
+    pool_size = channel_options.get("poolSize", 1)
+    if not isinstance(pool_size, int) or pool_size <= 0:
+        raise ValueError("channelOptions poolSize must be a positive integer")
+    return channel_options
+
+
+def get_channel_arguments(
+    channel_options: Dict[str, Any],
+) -> List[Tuple[str, Union[int, str]]]:
+    """Convert channel options into gRPC channel arguments. A service config,
+    which may define retry policies and timeouts, enables retries as well.
+
+    Args:
+        channel_options (Dict[str, Any]): The validated channel options.
+
+    Returns:
+        List[Tuple[str, Union[int, str]]]: The name and value of each argument.
+    """
+    arguments: List[Tuple[str, Union[int, str]]] = [
+        (argument, int(channel_options[key]))
+        for key, argument in CHANNEL_ARGUMENTS.items()
+        if key in channel_options
+    ]
+    if "serviceConfig" in channel_options:
+        arguments.append(
+            (
+                "grpc.service_config",
+                json.dumps(channel_options["serviceConfig"], sort_keys=True),
+            )
+        )
+        arguments.append(("grpc.enable_retries", 1))
+    return arguments
+
+
+def create_cpp_channel_arguments(channel_options: Dict[str, Any]) -> str:
+    """Create the statements which apply the channel options to the
+    `grpc::ChannelArguments arguments` of the client factory.
+
+    Args:
+        channel_options (Dict[str, Any]): The validated channel options.
+
+    Returns:
+        str: The statements, each on a new line, or an empty string.
+    """
+    lines: List[str] = []
+    for name, value in get_channel_arguments(channel_options):
+        setter = "SetInt" if isinstance(value, int) else "SetString"
+        lines.append(f"arguments.{setter}({json.dumps(name)}, {json.dumps(value)});")
+    if "compression" in channel_options:
+        lines.append(
+            "arguments.SetCompressionAlgorithm("
+            f"{CPP_COMPRESSIONS[channel_options['compression']]});"
+        )
+    return "".join(f"\n    {line}" for line in lines)
+
+
+def render_template(
+    template_dir: str, template_name: str, variables: Dict[str, str]
+) -> str:
+    """Render a template the same way `velocitas_lib.templates.copy_templates`
+    does, but return the result instead of writing it.
+
+    Args:
+        template_dir (str): The directory containing the templates.
+        template_name (str): The path of the template relative to the directory.
+        variables (Dict[str, str]): Name to value mapping of the placeholders.
+
+    Returns:
+        str: The rendered template.
+    """
+    with open(os.path.join(template_dir, template_name), encoding="utf-8") as file:
+        lines = file.readlines()
+
+    rendered_lines = []
+    for line in lines:
+        for key, value in variables.items():
+            line = line.replace("${{ " + key + " }}", value)
+        rendered_lines.append(line)
+    return "".join(rendered_lines)
+
+
+def to_cpp_type(proto_type: str) -> str:
+    """Convert a fully qualified proto type name into a C++ type name.
+
+    Args:
+        proto_type (str): The type name, e.g. ".bcm.horn.v1.StopRequest".
+
+    Returns:
+        str: The C++ type name, e.g. "::bcm::horn::v1::StopRequest".
+    """
+    return "::" + proto_type.lstrip(".").replace(".", "::")
+
+
+def create_python_method_stubs(
+    service: ServiceDescriptor, set_status_code: bool, is_async: bool = False
+) -> str:
+    """Create the servicer methods of a service which are not implemented.
+
+    Args:
+        service (ServiceDescriptor): The service.
+        set_status_code (bool): Whether the methods set the UNIMPLEMENTED
+            status code on the context before raising.
+        is_async (bool): Whether the methods are coroutines, as used by
+            `grpc.aio` servers.
+
+    Returns:
+        str: The methods, indented for the class body except for the first
+            line, which is indented by the template.
+    """
+    lines: List[str] = []
+    for method in service.methods:
+        if len(lines) > 0:
+            lines.append("")
+        request_name = "request_iterator" if method.client_streaming else "request"
+        definition = "async def" if is_async else "def"
+        lines.append(f"    {definition} {method.name}(self, {request_name}, context):")
+        if set_status_code:
+            lines.append("        context.set_code(grpc.StatusCode.UNIMPLEMENTED)")
+            lines.append('        context.set_details("Method not implemented!")')
+        lines.append('        raise NotImplementedError("Method not implemented!")')
+
+    if len(lines) == 0:
+        lines.append("    pass")
+    return "\n".join(lines).lstrip()
+
+
+def generate_python_files(
+    file: FileDescriptor,
+    service: ServiceDescriptor,
+    template_dir: str,
+    options: Dict[str, Any],
+) -> Dict[str, str]:
+    """Generate the factories and stubs of a service of the Python SDK.
+
+    Args:
+        file (FileDescriptor): The file defining the service.
+        service (ServiceDescriptor): The service.
+        template_dir (str): The directory of the Python templates.
+        options (Dict[str, Any]): The options of the service.
+
+    Returns:
+        Dict[str, str]: Mapping of file name to file content.
+    """
+    is_async = (
+        get_server_mode(options, [SERVER_MODE_SYNC, SERVER_MODE_ASYNC])
+        == SERVER_MODE_ASYNC
+    )
+    if "serverOptions" in options:
+        raise ValueError("serverOptions are only supported for C++")
+    server_factory_template = (
+        "ServiceNameServiceAsyncServerFactory.py"
+        if is_async
+        else "ServiceNameServiceServerFactory.py"
+    )
+    channel_options = get_channel_options(options)
+    channel_arguments = get_channel_arguments(channel_options)
+    compression = channel_options.get("compression")
+
+    service_name = service.name
+    grpc_file_name_prefix = f"{os.path.basename(file.get_output_stem())}_pb2_grpc"
+    grpc_module = f"{service_name.lower()}_service_sdk.{grpc_file_name_prefix}"
+    factory_variables = {
+        "service_name": service_name,
+        "service_name_lower": service_name.lower(),
+        "grpc_file_name_prefix": grpc_file_name_prefix,
+        "channel_options": "".join(
+            [
+                "[",
+                *[
+                    f"\n    ({json.dumps(name)}, {json.dumps(value)}),"
+                    for name, value in channel_arguments
+                ],
+                "\n]" if len(channel_arguments) > 0 else "]",
+            ]
+        ),
+        "compression": PYTHON_COMPRESSIONS[compression] if compression else "None",
+        "cache_service_location": str(
+            bool(channel_options.get("cacheServiceLocation", False))
+        ),
+        "channel_pool_size": str(channel_options.get("poolSize", 1)),
+        "channel_pool_index_argument": CHANNEL_POOL_INDEX_ARGUMENT,
+    }
+    stub_variables = {
+        "imports": f"import grpc{os.linesep}from {grpc_module} import {service_name}Servicer",
+        "service_name": service_name,
+        "service_name_parent_postfix": "Servicer",
+        "service_name_postfix": "ServiceStub",
+        "service_source_code": create_python_method_stubs(service, True, is_async),
+    }
+    impl_variables = {
+        "imports": f"from {service_name}ServiceStub import {service_name}ServiceStub",
+        "service_name": service_name,
+        "service_name_parent_postfix": "ServiceStub",
+        "service_name_postfix": "Service",
+        "service_source_code": create_python_method_stubs(service, False, is_async),
+    }
+    return {
+        f"{service_name}ServiceClientFactory.py": render_template(
+            template_dir, "ServiceNameServiceClientFactory.py", factory_variables
+        ),
+        f"{service_name}ServiceServerFactory.py": render_template(
+            template_dir, server_factory_template, factory_variables
+        ),
+        f"{service_name}ServiceStub.py": render_template(
+            template_dir, "ServiceImpl.py", stub_variables
+        ),
+        f"{service_name}ServiceImpl.py": render_template(
+            template_dir, "ServiceImpl.py", impl_variables
+        ),
+    }
+
+
+def get_cpp_method_signature(
+    method: MethodDescriptor, is_callback: bool
+) -> Tuple[str, List[Tuple[str, str]]]:
+    """Return the signature of a method of the service base class, in the
+    same form as generated by grpc_cpp_plugin.
+
+    Args:
+        method (MethodDescriptor): The method.
+        is_callback (bool): Whether the method belongs to the `CallbackService`
+            instead of the synchronous `Service`.
+
+    Returns:
+        Tuple[str, List[Tuple[str, str]]]: A tuple consisting of
+            [0] = The return type.
+            [1] = The type and name of each parameter.
+    """
+    input_type = to_cpp_type(method.input_type)
+    output_type = to_cpp_type(method.output_type)
+    request = (f"const {input_type}*", "request")
+    response = (f"{output_type}*", "response")
+
+    if is_callback:
+        context = ("::grpc::CallbackServerContext*", "context")
+        if method.client_streaming and method.server_streaming:
+            return f"::grpc::ServerBidiReactor< {input_type}, {output_type}>*", [
+                context
+            ]
+        if method.client_streaming:
+            return f"::grpc::ServerReadReactor< {input_type}>*", [context, response]
+        if method.server_streaming:
+            return f"::grpc::ServerWriteReactor< {output_type}>*", [context, request]
+        return "::grpc::ServerUnaryReactor*", [context, request, response]
+
+    context = ("::grpc::ServerContext*", "context")
+    if method.client_streaming and method.server_streaming:
+        stream = (
+            f"::grpc::ServerReaderWriter< {output_type}, {input_type}>*",
+            "stream",
+        )
+        return "::grpc::Status", [context, stream]
+    if method.client_streaming:
+        reader = (f"::grpc::ServerReader< {input_type}>*", "reader")
+        return "::grpc::Status", [context, reader, response]
+    if method.server_streaming:
+        writer = (f"::grpc::ServerWriter< {output_type}>*", "writer")
+        return "::grpc::Status", [context, request, writer]
+    return "::grpc::Status", [context, request, response]
+
+
+def create_cpp_header_code(service: ServiceDescriptor, is_callback: bool) -> str:
+    lines = []
+    for method in service.methods:
+        return_type, parameters = get_cpp_method_signature(method, is_callback)
+        parameter_list = ", ".join(
+            f"{type_name} {name}" for type_name, name in parameters
+        )
+        lines.append(f"    {return_type} {method.name}({parameter_list}) override;")
+    return "\n".join(lines)
+
+
+def create_cpp_source_code(
+    service: ServiceDescriptor, class_name: str, is_callback: bool
+) -> str:
+    lines: List[str] = []
+    for method in service.methods:
+        if len(lines) > 0:
+            lines.append("")
+        return_type, parameters = get_cpp_method_signature(method, is_callback)
+        parameter_list = ", ".join(
+            f"{type_name} {name}" for type_name, name in parameters
+        )
+        lines.append(f"{return_type} {class_name}::{method.name}({parameter_list}) {{")
+        if not is_callback:
+            lines.extend(f"  (void) {name};" for _, name in parameters)
+            lines.append(
+                '  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");'
+            )
+        elif method.client_streaming or method.server_streaming:
+            lines.extend(f"  (void) {name};" for _, name in parameters)
+            lines.append(
+                "  // Without a reactor the call is finished with UNIMPLEMENTED"
+            )
+            lines.append("  return nullptr;")
+        else:
+            lines.extend(f"  (void) {name};" for _, name in parameters[1:])
+            lines.append("  auto* reactor = context->DefaultReactor();")
+            lines.append(
+                '  reactor->Finish(::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, ""));'
+            )
+            lines.append("  return reactor;")
+        lines.append("}")
+    return "\n".join(lines)
+
+
+def get_server_options(options: Dict[str, Any]) -> Dict[str, int]:
+    """Return the validated `serverOptions` of a service.
+
+    Args:
+        options (Dict[str, Any]): The options of the service.
+
+    Raises:
+        ValueError: If an option is unknown or not a positive integer.
+
+    Returns:
+        Dict[str, int]: The server options, empty if none are set.
+    """
+    server_options: Dict[str, int] = options.get("serverOptions", {})
+    for key, value in server_options.items():
+        if key not in SERVER_OPTION_KEYS:
+            raise ValueError(f"Unknown serverOptions {key}")
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(f"serverOptions {key} must be a positive integer")
+    return server_options
+
+
+def create_cpp_server_builder_settings(
+    server_options: Dict[str, int], service_name: str
+) -> str:
+    """Create the statements which apply the server options to the
+    `grpc::ServerBuilder builder` of the server factory.
+
+    Args:
+        server_options (Dict[str, int]): The validated server options.
+        service_name (str): The name of the service, used to name the quota.
+
+    Returns:
+        str: The statements, each on a new line, or an empty string.
+    """
+    lines: List[str] = []
+    if "resourceQuotaMaxThreads" in server_options or (
+        "resourceQuotaMemoryBytes" in server_options
+    ):
+        lines.append(f'grpc::ResourceQuota resourceQuota("{service_name}");')
+        if "resourceQuotaMaxThreads" in server_options:
+            lines.append(
+                f"resourceQuota.SetMaxThreads({server_options['resourceQuotaMaxThreads']});"
+            )
+        if "resourceQuotaMemoryBytes" in server_options:
+            lines.append(
+                f"resourceQuota.Resize({server_options['resourceQuotaMemoryBytes']});"
+            )
+        lines.append("builder.SetResourceQuota(resourceQuota);")
+    for key, sync_server_option in CPP_SYNC_SERVER_OPTIONS.items():
+        if key in server_options:
+            lines.append(
+                "builder.SetSyncServerOption(grpc::ServerBuilder::SyncServerOption::"
+                f"{sync_server_option}, {server_options[key]});"
+            )
+    return "".join(f"\n    {line}" for line in lines)
+
+
+def generate_cpp_files(
+    file: FileDescriptor,
+    service: ServiceDescriptor,
+    template_dir: str,
+    options: Dict[str, Any],
+) -> Dict[str, str]:
+    """Generate the factories and stubs of a service of the C++ SDK.
+
+    Args:
+        file (FileDescriptor): The file defining the service.
+        service (ServiceDescriptor): The service.
+        template_dir (str): The directory of the C++ templates.
+        options (Dict[str, Any]): The options of the service.
+
+    Returns:
+        Dict[str, str]: Mapping of file name to file content.
+    """
+    is_callback = (
+        get_server_mode(options, [SERVER_MODE_SYNC, SERVER_MODE_CALLBACK])
+        == SERVER_MODE_CALLBACK
+    )
+    channel_options = get_channel_options(options)
+    service_name = service.name
+    service_name_camel_case = to_camel_case(service_name)
+    service_include_dir = "/".join(
+        ["services", service_name.lower(), *filter(None, [os.path.dirname(file.name)])]
+    )
+    variables = {
+        "service_name": service_name,
+        "service_name_lower": service_name.lower(),
+        "service_name_camel_case": service_name_camel_case,
+        "package_id": file.package.replace(".", "::"),
+        "service_include_dir": service_include_dir,
+        "grpc_service_header_path": f"{service_include_dir}/{os.path.basename(file.get_output_stem())}.grpc.pb.h",
+        "service_base_class": "CallbackService" if is_callback else "Service",
+        "server_api": "callback" if is_callback else "synchronous",
+        "channel_arguments": create_cpp_channel_arguments(channel_options),
+        "channel_pool_size": str(channel_options.get("poolSize", 1)),
+        "channel_pool_index_argument": CHANNEL_POOL_INDEX_ARGUMENT,
+        "cache_service_location": str(
+            bool(channel_options.get("cacheServiceLocation", False))
+        ).lower(),
+        "server_builder_settings": create_cpp_server_builder_settings(
+            get_server_options(options), service_name
+        ),
+        "service_header_code": create_cpp_header_code(service, is_callback),
+        "service_source_code": create_cpp_source_code(
+            service, f"{service_name_camel_case}Service", is_callback
+        ),
+    }
+
+    files = {}
+    for template_name, suffix in [
+        ("ServiceNameServiceClientFactory.h", "ServiceClientFactory.h"),
+        ("ServiceNameServiceClientFactory.cc", "ServiceClientFactory.cc"),
+        ("ServiceNameServiceServerFactory.h", "ServiceServerFactory.h"),
+        ("ServiceNameServiceServerFactory.cc", "ServiceServerFactory.cc"),
+        ("ServiceImpl.h", "ServiceImpl.h"),
+        ("ServiceImpl.cpp", "ServiceImpl.cpp"),
+    ]:
+        files[f"{service_name_camel_case}{suffix}"] = render_template(
+            template_dir, template_name, variables
+        )
+    return files
+
+
+LANGUAGE_GENERATORS: Dict[
+    str,
+    Callable[[FileDescriptor, ServiceDescriptor, str, Dict[str, Any]], Dict[str, str]],
+] = {
+    "python": generate_python_files,
+    "cpp": generate_cpp_files,
+}
+
+
+def generate(request: CodeGeneratorRequest) -> Dict[str, str]:
+    """Generate the files of all services within the files to generate. The
+    files of a proto file are placed in a directory named after its output
+    stem. Like the SDK generators, only the last service of a file is used.
+    The options of the services are passed encoded as `options` parameter.
+
+    Args:
+        request (CodeGeneratorRequest): The request sent by protoc.
+
+    Raises:
+        ValueError: If the language or the template directory is missing.
+
+    Returns:
+        Dict[str, str]: Mapping of output path to file content.
+    """
+    options = parse_parameter(request.parameter)
+    language = options.get("language", "")
+    if language not in LANGUAGE_GENERATORS:
+        raise ValueError(f"Unsupported language {language!r}")
+    if "templates" not in options:
+        raise ValueError("Missing option 'templates'")
+
+    service_options = (
+        decode_service_options(options["options"]) if "options" in options else {}
+    )
+    proto_files = {file.name: file for file in request.proto_files}
+    outputs: Dict[str, str] = {}
+    for file_name in request.files_to_generate:
+        file = proto_files[file_name]
+        if len(file.services) == 0:
+            continue
+        files = LANGUAGE_GENERATORS[language](
+            file,
+            file.services[-1],
+            options["templates"],
+            service_options.get(file.get_output_stem(), {}),
+        )
+        for name, content in files.items():
+            outputs[f"{file.get_output_stem()}/{name}"] = content
+    return outputs
+
+
+def main() -> None:
+    request_data = sys.stdin.buffer.read()
+    try:
+        response = encode_response(generate(CodeGeneratorRequest.decode(request_data)))
+    except (OSError, ValueError, KeyError) as error:
+        response = encode_response({}, f"{PLUGIN_NAME}: {error}")
+    sys.stdout.buffer.write(response)
+    sys.stdout.buffer.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,25 +13,48 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import glob
+import importlib.metadata
+import importlib.resources
+import importlib.util
+import json
 import os
+import re
 import shutil
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import proto
-from generator import GrpcServiceSdkGenerator, GrpcServiceSdkGeneratorFactory
-from proto import ProtoFileHandle
-from velocitas_lib import get_package_path, get_workspace_dir, templates
-from velocitas_lib.file_utils import (
-    capture_area_in_file,
-    replace_text_in_file,
+from cache import hash_directory
+from generator import (
+    COMMON_TYPES_SDK_NAME,
+    GrpcServiceSdkGenerator,
+    GrpcServiceSdkGeneratorFactory,
 )
-from velocitas_lib.templates import CopySpec, copy_templates
-from velocitas_lib.text_utils import (
-    replace_item_in_list,
-    replace_text_area,
+from import_graph import normalize_path
+from output_capture import redirect_output
+from protoc import (
+    copy_protoc_outputs,
+    get_output_stem,
+    get_plugin_args,
+    get_plugin_output_path,
+    write_plugin_launcher,
+)
+from tracing import TRACER
+from velocitas_lib import (
+    get_package_path,
+    get_project_cache_dir,
+    get_workspace_dir,
 )
+from velocitas_lib.file_utils import replace_text_in_file
+from velocitas_lib.templates import CopySpec, copy_templates
+
+GRPCIO_TOOLS_DISTRIBUTION = "grpcio-tools"
+# Compatible with the grpcio runtime requirement of the generated packages
+GRPCIO_TOOLS_MIN_VERSION = (1, 57, 0)
+GRPCIO_TOOLS_MAX_VERSION = (2, 0, 0)
 
 
 def get_required_sdk_version_python() -> str:
@@ -52,48 +75,363 @@ def get_template_dir() -> str:
     )
 
 
-class GrpcCodeExtractor:
-    """
-    Provides methods for extracting code from generated gRPC python files.
+def get_plugin_args_python(
+    output_path: str,
+    proto_include_path: str,
+    service_options: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[str]:
+    launcher_path = write_plugin_launcher(
+        os.path.join(get_project_cache_dir(), "tooling")
+    )
+    plugin_args: List[str] = get_plugin_args(
+        launcher_path,
+        "python",
+        get_template_dir(),
+        output_path,
+        proto_include_path,
+        service_options,
+    )
+    return plugin_args
+
+
+def parse_release(version: str) -> Tuple[int, ...]:
+    """Parse the release segment of a version, ignoring any suffixes.
+
+    Args:
+        version (str): The version, e.g. "1.62.2" or "1.63.0rc1".
+
+    Returns:
+        Tuple[int, ...]: The numeric components, e.g. (1, 62, 2).
+            Empty if the version does not start with a number.
     """
+    match = re.match(r"^(\d+(?:\.\d+)*)", version)
+    if match is None:
+        return ()
+    return tuple(int(component) for component in match.group(1).split("."))
 
-    file_name: str
-    file_name_prefix: str
 
-    def __init__(
-        self, proto_file: ProtoFileHandle, base_path: str, source_path: str = "."
-    ):
-        self.__proto_file = proto_file
-        self.__base_path = base_path
-        self.__source_path = source_path
-
-        file_prefix = Path(self.__proto_file.file_path).stem
-        self.file_name_prefix = f"{file_prefix}_pb2_grpc"
-        self.file_name = f"{self.file_name_prefix}.py"
-        self.grpc_source_path = os.path.join(
-            self.__base_path,
-            self.__source_path,
-            f"{self.file_name}",
+class PythonToolingManager:
+    """
+    Makes sure a compatible version of grpcio-tools is installed. The
+    installed distribution is checked via its metadata and pip is only
+    invoked if it is missing or incompatible. The verified state is recorded,
+    so later runs only need to compare the installed version against it.
+    """
+
+    def __init__(self, state_file_path: str):
+        self.__state_file_path = state_file_path
+
+    @staticmethod
+    def get_requirement() -> str:
+        """Return the pip requirement of the compatible version range.
+
+        Returns:
+            str: The requirement, e.g. "grpcio-tools>=1.57.0,<2.0.0".
+        """
+        min_version = ".".join(str(part) for part in GRPCIO_TOOLS_MIN_VERSION)
+        max_version = ".".join(str(part) for part in GRPCIO_TOOLS_MAX_VERSION)
+        return f"{GRPCIO_TOOLS_DISTRIBUTION}>={min_version},<{max_version}"
+
+    @staticmethod
+    def is_compatible(version: str) -> bool:
+        """Check whether a version of grpcio-tools is within the compatible range.
+
+        Args:
+            version (str): The version to check.
+
+        Returns:
+            bool: True if the version is compatible. False otherwise.
+        """
+        release = parse_release(version)
+        return GRPCIO_TOOLS_MIN_VERSION <= release < GRPCIO_TOOLS_MAX_VERSION
+
+    @staticmethod
+    def get_installed_version() -> Optional[str]:
+        """Return the installed version of grpcio-tools.
+
+        Returns:
+            Optional[str]: The version or None if it is not installed.
+        """
+        try:
+            return importlib.metadata.version(GRPCIO_TOOLS_DISTRIBUTION)
+        except importlib.metadata.PackageNotFoundError:
+            return None
+
+    def is_installed(self) -> bool:
+        """Check whether a compatible version of grpcio-tools is installed.
+
+        Returns:
+            bool: True if it is installed. False otherwise.
+        """
+        installed_version = self.get_installed_version()
+        return (
+            installed_version is not None
+            and self.is_compatible(installed_version)
+            and importlib.util.find_spec("grpc_tools") is not None
         )
 
-    def create_source_stub_code(self) -> List[str]:
-        service_name = self.__proto_file.get_service_name()
+    def ensure_installed(self) -> None:
+        """Install grpcio-tools unless a compatible version is available already."""
+        installed_version = self.get_installed_version()
+        if installed_version is not None and self.is_compatible(installed_version):
+            if self.__is_verified(installed_version):
+                return
+            if importlib.util.find_spec("grpc_tools") is not None:
+                self.__record(installed_version)
+                return
+
+        TRACER.check_call(["pip", "install", self.get_requirement()])
+        importlib.invalidate_caches()
+        installed_version = self.get_installed_version()
+        if installed_version is not None:
+            self.__record(installed_version)
+
+    def __get_state(self) -> Dict[str, str]:
+        return {
+            "requirement": self.get_requirement(),
+            "python": sys.executable,
+        }
 
-        source_content: List[str] = capture_area_in_file(
-            open(self.grpc_source_path, encoding="utf-8"),
-            f"class {service_name}Servicer(object):",
-            f"def add_{service_name}Servicer_to_server(servicer, server):",
-        )
+    def __is_verified(self, installed_version: str) -> bool:
+        try:
+            with open(self.__state_file_path, encoding="utf-8") as state_file:
+                state = json.load(state_file)
+        except (FileNotFoundError, ValueError):
+            return False
+        return bool(state == {**self.__get_state(), "version": installed_version})
+
+    def __record(self, installed_version: str) -> None:
+        os.makedirs(os.path.dirname(self.__state_file_path), exist_ok=True)
+        with open(self.__state_file_path, "w", encoding="utf-8") as state_file:
+            json.dump(
+                {**self.__get_state(), "version": installed_version},
+                state_file,
+                indent=2,
+                sort_keys=True,
+            )
+
+
+class GrpcToolsProtoc:
+    """
+    Runs the protoc compiler bundled with grpcio-tools within the current
+    process. grpcio-tools is imported once on first use, which avoids the
+    interpreter startup and import cost of a `python3 -m grpc_tools.protoc`
+    subprocess per invocation.
+    """
+
+    def __init__(self) -> None:
+        self.__main: Optional[Callable[[List[str]], int]] = None
+        self.__well_known_protos_path = ""
+
+    def __load(self) -> Callable[[List[str]], int]:
+        if self.__main is None:
+            from grpc_tools import protoc
+
+            self.__main = protoc.main
+            self.__well_known_protos_path = str(
+                importlib.resources.files("grpc_tools") / "_proto"
+            )
+        return self.__main
+
+    def run(self, args: List[str]) -> str:
+        """Run protoc with the given arguments.
+
+        Args:
+            args (List[str]): The command line arguments, excluding the program name.
+
+        Raises:
+            subprocess.CalledProcessError: If protoc reports an error.
+
+        Returns:
+            str: The diagnostics written by protoc.
+        """
+        main = self.__load()
+        command = ["grpc_tools.protoc", *args, f"-I{self.__well_known_protos_path}"]
+        with TRACER.subprocess_stage(command):
+            with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as output_file:
+                with redirect_output(output_file.fileno()):
+                    return_code = main(command)
+                output_file.seek(0)
+                diagnostics = output_file.read()
+
+            if return_code != 0:
+                raise subprocess.CalledProcessError(
+                    return_code, command, output=diagnostics
+                )
+        return diagnostics
+
+
+GRPC_TOOLS_PROTOC = GrpcToolsProtoc()
+
+
+def run_protoc(args: List[str]) -> None:
+    """Run protoc in-process and print its diagnostics.
+
+    Args:
+        args (List[str]): The command line arguments, excluding the program name.
+    """
+    try:
+        diagnostics = GRPC_TOOLS_PROTOC.run(args)
+    except subprocess.CalledProcessError as error:
+        print(error.output, end="")
+        raise
+    print(diagnostics, end="")
+
+
+def is_distribution_installed(distribution_name: str) -> bool:
+    """Check whether a distribution is installed in the running Python environment.
+
+    Args:
+        distribution_name (str): The name of the distribution.
+
+    Returns:
+        bool: True if the distribution is installed. False otherwise.
+    """
+    try:
+        importlib.metadata.version(distribution_name)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+def normalize_distribution_name(name: str) -> str:
+    """Normalize a distribution name the way it is used in wheel file names.
 
-        # Remove leading whitespaces because they do not match the expected python intendation
-        if len(source_content) > 0:
-            source_content[0] = source_content[0].lstrip()
+    Args:
+        name (str): The distribution name, e.g. "seats-service-sdk".
 
-        return source_content
+    Returns:
+        str: The normalized name, e.g. "seats_service_sdk".
+    """
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+class WheelhouseInstaller:
+    """
+    Installs generated packages in a single batch. Every package is built
+    into a wheel within a local wheelhouse, which is reused as long as the
+    sources of the package do not change. All wheels are then installed by a
+    single pip invocation instead of one dependency resolution and build per
+    package.
+    """
+
+    STATE_FILE_NAME = "wheelhouse.json"
+
+    def __init__(self, wheelhouse_path: str):
+        self.__wheelhouse_path = wheelhouse_path
+        self.__state_file_path = os.path.join(wheelhouse_path, self.STATE_FILE_NAME)
+        self.__pending_packages: Dict[str, str] = {}
+
+    def add_package(self, distribution_name: str, package_directory_path: str) -> None:
+        """Schedule a package for installation by `install_pending_packages`.
+
+        Args:
+            distribution_name (str): The name of the distribution as given in
+                its pyproject.toml.
+            package_directory_path (str): The directory containing the package.
+        """
+        self.__pending_packages[distribution_name] = package_directory_path
+
+    def install_pending_packages(self) -> None:
+        """Build the wheels of all scheduled packages, if their sources changed,
+        and install them with a single pip invocation."""
+        if len(self.__pending_packages) == 0:
+            return
+
+        state = self.__load_state()
+        wheel_files: List[str] = []
+        outdated_packages: Dict[str, str] = {}
+        for distribution_name, package_path in self.__pending_packages.items():
+            source_hash = hash_directory(package_path)
+            entry = state.get(distribution_name, {})
+            wheel_file = entry.get("wheel", "")
+            if entry.get("hash") == source_hash and os.path.isfile(
+                os.path.join(self.__wheelhouse_path, wheel_file)
+            ):
+                print(f"Wheel of {distribution_name} is up to date")
+                wheel_files.append(wheel_file)
+            else:
+                outdated_packages[distribution_name] = source_hash
+
+        if len(outdated_packages) > 0:
+            built_wheels = self.__build_wheels(
+                [self.__pending_packages[name] for name in outdated_packages]
+            )
+            for distribution_name, source_hash in outdated_packages.items():
+                wheel_file = built_wheels[
+                    normalize_distribution_name(distribution_name)
+                ]
+                state[distribution_name] = {"hash": source_hash, "wheel": wheel_file}
+                wheel_files.append(wheel_file)
+            self.__save_state(state)
+
+            # The version of generated packages never changes, hence pip would
+            # keep an installed package with outdated content.
+            TRACER.check_call(["pip", "uninstall", "-y", *outdated_packages])
+
+        TRACER.check_call(
+            [
+                "pip",
+                "install",
+                "--find-links",
+                self.__wheelhouse_path,
+                *[os.path.join(self.__wheelhouse_path, file) for file in wheel_files],
+            ]
+        )
+        self.__pending_packages.clear()
+
+    def remove_package(self, distribution_name: str) -> None:
+        """Uninstall a package and remove its wheel from the wheelhouse.
+
+        Args:
+            distribution_name (str): The name of the distribution as given in
+                its pyproject.toml.
+        """
+        self.__pending_packages.pop(distribution_name, None)
+        state = self.__load_state()
+        entry = state.pop(distribution_name, None)
+        if entry is not None:
+            wheel_path = os.path.join(self.__wheelhouse_path, entry["wheel"])
+            if os.path.isfile(wheel_path):
+                os.remove(wheel_path)
+            self.__save_state(state)
+
+        if is_distribution_installed(distribution_name):
+            TRACER.check_call(["pip", "uninstall", "-y", distribution_name])
+
+    def __build_wheels(self, package_paths: List[str]) -> Dict[str, str]:
+        os.makedirs(self.__wheelhouse_path, exist_ok=True)
+        args = ["pip", "wheel", "--no-deps"]
+        if importlib.util.find_spec("setuptools") is not None:
+            args.append("--no-build-isolation")
+
+        built_wheels: Dict[str, str] = {}
+        with tempfile.TemporaryDirectory(dir=self.__wheelhouse_path) as build_path:
+            TRACER.check_call([*args, "--wheel-dir", build_path, *package_paths])
+            for wheel_file in os.listdir(build_path):
+                os.replace(
+                    os.path.join(build_path, wheel_file),
+                    os.path.join(self.__wheelhouse_path, wheel_file),
+                )
+                built_wheels[wheel_file.split("-")[0].lower()] = wheel_file
+        return built_wheels
+
+    def __load_state(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.__state_file_path, encoding="utf-8") as state_file:
+                state: Dict[str, Dict[str, str]] = json.load(state_file)
+                return state
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def __save_state(self, state: Dict[str, Dict[str, str]]) -> None:
+        with open(self.__state_file_path, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file, indent=2, sort_keys=True)
 
 
 class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
-    TEMPLATE_PATH = "ServiceImpl.py"
+    SERVICE_OUTPUT_SUFFIXES = ["_pb2.py", "_pb2.pyi", "_pb2_grpc.py"]
+    IMPORT_OUTPUT_SUFFIXES = ["_pb2.pyi"]
 
     def __init__(
         self,
@@ -102,6 +440,11 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
         verbose: bool,
         proto_include_path: str,
         is_first_service: bool,
+        protoc_output_path: Optional[str] = None,
+        common_type_files: Optional[List[str]] = None,
+        service_options: Optional[Dict[str, Any]] = None,
+        imported_files: Optional[List[str]] = None,
+        installer: Optional[WheelhouseInstaller] = None,
     ):
         self.__package_directory_path = package_directory_path
         self.__proto_file_handle = proto_file_handle
@@ -116,42 +459,73 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
                 self.__proto_include_path,
             ),
         )
-        self.__service_grpc_code_extractor = GrpcCodeExtractor(
-            self.__proto_file_handle,
-            self.__output_path,
-            f"{self.__service_name_lower}_service_sdk",
+        self.__grpc_file_name_prefix = (
+            f"{Path(self.__proto_file_handle.file_path).stem}_pb2_grpc"
         )
         self.__is_first_service = is_first_service
+        self.__protoc_output_path = protoc_output_path
+        self.__plugin_output_path = get_plugin_output_path(
+            protoc_output_path or package_directory_path,
+            self.__proto_file_handle.file_path,
+            self.__proto_include_path,
+        )
+        self.__common_type_files = {
+            normalize_path(path) for path in common_type_files or []
+        }
+        self.__service_options = service_options or {}
+        self.__imported_files = imported_files or []
+        self.__installer = installer
+
+    def __is_common_type_file(self, path: str) -> bool:
+        return normalize_path(path) in self.__common_type_files
+
+    def __copy_batch_generated_code(self, protoc_output_path: str) -> None:
+        copy_protoc_outputs(
+            protoc_output_path,
+            self.__package_directory_path,
+            self.__proto_file_handle.file_path,
+            self.__proto_include_path,
+            self.SERVICE_OUTPUT_SUFFIXES,
+        )
+        for path in self.__imported_files:
+            if self.__is_common_type_file(path):
+                continue
+            copy_protoc_outputs(
+                protoc_output_path,
+                self.__package_directory_path,
+                path,
+                self.__proto_include_path,
+                self.IMPORT_OUTPUT_SUFFIXES,
+            )
 
     def __invoke_code_generator(self) -> None:
-        subprocess.check_call(
+        if self.__protoc_output_path is not None:
+            self.__copy_batch_generated_code(self.__protoc_output_path)
+            return
+
+        run_protoc(
             [
-                "python3",
-                "-m",
-                "grpc_tools.protoc",
                 f"-I{self.__proto_include_path}",
                 f"--python_out={self.__package_directory_path}",
                 f"--pyi_out={self.__package_directory_path}",
                 f"--grpc_python_out={self.__package_directory_path}",
+                *get_plugin_args_python(
+                    self.__package_directory_path,
+                    self.__proto_include_path,
+                    {self.__proto_file_handle.file_path: self.__service_options},
+                ),
                 self.__proto_file_handle.file_path,
             ]
         )
-        imports = self.__proto_file_handle.get_imports()
-        for element in imports:
-            path = os.path.join(self.__proto_include_path, element)
-            args = [
-                "python3",
-                "-m",
-                "grpc_tools.protoc",
-                f"-I{self.__proto_include_path}",
-                f"--pyi_out={self.__package_directory_path}",
-                path,
-            ]
-            subprocess.check_call(
-                args,
-                cwd=self.__proto_include_path,
-                env=os.environ,
-                stdout=subprocess.DEVNULL if not self.__verbose else None,
+        for path in self.__imported_files:
+            if self.__is_common_type_file(path):
+                continue
+            run_protoc(
+                [
+                    f"-I{self.__proto_include_path}",
+                    f"--pyi_out={self.__package_directory_path}",
+                    path,
+                ]
             )
 
     def __copy_code_and_templates(
@@ -162,12 +536,11 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
         os.makedirs(os.path.join(self.__output_path, source_path), exist_ok=True)
 
         generated_sources = glob.glob(os.path.join(self.__output_path, "*.py*"))
-        grpc_file_name = self.__service_grpc_code_extractor.file_name
         proto_file_prefix = Path(self.__proto_file_handle.file_path).stem
         replace_text_in_file(
             os.path.join(
                 self.__output_path,
-                f"{grpc_file_name}",
+                f"{self.__grpc_file_name_prefix}.py",
             ),
             f"import {proto_file_prefix}_pb2 as {proto_file_prefix}__pb2",
             f"import {module_name}.{proto_file_prefix}_pb2 as {proto_file_prefix}__pb2",
@@ -176,39 +549,29 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
         for file in generated_sources:
             shutil.move(file, source_path)
 
-        files_to_copy: List[CopySpec] = []
-
+        factory_file_names: List[str] = []
         if client_required:
-            files_to_copy.extend(
-                [
-                    CopySpec(
-                        source_path="ServiceNameServiceClientFactory.py",
-                        target_path=os.path.join(
-                            source_path, f"{self.__service_name}ServiceClientFactory.py"
-                        ),
-                    ),
-                    CopySpec(source_path="pyproject.toml"),
-                ]
-            )
-
+            factory_file_names.append(f"{self.__service_name}ServiceClientFactory.py")
         if server_required:
-            files_to_copy.extend(
-                [
-                    CopySpec(
-                        source_path="ServiceNameServiceServerFactory.py",
-                        target_path=os.path.join(
-                            source_path, f"{self.__service_name}ServiceServerFactory.py"
-                        ),
-                    ),
-                    CopySpec(source_path="pyproject.toml"),
-                ]
+            factory_file_names.append(f"{self.__service_name}ServiceServerFactory.py")
+
+        for file_name in factory_file_names:
+            shutil.copy2(
+                os.path.join(self.__plugin_output_path, file_name), source_path
             )
 
+        if len(factory_file_names) == 0:
+            return
+
+        dependencies = ['"grpcio >= 1.57.0"']
+        if len(self.__common_type_files) > 0:
+            dependencies.append(f'"{COMMON_TYPES_SDK_NAME}"')
+
         variables = {
             "service_name": self.__service_name,
             "service_name_lower": self.__service_name_lower,
-            "grpc_file_name_prefix": self.__service_grpc_code_extractor.file_name_prefix,
             "core_sdk_version": get_required_sdk_version_python(),
+            "dependencies": ",\n    ".join(dependencies),
         }
 
         template_dir = os.path.join(
@@ -219,29 +582,25 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
             "python",
         )
 
-        copy_templates(
-            template_dir, self.__package_directory_path, files_to_copy, variables
-        )
+        with TRACER.stage("copy_templates"):
+            copy_templates(
+                template_dir,
+                self.__package_directory_path,
+                [CopySpec(source_path="pyproject.toml")],
+                variables,
+            )
 
     def __create_service_stub_source(self, service_name: str) -> None:
         app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
-
-        source_code = self.__service_grpc_code_extractor.create_source_stub_code()
-        variables = self.__create_stub_template_variables()
-        variables["service_source_code"] = "\n".join(source_code)
-
-        source_file_name = f"{service_name}ServiceStub.py"
-        source_file_path = os.path.join(app_source_dir, source_file_name)
-        templates.copy_templates(
-            get_template_dir(),
+        os.makedirs(app_source_dir, exist_ok=True)
+        shutil.copy2(
+            os.path.join(self.__plugin_output_path, f"{service_name}ServiceStub.py"),
             app_source_dir,
-            [templates.CopySpec(self.TEMPLATE_PATH, source_file_path)],
-            variables,
         )
 
     def __create_service_source(self, service_name: str) -> None:
         app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
-        service_source_file_name = f"{service_name}{self.TEMPLATE_PATH}"
+        service_source_file_name = f"{service_name}ServiceImpl.py"
         service_source_file_path = os.path.join(
             app_source_dir, service_source_file_name
         )
@@ -249,52 +608,20 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
         if os.path.exists(service_source_file_path):
             return
 
-        source_code = self.__service_grpc_code_extractor.create_source_stub_code()
-        source_code = self.__transform_service_source_code(source_code)
-
-        variables = self.__create_service_template_variables()
-        variables["service_source_code"] = "\n".join(source_code)
-
-        templates.copy_templates(
-            get_template_dir(),
-            app_source_dir,
-            [templates.CopySpec("ServiceImpl.py", service_source_file_path)],
-            variables,
+        shutil.copy2(
+            os.path.join(self.__plugin_output_path, service_source_file_name),
+            service_source_file_path,
         )
 
-    def __transform_service_source_code(self, lines: List[str]) -> List[str]:
-        source_content: List[str] = replace_text_area(
-            lines,
-            '"""',
-            '"""',
-        )
-        source_content = replace_item_in_list(
-            source_content,
-            "context.set",
-            remove_empty=True,
-        )
-
-        return source_content
-
-    def __create_stub_template_variables(self) -> Dict[str, str]:
-        proto_file_prefix = self.__service_grpc_code_extractor.file_name_prefix
-        return {
-            "imports": f"import grpc{os.linesep}from {self.__service_name_lower}_service_sdk.{proto_file_prefix} import {self.__service_name}Servicer",
-            "service_name": self.__service_name,
-            "service_name_parent_postfix": "Servicer",
-            "service_name_postfix": "ServiceStub",
-        }
-
-    def __create_service_template_variables(self) -> Dict[str, str]:
-        return {
-            "imports": f"from {self.__service_name}ServiceStub import {self.__service_name}ServiceStub",
-            "service_name": f"{self.__service_name}",
-            "service_name_parent_postfix": "ServiceStub",
-            "service_name_postfix": "Service",
-        }
-
     def __install_module(self) -> None:
-        subprocess.check_call(["pip", "install", self.__package_directory_path])
+        if self.__installer is not None:
+            self.__installer.add_package(
+                f"{self.__service_name_lower}-service-sdk",
+                self.__package_directory_path,
+            )
+            return
+
+        TRACER.check_call(["pip", "install", self.__package_directory_path])
 
     def generate_package(
         self,
@@ -314,13 +641,199 @@ class PythonGrpcInterfaceGenerator(GrpcServiceSdkGenerator):  # type: ignore
         self.__create_service_stub_source(self.__service_name)
         self.__create_service_source(self.__service_name)
 
+    def is_package_installed(self) -> bool:
+        return is_distribution_installed(f"{self.__service_name_lower}-service-sdk")
+
+    def is_auto_generated_code_present(self) -> bool:
+        app_source_dir = os.path.join(get_workspace_dir(), "app", "src")
+        return all(
+            os.path.isfile(os.path.join(app_source_dir, file_name))
+            for file_name in [
+                f"{self.__service_name}ServiceStub.py",
+                f"{self.__service_name}ServiceImpl.py",
+            ]
+        )
+
+
+class PythonCommonTypesSdkGenerator(GrpcServiceSdkGenerator):  # type: ignore
+    """Generates the code of proto files which are imported by several
+    services into a single package. The modules keep their top-level location
+    so the imports within the generated service code resolve to them."""
+
+    TEMPLATE_PATH = os.path.join("common_types", "pyproject.toml")
+
+    def __init__(
+        self,
+        package_directory_path: str,
+        proto_files: Dict[str, str],
+        installer: Optional[WheelhouseInstaller] = None,
+    ):
+        self.__package_directory_path = package_directory_path
+        self.__proto_files = proto_files
+        self.__installer = installer
+
+    def __invoke_code_generator(self) -> None:
+        batches: Dict[str, List[str]] = {}
+        for proto_file, proto_include_path in self.__proto_files.items():
+            batches.setdefault(proto_include_path, []).append(proto_file)
+
+        for proto_include_path, proto_files in batches.items():
+            run_protoc(
+                [
+                    f"-I{proto_include_path}",
+                    f"--python_out={self.__package_directory_path}",
+                    f"--pyi_out={self.__package_directory_path}",
+                    *proto_files,
+                ]
+            )
+
+    def __get_module_names(self) -> List[str]:
+        return sorted(
+            f"{get_output_stem(proto_file, proto_include_path)}_pb2".replace(
+                os.sep, "."
+            )
+            for proto_file, proto_include_path in self.__proto_files.items()
+        )
+
+    def __copy_templates(self) -> None:
+        py_modules = []
+        packages = set()
+        for module_name in self.__get_module_names():
+            if "." not in module_name:
+                py_modules.append(module_name)
+                continue
+            package_pieces = module_name.split(".")[:-1]
+            for index in range(len(package_pieces)):
+                packages.add(".".join(package_pieces[: index + 1]))
+
+        with TRACER.stage("copy_templates"):
+            copy_templates(
+                get_template_dir(),
+                self.__package_directory_path,
+                [CopySpec(self.TEMPLATE_PATH, "pyproject.toml")],
+                {
+                    "common_types_sdk_name": COMMON_TYPES_SDK_NAME,
+                    "py_modules": ", ".join(f'"{module}"' for module in py_modules),
+                    "packages": ", ".join(
+                        f'"{package}"' for package in sorted(packages)
+                    ),
+                },
+            )
+
+    def generate_package(self, client_required: bool, server_required: bool) -> None:
+        self.__invoke_code_generator()
+        self.__copy_templates()
+
+    def install_package(self) -> None:
+        if self.__installer is not None:
+            self.__installer.add_package(
+                COMMON_TYPES_SDK_NAME, self.__package_directory_path
+            )
+            return
+
+        TRACER.check_call(["pip", "install", self.__package_directory_path])
+
+    def update_package_references(self) -> None:
+        pass
+
+    def update_auto_generated_code(self) -> None:
+        pass
+
+    def is_package_installed(self) -> bool:
+        return is_distribution_installed(COMMON_TYPES_SDK_NAME)
+
+    def is_auto_generated_code_present(self) -> bool:
+        return True
+
 
 class PythonGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # type: ignore
     def __init__(self, verbose: bool):
         self._verbose = verbose
+        self._generation_environment: Optional[Dict[str, str]] = None
+        self._installer: Optional[WheelhouseInstaller] = None
+
+    def _get_installer(self) -> WheelhouseInstaller:
+        if self._installer is None:
+            self._installer = WheelhouseInstaller(
+                os.path.join(get_project_cache_dir(), "wheelhouse")
+            )
+        return self._installer
 
     def install_tooling(self) -> None:
-        subprocess.check_call(["pip", "install", "grpcio-tools"])
+        self.__get_tooling_manager().ensure_installed()
+
+    def is_tooling_installed(self) -> bool:
+        return self.__get_tooling_manager().is_installed()
+
+    def __get_tooling_manager(self) -> PythonToolingManager:
+        return PythonToolingManager(
+            os.path.join(get_project_cache_dir(), "tooling", "python-tooling.json")
+        )
+
+    def install_pending_packages(self) -> None:
+        self._get_installer().install_pending_packages()
+
+    def update_pending_package_references(self) -> None:
+        """The installed packages are not referenced by any workspace file."""
+        pass
+
+    def remove_service_package(self, service_name: str) -> None:
+        self._get_installer().remove_package(f"{service_name.lower()}-service-sdk")
+        stub_source_path = os.path.join(
+            get_workspace_dir(), "app", "src", f"{service_name}ServiceStub.py"
+        )
+        if os.path.isfile(stub_source_path):
+            os.remove(stub_source_path)
+
+    def remove_common_types_package(self) -> None:
+        self._get_installer().remove_package(COMMON_TYPES_SDK_NAME)
+
+    def generate_code_batch(
+        self,
+        proto_files: List[str],
+        proto_include_path: str,
+        output_path: str,
+        service_options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        run_protoc(
+            [
+                f"-I{proto_include_path}",
+                f"--python_out={output_path}",
+                f"--pyi_out={output_path}",
+                f"--grpc_python_out={output_path}",
+                *get_plugin_args_python(
+                    output_path, proto_include_path, service_options
+                ),
+                *proto_files,
+            ]
+        )
+
+    def generate_descriptor_set(
+        self, proto_files: List[str], proto_include_path: str, output_file: str
+    ) -> None:
+        diagnostics = GRPC_TOOLS_PROTOC.run(
+            [
+                f"-I{proto_include_path}",
+                f"--descriptor_set_out={output_file}",
+                "--include_imports",
+                *proto_files,
+            ]
+        )
+        if self._verbose:
+            print(diagnostics, end="")
+
+    def get_template_dir(self) -> str:
+        return get_template_dir()
+
+    def get_generation_environment(self) -> Dict[str, str]:
+        if self._generation_environment is None:
+            self._generation_environment = {
+                GRPCIO_TOOLS_DISTRIBUTION: importlib.metadata.version(
+                    GRPCIO_TOOLS_DISTRIBUTION
+                ),
+                "core_sdk_version": get_required_sdk_version_python(),
+            }
+        return self._generation_environment
 
     def create_service_generator(
         self,
@@ -328,6 +841,10 @@ class PythonGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # t
         proto_file_handle: proto.ProtoFileHandle,
         proto_include_path: str,
         is_first_service: bool,
+        protoc_output_path: Optional[str] = None,
+        common_type_files: Optional[List[str]] = None,
+        service_options: Optional[Dict[str, Any]] = None,
+        imported_files: Optional[List[str]] = None,
     ) -> PythonGrpcInterfaceGenerator:
         return PythonGrpcInterfaceGenerator(
             output_path,
@@ -335,4 +852,16 @@ class PythonGrpcServiceSdkGeneratorFactory(GrpcServiceSdkGeneratorFactory):  # t
             self._verbose,
             proto_include_path,
             is_first_service,
+            protoc_output_path,
+            common_type_files,
+            service_options,
+            imported_files,
+            self._get_installer(),
+        )
+
+    def create_common_types_generator(
+        self, output_path: str, proto_files: Dict[str, str]
+    ) -> PythonCommonTypesSdkGenerator:
+        return PythonCommonTypesSdkGenerator(
+            output_path, proto_files, self._get_installer()
         )
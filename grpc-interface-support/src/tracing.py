@@ -0,0 +1,181 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Setting this environment variable to a value other than "0" enables tracing
+TRACE_ENV_VAR = "VELOCITAS_GRPC_TRACE"
+CATEGORY_STAGE = "stage"
+CATEGORY_SUBPROCESS = "subprocess"
+
+
+class Tracer:
+    """Records the stages of the generation pipeline and the subprocesses it
+    runs as Chrome trace events. Recording is a no-op unless tracing is enabled."""
+
+    def __init__(self) -> None:
+        self.__enabled = os.environ.get(TRACE_ENV_VAR, "0") != "0"
+        self.__events: List[Dict[str, Any]] = []
+
+    def is_enabled(self) -> bool:
+        return self.__enabled
+
+    def enable(self) -> None:
+        """Enable tracing for this process and all processes started by it."""
+        self.__enabled = True
+        os.environ[TRACE_ENV_VAR] = "1"
+
+    @contextmanager
+    def stage(
+        self, name: str, category: str = CATEGORY_STAGE, **args: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Record the duration of the enclosed block as a trace event.
+
+        Args:
+            name (str): The name of the stage.
+            category (str): The category of the event.
+            **args (Any): Details of the stage shown with the event.
+
+        Yields:
+            Dict[str, Any]: The details of the event, which may be extended
+                within the block.
+        """
+        if not self.__enabled:
+            yield {}
+            return
+
+        start_time = time.monotonic_ns()
+        try:
+            yield args
+        except BaseException as error:
+            args.setdefault("error", type(error).__name__)
+            raise
+        finally:
+            self.__events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start_time / 1000,
+                    "dur": (time.monotonic_ns() - start_time) / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": args,
+                }
+            )
+
+    @contextmanager
+    def subprocess_stage(self, command: List[str]) -> Iterator[None]:
+        """Record a subprocess with its command line, duration and exit code.
+
+        Args:
+            command (List[str]): The command line of the subprocess.
+        """
+        with self.stage(
+            os.path.basename(command[0]),
+            CATEGORY_SUBPROCESS,
+            command=shlex.join(command),
+        ) as event_args:
+            try:
+                yield
+            except subprocess.CalledProcessError as error:
+                event_args["exit_code"] = error.returncode
+                raise
+            event_args["exit_code"] = 0
+
+    def check_call(self, command: List[str], **kwargs: Any) -> int:
+        """Traced variant of `subprocess.check_call`."""
+        with self.subprocess_stage(command):
+            return subprocess.check_call(command, **kwargs)
+
+    def check_output(self, command: List[str], **kwargs: Any) -> Any:
+        """Traced variant of `subprocess.check_output`."""
+        with self.subprocess_stage(command):
+            return subprocess.check_output(command, **kwargs)
+
+    def take_events(self) -> List[Dict[str, Any]]:
+        """Remove and return the recorded events, e.g. to hand them over from
+        a worker process to the main process.
+
+        Returns:
+            List[Dict[str, Any]]: The recorded events.
+        """
+        events = self.__events
+        self.__events = []
+        return events
+
+    def add_events(self, events: List[Dict[str, Any]]) -> None:
+        self.__events.extend(events)
+
+    def get_summary(self) -> str:
+        """Return a table with the number of calls and the total, mean and
+        maximum duration of each stage and subprocess, longest first.
+
+        Returns:
+            str: The summary table.
+        """
+        durations: Dict[Tuple[str, str], List[float]] = {}
+        for event in self.__events:
+            key = (event["cat"], event["name"])
+            durations.setdefault(key, []).append(event["dur"] / 1000)
+
+        rows = [
+            [category, name, str(len(values)), f"{sum(values):.1f}"]
+            + [f"{sum(values) / len(values):.1f}", f"{max(values):.1f}"]
+            for (category, name), values in sorted(
+                durations.items(), key=lambda item: -sum(item[1])
+            )
+        ]
+        header = ["category", "name", "calls", "total ms", "mean ms", "max ms"]
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(6)]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if index < 2 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in [header, *rows]
+        )
+
+    def write(self, directory_path: str) -> str:
+        """Write the recorded events as Chrome trace-event JSON, which can be
+        opened with chrome://tracing or Perfetto, and the summary table next
+        to it.
+
+        Args:
+            directory_path (str): The directory to write the files to.
+
+        Returns:
+            str: The path of the trace file.
+        """
+        os.makedirs(directory_path, exist_ok=True)
+        file_stem = os.path.join(
+            directory_path, f"generation-{time.strftime('%Y%m%d-%H%M%S')}"
+        )
+        with open(f"{file_stem}.json", "w", encoding="utf-8") as trace_file:
+            json.dump(
+                {"traceEvents": self.__events, "displayTimeUnit": "ms"}, trace_file
+            )
+        with open(f"{file_stem}.txt", "w", encoding="utf-8") as summary_file:
+            summary_file.write(self.get_summary() + "\n")
+        return f"{file_stem}.json"
+
+
+TRACER = Tracer()
@@ -0,0 +1,278 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+PROTO_FILE_EXTENSION = ".proto"
+POLL_INTERVAL = 0.5
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+INOTIFY_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+def walk_directories(directory_path: str) -> Iterator[str]:
+    """Yield a directory and all its subdirectories, except hidden ones.
+
+    Args:
+        directory_path (str): The directory to walk.
+
+    Yields:
+        str: The paths of the directories.
+    """
+    for root, dirs, _ in os.walk(directory_path):
+        dirs[:] = sorted(dir for dir in dirs if not dir.startswith("."))
+        yield root
+
+
+def remove_nested_directories(directory_paths: List[str]) -> List[str]:
+    """Remove all directories which are contained in another of the directories.
+
+    Args:
+        directory_paths (List[str]): The directories.
+
+    Returns:
+        List[str]: The sorted outermost directories.
+    """
+    result: List[str] = []
+    for directory_path in sorted({os.path.abspath(path) for path in directory_paths}):
+        if not any(
+            os.path.commonpath([outer_path, directory_path]) == outer_path
+            for outer_path in result
+        ):
+            result.append(directory_path)
+    return result
+
+
+class ProtoFileWatcher(ABC):
+    """Watches directory trees for changes of proto files."""
+
+    @abstractmethod
+    def watch(self, directory_paths: List[str]) -> None:
+        """Add directory trees to watch. Already watched trees are ignored.
+
+        Args:
+            directory_paths (List[str]): The root directories of the trees.
+        """
+        pass
+
+    @abstractmethod
+    def get_changes(self, timeout: Optional[float]) -> Set[str]:
+        """Wait until proto files are created, modified or deleted.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait in seconds.
+                Waits infinitely if None.
+
+        Returns:
+            Set[str]: The paths of the changed proto files. Empty if none
+                changed until the timeout.
+        """
+        pass
+
+    def close(self) -> None:
+        """Release all resources of the watcher."""
+        pass
+
+    def wait_for_changes(self, debounce_interval: float) -> Set[str]:
+        """Wait for changes of proto files. Since editors and checkouts often
+        write several files in a burst, changes are collected until no further
+        change happens for `debounce_interval` seconds.
+
+        Args:
+            debounce_interval (float): The quiet time ending a burst in seconds.
+
+        Returns:
+            Set[str]: The paths of all changed proto files.
+        """
+        changes: Set[str] = set()
+        while len(changes) == 0:
+            changes = self.get_changes(None)
+        while True:
+            further_changes = self.get_changes(debounce_interval)
+            if len(further_changes) == 0:
+                return changes
+            changes.update(further_changes)
+
+
+class PollingProtoFileWatcher(ProtoFileWatcher):
+    """Detects changes by periodically comparing the modification time and
+    size of all proto files. Works on all platforms and file systems."""
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        self.__poll_interval = poll_interval
+        self.__directory_paths: List[str] = []
+        self.__stamps: Dict[str, Tuple[int, int]] = {}
+
+    def watch(self, directory_paths: List[str]) -> None:
+        self.__directory_paths = remove_nested_directories(
+            self.__directory_paths + directory_paths
+        )
+        # Keep the known stamps, so changes made meanwhile are still reported
+        for path, stamp in self.__take_stamps().items():
+            self.__stamps.setdefault(path, stamp)
+
+    def get_changes(self, timeout: Optional[float]) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.__poll_interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+            stamps = self.__take_stamps()
+            changes = {
+                path
+                for path in set(stamps) | set(self.__stamps)
+                if stamps.get(path) != self.__stamps.get(path)
+            }
+            self.__stamps = stamps
+            if len(changes) > 0 or (
+                deadline is not None and time.monotonic() >= deadline
+            ):
+                return changes
+
+    def __take_stamps(self) -> Dict[str, Tuple[int, int]]:
+        stamps: Dict[str, Tuple[int, int]] = {}
+        for directory_path in self.__directory_paths:
+            for root in walk_directories(directory_path):
+                try:
+                    entries = list(os.scandir(root))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.name.endswith(PROTO_FILE_EXTENSION):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        stamps[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+
+class InotifyProtoFileWatcher(ProtoFileWatcher):
+    """Detects changes via the inotify API of the Linux kernel, which reports
+    them without any polling delay."""
+
+    def __init__(self) -> None:
+        library_path = ctypes.util.find_library("c")
+        self.__libc = ctypes.CDLL(library_path, use_errno=True)
+        self.__libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        self.__fd: int = self.__libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.__fd < 0:
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+        self.__directories: Dict[int, str] = {}
+
+    def watch(self, directory_paths: List[str]) -> None:
+        for directory_path in directory_paths:
+            self.__add_tree(os.path.abspath(directory_path))
+
+    def get_changes(self, timeout: Optional[float]) -> Set[str]:
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if len(readable) == 0:
+            return set()
+
+        changes: Set[str] = set()
+        while True:
+            try:
+                buffer = os.read(self.__fd, 65536)
+            except BlockingIOError:
+                return changes
+            changes.update(self.__process_events(buffer))
+
+    def close(self) -> None:
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def __add_tree(self, directory_path: str) -> Set[str]:
+        """Watch a directory tree and return the proto files within it."""
+        proto_files: Set[str] = set()
+        for root in walk_directories(directory_path):
+            watch_descriptor = self.__libc.inotify_add_watch(
+                self.__fd, os.fsencode(root), INOTIFY_WATCH_MASK
+            )
+            if watch_descriptor < 0:
+                error_number = ctypes.get_errno()
+                raise OSError(error_number, os.strerror(error_number), root)
+            self.__directories[watch_descriptor] = root
+            proto_files.update(
+                os.path.join(root, name)
+                for name in os.listdir(root)
+                if name.endswith(PROTO_FILE_EXTENSION)
+            )
+        return proto_files
+
+    def __process_events(self, buffer: bytes) -> Set[str]:
+        changes: Set[str] = set()
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, name_length = INOTIFY_EVENT_HEADER.unpack_from(
+                buffer, offset
+            )
+            offset += INOTIFY_EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset : offset + name_length].rstrip(b"\0"))
+            offset += name_length
+
+            if mask & IN_IGNORED:
+                # The directory has been deleted or moved away
+                self.__directories.pop(watch_descriptor, None)
+                continue
+            directory_path = self.__directories.get(watch_descriptor)
+            if directory_path is None:
+                continue
+
+            path = os.path.join(directory_path, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not name.startswith("."):
+                    # Files may have been written before the watch was added
+                    changes.update(self.__add_tree(path))
+            elif name.endswith(PROTO_FILE_EXTENSION):
+                changes.add(path)
+        return changes
+
+
+def create_proto_file_watcher() -> ProtoFileWatcher:
+    """Create a watcher using inotify if available, otherwise polling.
+
+    Returns:
+        ProtoFileWatcher: The watcher.
+    """
+    try:
+        return InotifyProtoFileWatcher()
+    except (OSError, AttributeError, TypeError):
+        # No Linux or no libc providing inotify, e.g. on macOS or Windows
+        print("inotify is not available, falling back to polling for changes")
+        return PollingProtoFileWatcher()
@@ -0,0 +1,397 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scalability benchmark of the SDK generation pipeline.
+
+Generates synthetic catalogues of increasing size and runs `generate_sdks()`
+on each of them in a fresh workspace and project cache. The time spent in each
+stage of the pipeline and the peak RSS of the generator and its subprocesses
+are reported per catalogue size, so super-linear stages become visible."""
+
+import argparse
+import functools
+import importlib.metadata
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import venv
+from typing import Any, Callable, Dict, List, Tuple
+
+from catalogue_generator import generate_catalogue
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, "..", ".."))
+REPO_DIR = os.path.dirname(PACKAGE_DIR)
+
+RESULT_FORMAT_VERSION = 1
+CATALOGUE_DIR_NAME = "catalogue"
+
+# Methods of the generator factory and of the service generators per stage
+FACTORY_STAGES = {
+    "install_tooling": "tooling",
+    "generate_descriptor_set": "protoc",
+    "generate_code_batch": "protoc",
+    "install_pending_packages": "install",
+}
+GENERATOR_STAGES = {
+    "generate_package": "template copy",
+    "install_package": "install",
+    "update_package_references": "reference update",
+    "update_auto_generated_code": "stub update",
+}
+# Functions of the main module per stage
+MAIN_STAGES = {
+    "prepare_services": "parse",
+    "evaluate_cache": "cache",
+}
+STAGES = ["tooling", "parse", "cache", "protoc", "template copy", "install"]
+STAGES += ["reference update", "stub update", "other"]
+
+
+class StageTimer:
+    """Accumulates the exclusive time spent in each stage. Time spent in a
+    nested stage is only accounted to the nested stage."""
+
+    def __init__(self) -> None:
+        self.durations: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.__stack: List[List[Any]] = []
+
+    def wrap(self, stage: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            self.__stack.append([stage, time.perf_counter(), 0.0])
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _, start_time, nested_duration = self.__stack.pop()
+                duration = time.perf_counter() - start_time
+                self.durations[stage] = (
+                    self.durations.get(stage, 0.0) + duration - nested_duration
+                )
+                self.calls[stage] = self.calls.get(stage, 0) + 1
+                if len(self.__stack) > 0:
+                    self.__stack[-1][2] += duration
+
+        return timed
+
+
+def instrument_pipeline(timer: StageTimer) -> None:
+    """Wrap the stages of the generation pipeline with the timer.
+
+    Args:
+        timer (StageTimer): The timer to account the stages to.
+    """
+    import main
+
+    def wrap_generator(create_generator: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(create_generator)
+        def create_instrumented_generator(*args: Any, **kwargs: Any) -> Any:
+            generator = create_generator(*args, **kwargs)
+            for method_name, stage in GENERATOR_STAGES.items():
+                setattr(
+                    generator,
+                    method_name,
+                    timer.wrap(stage, getattr(generator, method_name)),
+                )
+            return generator
+
+        return create_instrumented_generator
+
+    for factory_class in [
+        main.CppGrpcServiceSdkGeneratorFactory,
+        main.PythonGrpcServiceSdkGeneratorFactory,
+    ]:
+        for method_name, stage in FACTORY_STAGES.items():
+            setattr(
+                factory_class,
+                method_name,
+                timer.wrap(stage, getattr(factory_class, method_name)),
+            )
+        for method_name in [
+            "create_service_generator",
+            "create_common_types_generator",
+        ]:
+            setattr(
+                factory_class,
+                method_name,
+                wrap_generator(getattr(factory_class, method_name)),
+            )
+
+    for function_name, stage in MAIN_STAGES.items():
+        setattr(main, function_name, timer.wrap(stage, getattr(main, function_name)))
+
+
+def measure_generation(jobs: int) -> Dict[str, Any]:
+    """Run `generate_sdks()` for the workspace given by the environment.
+
+    Args:
+        jobs (int): The maximum number of services to generate in parallel.
+
+    Returns:
+        Dict[str, Any]: The wall time, the exclusive time per stage and the
+            peak RSS of this process and of its largest subprocess.
+    """
+    sys.path.append(os.path.join(PACKAGE_DIR, "src"))
+    import main
+
+    timer = StageTimer()
+    instrument_pipeline(timer)
+    start_time = time.perf_counter()
+    timer.wrap("other", main.generate_sdks)(False, False, jobs)
+    wall_time = time.perf_counter() - start_time
+
+    # ru_maxrss is given in KiB on Linux
+    return {
+        "wall_s": wall_time,
+        "stages": {
+            stage: {"total_s": timer.durations[stage], "calls": timer.calls[stage]}
+            for stage in STAGES
+            if stage in timer.durations
+        },
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "peak_subprocess_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        / 1024,
+    }
+
+
+def prepare_workspace(workspace_dir: str, language: str) -> None:
+    template_repo_path = os.environ.get("VELOCITAS_TEMPLATE_REPO_PATH")
+    if template_repo_path is not None:
+        shutil.copytree(template_repo_path, workspace_dir, dirs_exist_ok=True)
+    elif language == "cpp":
+        raise RuntimeError(
+            "VELOCITAS_TEMPLATE_REPO_PATH is required to generate C++ SDKs"
+        )
+    os.makedirs(os.path.join(workspace_dir, "app", "src"), exist_ok=True)
+
+    requirements_path = os.path.join(workspace_dir, "app", "requirements.txt")
+    if language == "python" and not os.path.isfile(requirements_path):
+        with open(requirements_path, "w", encoding="utf-8") as requirements_file:
+            requirements_file.write(
+                f"vehicle-app-sdk=={importlib.metadata.version('velocitas_sdk')}\n"
+            )
+
+
+def create_environment(work_dir: str, language: str) -> Tuple[str, Dict[str, str]]:
+    """Create the interpreter and environment the measured runs are executed
+    with. Python SDKs are installed into a virtual environment, which sees the
+    packages of the current interpreter, to keep them out of the latter.
+
+    Args:
+        work_dir (str): The working directory of the benchmark.
+        language (str): The programming language of the generated SDKs.
+
+    Returns:
+        Tuple[str, Dict[str, str]]: A tuple consisting of
+            [0] = The path of the Python interpreter.
+            [1] = The environment variables.
+    """
+    env = os.environ.copy()
+    if language != "python":
+        return sys.executable, env
+
+    venv_dir = os.path.join(work_dir, "venv")
+    venv.create(venv_dir, system_site_packages=True, with_pip=True)
+    # The setuptools bundled with ensurepip would shadow the build tooling of
+    # the current interpreter, which the generated packages are built with
+    python = os.path.join(venv_dir, "bin", "python")
+    subprocess.check_call(
+        [python, "-m", "pip", "uninstall", "-y", "-q", "setuptools"],
+        stdout=subprocess.DEVNULL,
+    )
+    env["PATH"] = os.pathsep.join([os.path.join(venv_dir, "bin"), env["PATH"]])
+    env["VIRTUAL_ENV"] = venv_dir
+    return python, env
+
+
+def run_size(
+    args: argparse.Namespace,
+    work_dir: str,
+    python: str,
+    env: Dict[str, str],
+    service_count: int,
+) -> Dict[str, Any]:
+    run_dir = os.path.join(work_dir, f"services-{service_count}")
+    workspace_dir = os.path.join(run_dir, "workspace")
+    prepare_workspace(workspace_dir, args.language)
+    generate_catalogue(
+        os.path.join(workspace_dir, CATALOGUE_DIR_NAME),
+        service_count,
+        args.type_files,
+        args.import_depth,
+        args.methods,
+    )
+
+    manifest = {
+        "manifestVersion": "v3",
+        "name": "GenerationBenchmark",
+        "interfaces": [
+            {
+                "type": "grpc-interface",
+                "config": {"src": f"{CATALOGUE_DIR_NAME}/", "provided": {}},
+            }
+        ],
+    }
+    run_env = dict(env)
+    run_env.update(
+        {
+            "VELOCITAS_WORKSPACE_DIR": workspace_dir,
+            "VELOCITAS_CACHE_DIR": os.path.join(run_dir, "cache"),
+            "VELOCITAS_PACKAGE_DIR": REPO_DIR,
+            "VELOCITAS_APP_MANIFEST": json.dumps(manifest),
+            "language": args.language,
+        }
+    )
+    result_path = os.path.join(run_dir, "result.json")
+    log_path = os.path.join(run_dir, "generation.log")
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        return_code = subprocess.call(
+            [
+                python,
+                os.path.abspath(__file__),
+                "--measure",
+                result_path,
+                "--jobs",
+                str(args.jobs),
+            ],
+            env=run_env,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+    if return_code != 0:
+        with open(log_path, encoding="utf-8") as log_file:
+            print(log_file.read()[-4000:])
+        raise RuntimeError(f"Generation of {service_count} services failed")
+
+    with open(result_path, encoding="utf-8") as result_file:
+        result: Dict[str, Any] = json.load(result_file)
+    for stage in result["stages"].values():
+        stage["per_service_ms"] = stage["total_s"] * 1000 / service_count
+    return {"services": service_count, **result}
+
+
+def print_table(runs: List[Dict[str, Any]]) -> None:
+    stages = [stage for stage in STAGES if any(stage in run["stages"] for run in runs)]
+    header = ["services", "wall s", *[f"{stage} s" for stage in stages], "RSS MB"]
+    rows = [
+        [
+            str(run["services"]),
+            f"{run['wall_s']:.2f}",
+            *[
+                f"{run['stages'].get(stage, {}).get('total_s', 0.0):.2f}"
+                for stage in stages
+            ],
+            f"{run['peak_rss_mb']:.0f}",
+        ]
+        for run in runs
+    ]
+    for row in [header, *rows]:
+        print(" | ".join(f"{cell:>{len(column)}}" for cell, column in zip(row, header)))
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="velocitas-generation-")
+    try:
+        python, env = create_environment(work_dir, args.language)
+        runs = []
+        for service_count in args.services:
+            runs.append(run_size(args, work_dir, python, env, service_count))
+            print(f"Generated {service_count} services in {runs[-1]['wall_s']:.2f} s")
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_table(runs)
+    return {
+        "version": RESULT_FORMAT_VERSION,
+        "language": args.language,
+        "environment": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "settings": {
+            "type_files": args.type_files,
+            "import_depth": args.import_depth,
+            "methods": args.methods,
+            "jobs": args.jobs,
+        },
+        "runs": runs,
+    }
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument(
+        "--language",
+        choices=["python", "cpp"],
+        default=os.environ.get("VELOCITAS_TEST_LANGUAGE", "python"),
+    )
+    argument_parser.add_argument(
+        "-o", "--output", default="generation-benchmark.json", help="The result file."
+    )
+    argument_parser.add_argument(
+        "--services",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 100, 250, 500],
+        help="The catalogue sizes to benchmark.",
+    )
+    argument_parser.add_argument(
+        "--type-files",
+        type=int,
+        default=20,
+        help="Number of type files shared by the services.",
+    )
+    argument_parser.add_argument(
+        "--import-depth",
+        type=int,
+        default=3,
+        help="Length of the import chains of the type files.",
+    )
+    argument_parser.add_argument(
+        "--methods", type=int, default=3, help="Number of methods per service."
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Services generated in parallel. Stages running in worker "
+        "processes are not timed, so the default is 1.",
+    )
+    argument_parser.add_argument(
+        "--work-dir", help="Generate into this directory and keep it."
+    )
+    argument_parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = argument_parser.parse_args()
+
+    if args.measure is not None:
+        measurement = measure_generation(args.jobs)
+        with open(args.measure, "w", encoding="utf-8") as measure_file:
+            json.dump(measurement, measure_file)
+        sys.exit(0)
+
+    benchmark_results = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(benchmark_results, output_file, indent=2)
+    print(f"Results written to {args.output}")
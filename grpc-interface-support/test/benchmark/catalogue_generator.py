@@ -0,0 +1,128 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generator of synthetic proto catalogues for benchmarking.
+
+A catalogue consists of service files and shared type files within a single
+directory. The type files form import chains of a configurable depth, and each
+service imports the last file of one of the chains. All services sharing a
+chain therefore import the same files, like real catalogues do."""
+
+import argparse
+import math
+import os
+from typing import List
+
+TYPES_PACKAGE = "synthetic.types"
+
+
+def get_type_file_name(index: int) -> str:
+    return f"types_{index:04d}.proto"
+
+
+def get_service_file_name(index: int) -> str:
+    return f"service_{index:04d}.proto"
+
+
+def create_type_file(index: int, imported_index: int) -> str:
+    lines = ['syntax = "proto3";', f"package {TYPES_PACKAGE};", ""]
+    if imported_index >= 0:
+        lines.extend([f'import "{get_type_file_name(imported_index)}";', ""])
+    lines.append(f"message Type{index:04d} {{")
+    lines.append("  int32 value = 1;")
+    lines.append("  string name = 2;")
+    if imported_index >= 0:
+        lines.append(f"  Type{imported_index:04d} nested = 3;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def create_service_file(index: int, imported_index: int, method_count: int) -> str:
+    lines = ['syntax = "proto3";', f"package synthetic.service{index:04d}.v1;", ""]
+    if imported_index >= 0:
+        lines.extend([f'import "{get_type_file_name(imported_index)}";', ""])
+    lines.append(f"service Synthetic{index:04d}Service {{")
+    for method in range(method_count):
+        lines.append(
+            f"  rpc Method{method}(Method{method}Request) "
+            f"returns (Method{method}Response);"
+        )
+    lines.extend(["}", ""])
+    for method in range(method_count):
+        for kind in ["Request", "Response"]:
+            lines.append(f"message Method{method}{kind} {{")
+            lines.append("  int32 id = 1;")
+            if imported_index >= 0:
+                lines.append(f"  {TYPES_PACKAGE}.Type{imported_index:04d} value = 2;")
+            lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_catalogue(
+    directory_path: str,
+    service_count: int,
+    type_file_count: int,
+    import_depth: int,
+    method_count: int = 3,
+) -> List[str]:
+    """Write a synthetic proto catalogue.
+
+    Args:
+        directory_path (str): The directory to write the proto files to.
+        service_count (int): The number of service files.
+        type_file_count (int): The number of shared type files.
+        import_depth (int): The length of the import chains of the type files.
+        method_count (int): The number of methods of each service.
+
+    Returns:
+        List[str]: The paths of the written service files.
+    """
+    os.makedirs(directory_path, exist_ok=True)
+    import_depth = max(1, import_depth)
+    for index in range(type_file_count):
+        imported_index = index - 1 if index % import_depth != 0 else -1
+        with open(
+            os.path.join(directory_path, get_type_file_name(index)),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write(create_type_file(index, imported_index))
+
+    chain_count = math.ceil(type_file_count / import_depth)
+    service_file_paths = []
+    for index in range(service_count):
+        imported_index = -1
+        if chain_count > 0:
+            chain = index % chain_count
+            imported_index = min(
+                chain * import_depth + import_depth - 1, type_file_count - 1
+            )
+        service_file_path = os.path.join(directory_path, get_service_file_name(index))
+        with open(service_file_path, "w", encoding="utf-8") as file:
+            file.write(create_service_file(index, imported_index, method_count))
+        service_file_paths.append(service_file_path)
+    return service_file_paths
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("directory", help="The directory to write to.")
+    argument_parser.add_argument("--services", type=int, default=10)
+    argument_parser.add_argument("--type-files", type=int, default=10)
+    argument_parser.add_argument("--import-depth", type=int, default=3)
+    argument_parser.add_argument("--methods", type=int, default=3)
+    args = argument_parser.parse_args()
+    generate_catalogue(
+        args.directory, args.services, args.type_files, args.import_depth, args.methods
+    )
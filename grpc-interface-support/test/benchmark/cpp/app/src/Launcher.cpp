@@ -0,0 +1,55 @@
+/**
+ * Copyright (c) 2025 Contributors to the Eclipse Foundation
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+#include <services/bcmdoorservice/BcmdoorserviceServiceServerFactory.h>
+#include <services/hornservice/HornserviceServiceServerFactory.h>
+#include <services/vcsmotortrqmngservice/VcsmotortrqmngserviceServiceServerFactory.h>
+#include <services/vcsptcpbylimservice/VcsptcpbylimserviceServiceServerFactory.h>
+
+#include <memory>
+
+#include "BcmdoorserviceServiceImpl.h"
+#include "HornserviceServiceImpl.h"
+#include "VcsmotortrqmngserviceServiceImpl.h"
+#include "VcsptcpbylimserviceServiceImpl.h"
+#include "sdk/middleware/Middleware.h"
+
+using namespace velocitas;
+
+int main(int argc, char** argv) {
+    auto hornImpl = std::make_shared<HornserviceService>();
+    auto hornServer =
+        HornserviceServiceServerFactory::create(Middleware::getInstance(), hornImpl);
+
+    auto doorImpl = std::make_shared<BcmdoorserviceService>();
+    auto doorServer =
+        BcmdoorserviceServiceServerFactory::create(Middleware::getInstance(), doorImpl);
+
+    auto motorcontrolImpl   = std::make_shared<VcsmotortrqmngserviceService>();
+    auto motorcontrolServer = VcsmotortrqmngserviceServiceServerFactory::create(
+        Middleware::getInstance(), motorcontrolImpl);
+
+    auto capacitycontrolImpl   = std::make_shared<VcsptcpbylimserviceService>();
+    auto capacitycontrolServer = VcsptcpbylimserviceServiceServerFactory::create(
+        Middleware::getInstance(), capacitycontrolImpl);
+
+    hornServer->Wait();
+    doorServer->Wait();
+    motorcontrolServer->Wait();
+    capacitycontrolServer->Wait();
+
+    return 0;
+}
@@ -0,0 +1,157 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Closed-loop and open-loop load generation for unary gRPC methods.
+
+Requests are sent as serialized bytes, so the load generator works with
+servers of any language without requiring generated client code. An empty
+payload is a valid encoding of any proto3 message with default values."""
+
+import asyncio
+import math
+import time
+from typing import Any, Callable, Dict, List
+
+import grpc
+
+
+def identity(data: bytes) -> bytes:
+    return data
+
+
+class LoadResult:
+    """Latencies and status codes of the calls of a single load run."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.status_codes: Dict[str, int] = {}
+        self.elapsed = 0.0
+
+    def record(self, latency: float, status_code: grpc.StatusCode) -> None:
+        self.latencies.append(latency)
+        self.status_codes[status_code.name] = (
+            self.status_codes.get(status_code.name, 0) + 1
+        )
+
+    def summarize(self) -> Dict[str, Any]:
+        """Summarize the load run.
+
+        Returns:
+            Dict[str, Any]: The number of calls, calls per second, status code
+                counts and latency percentiles in milliseconds.
+        """
+        latencies = sorted(self.latencies)
+        return {
+            "calls": len(latencies),
+            "rps": len(latencies) / self.elapsed if self.elapsed > 0 else 0.0,
+            "status_codes": dict(sorted(self.status_codes.items())),
+            "latency_ms": {
+                "p50": get_percentile(latencies, 50) * 1000,
+                "p90": get_percentile(latencies, 90) * 1000,
+                "p99": get_percentile(latencies, 99) * 1000,
+                "max": (latencies[-1] if latencies else 0.0) * 1000,
+            },
+        }
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> float:
+    """Return the percentile of sorted values using the nearest-rank method.
+
+    Args:
+        sorted_values (List[float]): The values in ascending order.
+        percentile (float): The percentile between 0 and 100.
+
+    Returns:
+        float: The value at the percentile or 0.0 if there are no values.
+    """
+    if len(sorted_values) == 0:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * percentile / 100))
+    return sorted_values[rank - 1]
+
+
+async def call(
+    method: Callable[..., Any], result: LoadResult, start_time: float
+) -> None:
+    try:
+        await method(b"")
+        status_code = grpc.StatusCode.OK
+    except grpc.aio.AioRpcError as error:
+        status_code = error.code()
+    result.record(time.perf_counter() - start_time, status_code)
+
+
+async def run_closed_loop(
+    channel: grpc.aio.Channel, method_path: str, concurrency: int, duration: float
+) -> LoadResult:
+    """Call a method from a fixed number of workers, each sending its next
+    request as soon as the previous one completed.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to the server.
+        method_path (str): The full path of the method, e.g. `/pkg.Service/Method`.
+        concurrency (int): The number of concurrent workers.
+        duration (float): The duration of the run in seconds.
+
+    Returns:
+        LoadResult: The result of the run.
+    """
+    method = channel.unary_unary(
+        method_path, request_serializer=identity, response_deserializer=identity
+    )
+    result = LoadResult()
+    start_time = time.perf_counter()
+    end_time = start_time + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < end_time:
+            await call(method, result, time.perf_counter())
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    result.elapsed = time.perf_counter() - start_time
+    return result
+
+
+async def run_open_loop(
+    channel: grpc.aio.Channel, method_path: str, rate: float, duration: float
+) -> LoadResult:
+    """Call a method at a fixed rate, independent of the completion of previous
+    calls. Latencies are measured from the scheduled send time, so a server
+    falling behind is not hidden by a delayed sender (coordinated omission).
+
+    Args:
+        channel (grpc.aio.Channel): The channel to the server.
+        method_path (str): The full path of the method, e.g. `/pkg.Service/Method`.
+        rate (float): The number of calls per second.
+        duration (float): The duration of the run in seconds.
+
+    Returns:
+        LoadResult: The result of the run.
+    """
+    method = channel.unary_unary(
+        method_path, request_serializer=identity, response_deserializer=identity
+    )
+    result = LoadResult()
+    start_time = time.perf_counter()
+    pending: List["asyncio.Task[None]"] = []
+    for index in range(int(rate * duration)):
+        scheduled_time = start_time + index / rate
+        delay = scheduled_time - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        pending.append(asyncio.create_task(call(method, result, scheduled_time)))
+
+    await asyncio.gather(*pending)
+    result.elapsed = time.perf_counter() - start_time
+    return result
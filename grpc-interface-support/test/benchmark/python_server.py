@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Starts the servers of generated Python service SDKs for benchmarking.
+
+Each service is created by its generated server factory with a servicer
+answering every method with a default response. The services are passed as
+JSON list of objects with the keys `name` (service name), `module` (the name
+of the proto file without extension) and `async` (whether the SDK was
+generated with `"serverMode": "async"`).
+
+Once all servers are started, a JSON object with the names of the `started`
+services and the import errors of the `skipped` services is printed."""
+
+import asyncio
+import importlib
+import json
+import sys
+from typing import Any, Dict, List
+
+import grpc
+from google.protobuf import message_factory
+from velocitas_sdk.native.locator import NativeServiceLocator
+
+
+class BenchmarkMiddleware:
+    """Minimal middleware resolving service locations from `SDV_*_ADDRESS`."""
+
+    def __init__(self) -> None:
+        self.service_locator = NativeServiceLocator()
+
+
+def create_servicer(service: Dict[str, Any]) -> Any:
+    package = f"{service['name'].lower()}_service_sdk"
+    messages = importlib.import_module(f"{package}.{service['module']}_pb2")
+    services = importlib.import_module(f"{package}.{service['module']}_pb2_grpc")
+    servicer_class = getattr(services, f"{service['name']}Servicer")
+
+    methods = {}
+    for method in messages.DESCRIPTOR.services_by_name[service["name"]].methods:
+        response_class = message_factory.GetMessageClass(method.output_type)
+        if service["async"]:
+
+            async def respond(self, request, context, response_class=response_class):
+                return response_class()
+        else:
+
+            def respond(self, request, context, response_class=response_class):
+                return response_class()
+
+        methods[method.name] = respond
+
+    return type(f"Benchmark{servicer_class.__name__}", (servicer_class,), methods)()
+
+
+def create_server(service: Dict[str, Any], middleware: BenchmarkMiddleware) -> Any:
+    package = f"{service['name'].lower()}_service_sdk"
+    factory_module = importlib.import_module(
+        f"{package}.{service['name']}ServiceServerFactory"
+    )
+    factory = getattr(factory_module, f"{service['name']}ServiceServerFactory")
+    return factory.create(middleware, create_servicer(service))
+
+
+async def serve(services: List[Dict[str, Any]]) -> None:
+    middleware = BenchmarkMiddleware()
+    servers = []
+    started: List[str] = []
+    skipped: Dict[str, str] = {}
+    for service in services:
+        try:
+            servers.append(create_server(service, middleware))
+            started.append(service["name"])
+        except ImportError as error:
+            skipped[service["name"]] = str(error)
+
+    waiting = []
+    for server in servers:
+        if isinstance(server, grpc.aio.Server):
+            await server.start()
+            waiting.append(server.wait_for_termination())
+        else:
+            server.start()
+            waiting.append(asyncio.to_thread(server.wait_for_termination))
+    print(json.dumps({"started": started, "skipped": skipped}), flush=True)
+    await asyncio.gather(*waiting)
+
+
+if __name__ == "__main__":
+    asyncio.run(serve(json.loads(sys.argv[1])))
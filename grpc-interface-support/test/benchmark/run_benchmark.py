@@ -0,0 +1,464 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Throughput and latency benchmark of the servers of generated service SDKs.
+
+Generates the SDKs of the horn service and the multi-proto catalogue, starts
+their servers locally and drives every RPC with a closed-loop and an open-loop
+load generator. The results are written as JSON and can be compared against a
+baseline to detect regressions caused by template changes."""
+
+import argparse
+import asyncio
+import importlib.metadata
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import grpc
+from load_generator import run_closed_loop, run_open_loop
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, "..", ".."))
+REPO_DIR = os.path.dirname(PACKAGE_DIR)
+
+sys.path.append(os.path.join(PACKAGE_DIR, "src"))
+from proto import parse_proto_file  # noqa
+
+RESULT_FORMAT_VERSION = 1
+SERVER_STARTUP_TIMEOUT_S = 30
+UNIMPLEMENTED_STATUS = '::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "")'
+
+INTERFACES = [
+    {"src": "bcm/horn/v1/horn.proto", "provided": {}},
+    {"src": "proto_catalogue/", "provided": {}},
+]
+
+
+class BenchmarkService:
+    """A service of the benchmarked SDKs and the address its server listens on."""
+
+    def __init__(self, name: str, package: str, module: str, methods: List[str]):
+        self.name = name
+        self.package = package
+        self.module = module
+        self.methods = methods
+        self.address = f"127.0.0.1:{get_free_port()}"
+
+    def get_method_path(self, method: str) -> str:
+        return f"/{self.package}.{self.name}/{method}"
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def prepare_workspace(workspace_dir: str, language: str) -> None:
+    template_repo_path = os.environ.get("VELOCITAS_TEMPLATE_REPO_PATH")
+    if template_repo_path is not None:
+        shutil.copytree(template_repo_path, workspace_dir, dirs_exist_ok=True)
+    elif language == "cpp":
+        raise RuntimeError(
+            "VELOCITAS_TEMPLATE_REPO_PATH is required to build the C++ server"
+        )
+    if language == "cpp":
+        shutil.copytree(
+            os.path.join(BENCHMARK_DIR, "cpp"), workspace_dir, dirs_exist_ok=True
+        )
+
+    shutil.copytree(
+        os.path.join(REPO_DIR, "test", "common", "proto"),
+        workspace_dir,
+        dirs_exist_ok=True,
+    )
+    shutil.copytree(
+        os.path.join(REPO_DIR, "test", "common", "multiple"),
+        workspace_dir,
+        dirs_exist_ok=True,
+    )
+    os.makedirs(os.path.join(workspace_dir, "app", "src"), exist_ok=True)
+
+    requirements_path = os.path.join(workspace_dir, "app", "requirements.txt")
+    if language == "python" and not os.path.isfile(requirements_path):
+        with open(requirements_path, "w", encoding="utf-8") as requirements_file:
+            requirements_file.write(
+                f"vehicle-app-sdk=={importlib.metadata.version('velocitas_sdk')}\n"
+            )
+
+
+def find_services(workspace_dir: str) -> List[BenchmarkService]:
+    proto_files = [os.path.join(workspace_dir, "bcm", "horn", "v1", "horn.proto")]
+    catalogue_dir = os.path.join(workspace_dir, "proto_catalogue")
+    proto_files.extend(
+        os.path.join(catalogue_dir, file_name)
+        for file_name in sorted(os.listdir(catalogue_dir))
+        if file_name.endswith(".proto")
+    )
+
+    services = []
+    for proto_file in proto_files:
+        metadata = parse_proto_file(proto_file)
+        if len(metadata.service_names) == 0 or metadata.package is None:
+            continue
+        service_name = metadata.service_names[-1]
+        services.append(
+            BenchmarkService(
+                service_name,
+                metadata.package,
+                os.path.splitext(os.path.basename(proto_file))[0],
+                metadata.service_methods.get(service_name, []),
+            )
+        )
+    return services
+
+
+def generate_sdks(
+    workspace_dir: str,
+    cache_dir: str,
+    language: str,
+    interface_config: Dict[str, Any],
+    verbose: bool,
+) -> None:
+    manifest = {
+        "manifestVersion": "v3",
+        "name": "BenchmarkApp",
+        "interfaces": [
+            {"type": "grpc-interface", "config": {**config, **interface_config}}
+            for config in INTERFACES
+        ],
+    }
+    env = os.environ.copy()
+    env.update(
+        {
+            "VELOCITAS_WORKSPACE_DIR": workspace_dir,
+            "VELOCITAS_CACHE_DIR": cache_dir,
+            "VELOCITAS_PACKAGE_DIR": REPO_DIR,
+            "VELOCITAS_APP_MANIFEST": json.dumps(manifest),
+            "language": language,
+        }
+    )
+    command = [sys.executable, os.path.join(PACKAGE_DIR, "src", "main.py")]
+    subprocess.check_call([*command, "-v"] if verbose else command, env=env)
+
+
+def build_cpp_server(workspace_dir: str) -> None:
+    # Let the generated service implementations answer with default responses
+    # instead of UNIMPLEMENTED, so successful calls are measured.
+    app_source_dir = os.path.join(workspace_dir, "app", "src")
+    for file_name in os.listdir(app_source_dir):
+        if file_name.endswith("ServiceImpl.cpp"):
+            file_path = os.path.join(app_source_dir, file_name)
+            with open(file_path, encoding="utf-8") as file:
+                content = file.read()
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(content.replace(UNIMPLEMENTED_STATUS, "::grpc::Status::OK"))
+
+    for step in ["install", "build"]:
+        subprocess.check_call(
+            ["velocitas", "exec", "build-system", step], cwd=workspace_dir
+        )
+
+
+def start_server(
+    workspace_dir: str,
+    language: str,
+    services: List[BenchmarkService],
+    interface_config: Dict[str, Any],
+) -> Tuple["subprocess.Popen[str]", Dict[str, str]]:
+    env = os.environ.copy()
+    for service in services:
+        env[f"SDV_{service.name.upper()}_ADDRESS"] = service.address
+
+    skipped: Dict[str, str] = {}
+    if language == "cpp":
+        server_process = subprocess.Popen(
+            [os.path.join(workspace_dir, "build", "bin", "app")], env=env, text=True
+        )
+    else:
+        service_specs = [
+            {
+                "name": service.name,
+                "module": service.module,
+                "async": interface_config.get("serverMode") == "async",
+            }
+            for service in services
+        ]
+        server_process = subprocess.Popen(
+            [
+                sys.executable,
+                os.path.join(BENCHMARK_DIR, "python_server.py"),
+                json.dumps(service_specs),
+            ],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert server_process.stdout is not None
+        status_line = server_process.stdout.readline()
+        if not status_line:
+            raise RuntimeError("Python server exited before starting the services")
+        skipped = json.loads(status_line)["skipped"]
+
+    for service in services:
+        if service.name in skipped:
+            continue
+        with grpc.insecure_channel(service.address) as channel:
+            try:
+                grpc.channel_ready_future(channel).result(
+                    timeout=SERVER_STARTUP_TIMEOUT_S
+                )
+            except grpc.FutureTimeoutError:
+                server_process.kill()
+                raise RuntimeError(
+                    f"Server of {service.name} did not start on {service.address}"
+                )
+    return server_process, skipped
+
+
+async def run_load(
+    services: List[BenchmarkService],
+    concurrencies: List[int],
+    rates: List[float],
+    duration: float,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for service in services:
+        async with grpc.aio.insecure_channel(service.address) as channel:
+            for method in service.methods:
+                method_path = service.get_method_path(method)
+                # Warm up the connection and the server before measuring
+                await run_closed_loop(channel, method_path, 1, min(duration, 0.5))
+
+                for concurrency in concurrencies:
+                    result = await run_closed_loop(
+                        channel, method_path, concurrency, duration
+                    )
+                    results.append(
+                        {
+                            "service": service.name,
+                            "method": method,
+                            "mode": "closed",
+                            "concurrency": concurrency,
+                            **result.summarize(),
+                        }
+                    )
+                for rate in rates:
+                    result = await run_open_loop(channel, method_path, rate, duration)
+                    results.append(
+                        {
+                            "service": service.name,
+                            "method": method,
+                            "mode": "open",
+                            "rate": rate,
+                            **result.summarize(),
+                        }
+                    )
+                print(f"Benchmarked {method_path}")
+    return results
+
+
+def get_result_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        result["service"],
+        result["method"],
+        result["mode"],
+        result.get("concurrency", result.get("rate")),
+    )
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Compare benchmark results against a baseline.
+
+    Args:
+        baseline (Dict[str, Any]): The results of the baseline run.
+        current (Dict[str, Any]): The results of the current run.
+        tolerance (float): The relative change of RPS or p99 latency which is
+            tolerated, e.g. 0.1 for 10%.
+
+    Returns:
+        List[str]: A description of each regression, empty if there is none.
+    """
+    baseline_results = {
+        get_result_key(result): result for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        key = get_result_key(result)
+        if key not in baseline_results:
+            continue
+        previous = baseline_results[key]
+        name = "{} {} {} {}".format(*key)
+        if result["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: RPS dropped from {previous['rps']:.1f} to {result['rps']:.1f}"
+            )
+        previous_p99 = previous["latency_ms"]["p99"]
+        if result["latency_ms"]["p99"] > previous_p99 * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 latency rose from {previous_p99:.3f} ms to "
+                f"{result['latency_ms']['p99']:.3f} ms"
+            )
+    return regressions
+
+
+def get_git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_DIR,
+            encoding="utf-8",
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    workspace_dir = args.workspace or tempfile.mkdtemp(prefix="velocitas-benchmark-")
+    interface_config: Dict[str, Any] = json.loads(args.interface_config)
+    server_process = None
+    try:
+        prepare_workspace(workspace_dir, args.language)
+        generate_sdks(
+            workspace_dir,
+            os.path.join(workspace_dir, ".cache"),
+            args.language,
+            interface_config,
+            args.verbose,
+        )
+        if args.language == "cpp":
+            build_cpp_server(workspace_dir)
+
+        services = find_services(workspace_dir)
+        server_process, skipped_services = start_server(
+            workspace_dir, args.language, services, interface_config
+        )
+        for service_name, reason in skipped_services.items():
+            print(f"Skipping {service_name}: {reason}")
+        results = asyncio.run(
+            run_load(
+                [
+                    service
+                    for service in services
+                    if service.name not in skipped_services
+                ],
+                args.concurrency,
+                args.rate,
+                args.duration,
+            )
+        )
+    finally:
+        if server_process is not None:
+            server_process.kill()
+            server_process.wait()
+        if args.workspace is None:
+            shutil.rmtree(workspace_dir, ignore_errors=True)
+
+    return {
+        "version": RESULT_FORMAT_VERSION,
+        "language": args.language,
+        "interface_config": interface_config,
+        "environment": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "revision": get_git_revision(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+            "grpcio": grpc.__version__,
+        },
+        "settings": {
+            "duration_s": args.duration,
+            "concurrency": args.concurrency,
+            "rate": args.rate,
+        },
+        "skipped_services": skipped_services,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument(
+        "--language",
+        choices=["python", "cpp"],
+        default=os.environ.get("VELOCITAS_TEST_LANGUAGE", "python"),
+    )
+    argument_parser.add_argument(
+        "-o", "--output", default="benchmark-results.json", help="The result file."
+    )
+    argument_parser.add_argument(
+        "--duration",
+        type=float,
+        default=2.0,
+        help="Duration of each load run in seconds.",
+    )
+    argument_parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 16],
+        help="Numbers of concurrent workers of the closed-loop runs.",
+    )
+    argument_parser.add_argument(
+        "--rate",
+        type=float,
+        nargs="+",
+        default=[100.0, 1000.0],
+        help="Calls per second of the open-loop runs.",
+    )
+    argument_parser.add_argument(
+        "--interface-config",
+        default="{}",
+        help='JSON merged into the config of each interface, e.g. \'{"serverMode": "async"}\'.',
+    )
+    argument_parser.add_argument(
+        "--workspace",
+        help="Generate into this directory and keep it, instead of a temporary one.",
+    )
+    argument_parser.add_argument(
+        "--baseline", help="Results of a previous run to check for regressions."
+    )
+    argument_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Tolerated relative change of RPS and p99 latency. Defaults to 0.1.",
+    )
+    argument_parser.add_argument("-v", "--verbose", action="store_true")
+    args = argument_parser.parse_args()
+
+    benchmark_results = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(benchmark_results, output_file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions = compare_results(
+                json.load(baseline_file), benchmark_results, args.tolerance
+            )
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        sys.exit(1 if len(regressions) > 0 else 0)
@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+import zipfile
+from pathlib import Path
+from typing import Dict
+from unittest import mock
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from archive import ArchiveExtractor  # noqa
+
+
+def create_archive(archive_path: Path, members: Dict[str, str]) -> str:
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    return str(archive_path)
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> str:
+    return create_archive(
+        tmp_path / "catalogue.zip",
+        {
+            "catalogue/seats/seats.proto": "service Seats {}",
+            "catalogue/seats/README.md": "docs",
+            "catalogue/common/types.proto": "message A {}",
+            "vendor/other.proto": "message B {}",
+        },
+    )
+
+
+def extracted_files(extract_to: Path) -> set:
+    return {
+        str(path.relative_to(extract_to))
+        for path in extract_to.rglob("*")
+        if path.is_file() and ".extracted" not in path.parts
+    }
+
+
+def test_only_proto_files_below_prefixes_are_extracted(archive: str, tmp_path: Path):
+    extract_to = tmp_path / "downloads"
+    ArchiveExtractor(archive, str(extract_to)).extract(
+        ["catalogue/seats", "./catalogue/common/"]
+    )
+
+    assert extracted_files(extract_to) == {
+        "catalogue/seats/seats.proto",
+        "catalogue/common/types.proto",
+    }
+
+
+def test_extraction_is_skipped_while_tree_matches_manifest(
+    archive: str, tmp_path: Path
+):
+    extract_to = tmp_path / "downloads"
+    ArchiveExtractor(archive, str(extract_to)).extract([])
+
+    with mock.patch("zipfile.ZipFile", side_effect=zipfile.ZipFile) as zip_file:
+        ArchiveExtractor(archive, str(extract_to)).extract([])
+        zip_file.assert_not_called()
+
+        (extract_to / "vendor" / "other.proto").write_text("modified")
+        ArchiveExtractor(archive, str(extract_to)).extract([])
+        zip_file.assert_called_once()
+
+    assert (extract_to / "vendor" / "other.proto").read_text() == "message B {}"
+
+
+def test_files_of_previous_archive_content_are_removed(tmp_path: Path):
+    extract_to = tmp_path / "downloads"
+    archive = create_archive(tmp_path / "a.zip", {"old.proto": "", "kept.proto": ""})
+    ArchiveExtractor(archive, str(extract_to)).extract([])
+
+    create_archive(tmp_path / "a.zip", {"kept.proto": "", "newer.proto": ""})
+    ArchiveExtractor(archive, str(extract_to)).extract([])
+
+    assert extracted_files(extract_to) == {"kept.proto", "newer.proto"}
+
+
+def test_members_outside_of_target_are_rejected(tmp_path: Path):
+    archive = create_archive(tmp_path / "evil.zip", {"../evil.proto": ""})
+
+    with pytest.raises(RuntimeError):
+        ArchiveExtractor(archive, str(tmp_path / "downloads")).extract([])
+
+
+def test_extraction_is_checked_without_extracting(archive: str, tmp_path: Path):
+    extract_to = tmp_path / "downloads"
+    extractor = ArchiveExtractor(archive, str(extract_to))
+
+    assert not extractor.is_extracted(["catalogue"])
+    assert not extract_to.exists()
+
+    extractor.extract(["catalogue"])
+    assert extractor.is_extracted(["./catalogue/"])
+    assert not extractor.is_extracted(["vendor"])
@@ -0,0 +1,155 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from cache import (  # noqa
+    GenerationCache,
+    compute_fingerprint,
+    compute_input_digests,
+    get_common_types_inputs,
+    get_service_inputs,
+)
+
+cache_file_path = "/cache/services/generation-cache.json"
+
+
+@pytest.fixture
+def mock_filesystem(fs: FakeFilesystem) -> FakeFilesystem:
+    fs.create_file("/proto/service.proto", contents="service A {}")
+    fs.create_file("/proto/types.proto", contents="message B {}")
+    fs.create_file("/templates/ServiceImpl.py", contents="${{ service_name }}")
+    return fs
+
+
+def fingerprint(client: bool = True, environment=None) -> str:
+    return compute_fingerprint(
+        get_service_inputs(
+            "/proto/service.proto",
+            ["/proto/types.proto"],
+            "/templates",
+            client,
+            False,
+            "python",
+            environment or {"grpcio-tools": "1.0.0"},
+        )
+    )
+
+
+def test_fingerprint_is_stable(mock_filesystem: FakeFilesystem):
+    assert fingerprint() == fingerprint()
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    ["/proto/service.proto", "/proto/types.proto", "/templates/ServiceImpl.py"],
+)
+def test_fingerprint_changes_with_file_content(
+    mock_filesystem: FakeFilesystem, file_path: str
+):
+    before = fingerprint()
+    with open(file_path, "a") as file:
+        file.write("\n// changed")
+    assert fingerprint() != before
+
+
+def test_fingerprint_changes_with_flags_and_environment(
+    mock_filesystem: FakeFilesystem,
+):
+    before = fingerprint()
+    assert fingerprint(client=False) != before
+    assert fingerprint(environment={"grpcio-tools": "2.0.0"}) != before
+
+
+def test_common_types_fingerprint_changes_with_include_dir(
+    mock_filesystem: FakeFilesystem,
+):
+    def common_types_fingerprint(include_dir: str) -> str:
+        return compute_fingerprint(
+            get_common_types_inputs(
+                {"/proto/types.proto": include_dir},
+                "/templates",
+                "python",
+                {"grpcio-tools": "1.0.0"},
+            )
+        )
+
+    before = common_types_fingerprint("/proto")
+    assert common_types_fingerprint("/proto") == before
+    assert common_types_fingerprint("/") != before
+
+    with open("/proto/types.proto", "a") as file:
+        file.write("\n// changed")
+    assert common_types_fingerprint("/proto") != before
+
+
+def test_cache_is_persisted(mock_filesystem: FakeFilesystem):
+    cache = GenerationCache(cache_file_path)
+    assert not cache.is_up_to_date("seats", "abc")
+
+    cache.update("seats", "abc")
+    reloaded_cache = GenerationCache(cache_file_path)
+    assert reloaded_cache.is_up_to_date("seats", "abc")
+    assert not reloaded_cache.is_up_to_date("seats", "def")
+
+    reloaded_cache.invalidate("seats")
+    assert not GenerationCache(cache_file_path).is_up_to_date("seats", "abc")
+
+
+def test_changed_inputs_are_reported(mock_filesystem: FakeFilesystem):
+    inputs = get_service_inputs(
+        "/proto/service.proto",
+        ["/proto/types.proto"],
+        "/templates",
+        True,
+        False,
+        "python",
+        {"grpcio-tools": "1.0.0"},
+    )
+
+    cache = GenerationCache(cache_file_path)
+    cache.update("seats", compute_fingerprint(inputs), compute_input_digests(inputs))
+    cache.update("horn", "abc")
+
+    with open("/proto/types.proto", "a") as file:
+        file.write("\n// changed")
+    inputs = get_service_inputs(
+        "/proto/service.proto",
+        ["/proto/types.proto"],
+        "/templates",
+        True,
+        True,
+        "python",
+        {"grpcio-tools": "1.0.0"},
+    )
+    reloaded_cache = GenerationCache(cache_file_path)
+    assert reloaded_cache.contains("seats")
+    assert reloaded_cache.get_service_names() == ["horn", "seats"]
+    assert reloaded_cache.get_changed_inputs(
+        "seats", compute_input_digests(inputs)
+    ) == ["imports", "server"]
+    assert reloaded_cache.get_changed_inputs("horn", {}) is None
+
+    reloaded_cache.invalidate("seats")
+    assert not GenerationCache(cache_file_path).contains("seats")
+
+
+def test_corrupt_cache_file_is_ignored(mock_filesystem: FakeFilesystem):
+    mock_filesystem.create_file(cache_file_path, contents="{ not json")
+    assert not GenerationCache(cache_file_path).is_up_to_date("seats", "abc")
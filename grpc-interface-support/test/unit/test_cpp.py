@@ -0,0 +1,215 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from unittest import mock
+
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from cpp import (  # noqa
+    GeneratedPackageIndex,
+    WorkspaceReferenceUpdater,
+    add_dependency_to_conanfile_lines,
+    apply_environment_changes,
+    export_conan_project,
+    find_tooling_binary,
+    get_environment_changes,
+    get_tooling_key,
+    get_tooling_requirements,
+    remove_dependency_from_conanfile_lines,
+)
+
+template_conanfile_path = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "templates", "cpp", "conanfile.py"
+)
+
+
+def test_tooling_requirements_match_template():
+    requirements = get_tooling_requirements(template_conanfile_path)
+
+    assert len(requirements) == 1
+    assert requirements[0].startswith("grpc/")
+
+
+def test_tooling_key_changes_with_requirements_and_profile(fs: FakeFilesystem):
+    fs.create_file("/conan/profiles/host", contents="[settings]\narch=x86_64\n")
+    key = get_tooling_key(["grpc/1.50.1"], "/conan/profiles/host")
+
+    assert get_tooling_key(["grpc/1.50.1"], "/conan/profiles/host") == key
+    assert get_tooling_key(["grpc/1.60.0"], "/conan/profiles/host") != key
+
+    with open("/conan/profiles/host", "a") as profile:
+        profile.write("compiler.version=13\n")
+    assert get_tooling_key(["grpc/1.50.1"], "/conan/profiles/host") != key
+
+
+def test_environment_changes_are_reapplied_on_top_of_current_path():
+    changes = get_environment_changes(
+        {"PATH": "/usr/bin", "HOME": "/root"},
+        {"PATH": "/conan/grpc/bin:/usr/bin", "HOME": "/root", "GRPC": "1"},
+    )
+    assert changes == {"set": {"GRPC": "1"}, "prepend": {"PATH": "/conan/grpc/bin:"}}
+
+    with mock.patch.dict(os.environ, {"PATH": "/usr/local/bin"}, clear=True):
+        apply_environment_changes(changes)
+        assert os.environ["PATH"] == "/conan/grpc/bin:/usr/local/bin"
+        assert os.environ["GRPC"] == "1"
+
+
+def test_tooling_binaries_are_only_found_in_recorded_directories(
+    fs: FakeFilesystem,
+):
+    fs.create_file("/usr/bin/protoc", st_mode=0o100755)
+    fs.create_file("/conan/grpc/bin/grpc_cpp_plugin", st_mode=0o100755)
+    changes = {"set": {}, "prepend": {"PATH": "/conan/grpc/bin:"}}
+
+    with mock.patch.dict(os.environ, {"PATH": "/usr/bin"}, clear=True):
+        assert find_tooling_binary("protoc", changes) is None
+        assert (
+            find_tooling_binary("grpc_cpp_plugin", changes)
+            == "/conan/grpc/bin/grpc_cpp_plugin"
+        )
+        assert find_tooling_binary("protoc", {"set": {}, "prepend": {}}) is None
+
+
+def test_dependency_is_added_to_requires_section():
+    lines = ["[requires]\n", "grpc/1.50.1\n", "\n", "[generators]\n", "CMakeDeps\n"]
+
+    add_dependency_to_conanfile_lines(lines, "seats-service-sdk", "generated")
+    add_dependency_to_conanfile_lines(lines, "grpc", "1.60.0")
+
+    assert lines == [
+        "[requires]\n",
+        "seats-service-sdk/generated\n",
+        "grpc/1.60.0\n",
+        "\n",
+        "[generators]\n",
+        "CMakeDeps\n",
+    ]
+
+    lines = ["[generators]\n", "CMakeDeps\n"]
+    add_dependency_to_conanfile_lines(lines, "seats-service-sdk", "generated")
+    assert lines[2:] == ["[requires]\n", "seats-service-sdk/generated\n"]
+
+
+def test_workspace_references_are_written_once(fs: FakeFilesystem):
+    fs.create_file(
+        "/workspace/conanfile.txt",
+        contents="[requires]\nvehicle-app-sdk/0.5.0\n\n[generators]\nCMakeDeps\n",
+    )
+    fs.create_file("/workspace/app/service-libs.cmake", contents="outdated\n")
+
+    updater = WorkspaceReferenceUpdater()
+    with mock.patch("cpp.get_workspace_dir", return_value="/workspace"):
+        updater.add_service_sdk("horn-service-sdk", True)
+        updater.add_service_sdk("seats-service-sdk", False)
+        with mock.patch("os.replace", wraps=os.replace) as replace:
+            updater.update_references()
+        assert replace.call_count == 2
+
+        with open("/workspace/conanfile.txt") as conanfile:
+            assert conanfile.read() == (
+                "[requires]\nseats-service-sdk/generated\nhorn-service-sdk/generated\n"
+                "vehicle-app-sdk/0.5.0\n\n[generators]\nCMakeDeps\n"
+            )
+        with open("/workspace/app/service-libs.cmake") as cmake_file:
+            cmake_content = cmake_file.read()
+        assert cmake_content.startswith(WorkspaceReferenceUpdater.SERVICE_CMAKE_HEADER)
+        assert "outdated" not in cmake_content
+        assert cmake_content.endswith(
+            "\nfind_package(seats-service-sdk REQUIRED CONFIG)\n"
+            "set(SERVICE_LIBS ${SERVICE_LIBS}\n"
+            "    seats-service-sdk::seats-service-sdk\n"
+            ")\n"
+        )
+
+        # Identical references do not touch the files
+        updater.add_service_sdk("horn-service-sdk", True)
+        updater.add_service_sdk("seats-service-sdk", False)
+        with mock.patch("os.replace") as replace:
+            updater.update_references()
+        replace.assert_not_called()
+
+
+def test_dependency_is_removed_from_requires_section_only():
+    lines = [
+        "[requires]\n",
+        "horn-service-sdk/generated\n",
+        "seats-service-sdk/generated\n",
+        "\n",
+        "[options]\n",
+        "horn-service-sdk/generated\n",
+    ]
+
+    remove_dependency_from_conanfile_lines(lines, "horn-service-sdk")
+
+    assert lines == [
+        "[requires]\n",
+        "seats-service-sdk/generated\n",
+        "\n",
+        "[options]\n",
+        "horn-service-sdk/generated\n",
+    ]
+
+
+def test_references_of_removed_services_are_dropped(fs: FakeFilesystem):
+    fs.create_file(
+        "/workspace/conanfile.txt",
+        contents="[requires]\nhorn-service-sdk/generated\nseats-service-sdk/generated\n",
+    )
+    fs.create_file(
+        "/workspace/app/service-libs.cmake",
+        contents=WorkspaceReferenceUpdater.SERVICE_CMAKE_HEADER
+        + WorkspaceReferenceUpdater.get_service_cmake_block("horn-service-sdk")
+        + WorkspaceReferenceUpdater.get_service_cmake_block("seats-service-sdk"),
+    )
+
+    updater = WorkspaceReferenceUpdater()
+    with mock.patch("cpp.get_workspace_dir", return_value="/workspace"):
+        updater.remove_service_sdk("horn-service-sdk")
+        updater.update_references()
+
+    with open("/workspace/conanfile.txt") as conanfile:
+        assert conanfile.read() == "[requires]\nseats-service-sdk/generated\n"
+    with open("/workspace/app/service-libs.cmake") as cmake_file:
+        assert cmake_file.read() == (
+            WorkspaceReferenceUpdater.SERVICE_CMAKE_HEADER
+            + WorkspaceReferenceUpdater.get_service_cmake_block("seats-service-sdk")
+        )
+
+
+def test_generated_packages_are_listed_once():
+    listing = (
+        '{"Local Cache": {"horn-service-sdk/generated": {}, '
+        '"common-types-sdk/generated": {}}}'
+    )
+    index = GeneratedPackageIndex()
+    with mock.patch("cpp.TRACER.check_output", return_value=listing) as check_output:
+        assert index.contains("horn-service-sdk")
+        assert not index.contains("seats-service-sdk")
+        index.add_package("seats-service-sdk")
+        assert index.contains("seats-service-sdk")
+    check_output.assert_called_once()
+
+
+def test_conan_export_is_traced():
+    with mock.patch("cpp.TRACER.check_call") as check_call:
+        export_conan_project("/sdk")
+
+    check_call.assert_called_once()
+    assert check_call.call_args.args[0] == ["conan", "export", "."]
+    assert check_call.call_args.kwargs["cwd"] == "/sdk"
+    assert check_call.call_args.kwargs["env"]["CONAN_REVISIONS_ENABLED"] == "1"
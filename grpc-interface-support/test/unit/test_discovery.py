@@ -0,0 +1,85 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from discovery import discover_service_files, may_define_service  # noqa
+
+service_contents = (
+    'syntax = "proto3";\nservice Seats {\n  rpc Move(A) returns (A);\n}\n'
+)
+import_contents = 'syntax = "proto3";\nmessage A {}\n'
+
+
+@pytest.fixture
+def mock_filesystem(fs: FakeFilesystem) -> FakeFilesystem:
+    fs.create_file("/proto/seats.proto", contents=service_contents)
+    fs.create_file("/proto/types.proto", contents=import_contents)
+    fs.create_file("/proto/sub/horn.proto", contents=service_contents)
+    fs.create_file("/proto/build/generated.proto", contents=service_contents)
+    fs.create_file("/proto/.git/seats.proto", contents=service_contents)
+    fs.create_file("/proto/vendor/lib/other.proto", contents=service_contents)
+    return fs
+
+
+def test_only_service_files_outside_ignored_dirs_are_discovered(
+    mock_filesystem: FakeFilesystem,
+):
+    assert sorted(discover_service_files("/proto", [])) == [
+        "/proto/seats.proto",
+        "/proto/sub/horn.proto",
+        "/proto/vendor/lib/other.proto",
+    ]
+
+
+def test_symlinked_directory_cycles_are_walked_once(mock_filesystem: FakeFilesystem):
+    mock_filesystem.create_symlink("/proto/sub/loop", "/proto")
+    mock_filesystem.create_symlink("/proto/shared", "/shared")
+    mock_filesystem.create_file("/shared/lights.proto", contents=service_contents)
+
+    assert sorted(discover_service_files("/proto", [])) == [
+        "/proto/seats.proto",
+        "/proto/shared/lights.proto",
+        "/proto/sub/horn.proto",
+        "/proto/vendor/lib/other.proto",
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["vendor", "vendor/*", "*/lib"])
+def test_ignore_patterns(mock_filesystem: FakeFilesystem, pattern: str):
+    assert "/proto/vendor/lib/other.proto" not in list(
+        discover_service_files("/proto", [pattern])
+    )
+
+
+@pytest.mark.parametrize(
+    "contents, expected",
+    [
+        (service_contents, True),
+        ("service Seats{}", True),
+        (import_contents, False),
+        ("// service Seats {}\nmessage A {}", False),
+        ("/* service Seats {\n} */\nmessage A {}", False),
+        ('option (a) = "service Seats {";\nmessage A {}', False),
+        ("message A { string service = 1; }", False),
+    ],
+)
+def test_service_pre_check(fs: FakeFilesystem, contents: str, expected: bool):
+    fs.create_file("/proto/file.proto", contents=contents)
+    assert may_define_service("/proto/file.proto") == expected
@@ -0,0 +1,65 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from file_sync import (  # noqa
+    create_staging_dir,
+    sync_directory,
+    write_file_if_changed,
+)
+
+OLD_MTIME = 1_000_000_000
+
+
+def test_sync_directory_only_replaces_changed_files(tmp_path: Path):
+    target_dir = tmp_path / "sdk"
+    (target_dir / "src" / "obsolete").mkdir(parents=True)
+    (target_dir / "src" / "obsolete" / "old.h").write_text("old")
+    (target_dir / "unchanged.txt").write_text("same")
+    (target_dir / "changed.txt").write_text("before")
+    for file in ["unchanged.txt", "changed.txt"]:
+        os.utime(target_dir / file, (OLD_MTIME, OLD_MTIME))
+
+    staging_dir = Path(create_staging_dir(str(target_dir)))
+    assert staging_dir.parent == tmp_path
+    (staging_dir / "src").mkdir()
+    (staging_dir / "src" / "new.h").write_text("new")
+    (staging_dir / "unchanged.txt").write_text("same")
+    (staging_dir / "changed.txt").write_text("after")
+
+    assert sync_directory(str(staging_dir), str(target_dir)) == (2, 1, 2)
+
+    assert sorted(
+        str(path.relative_to(target_dir)) for path in target_dir.rglob("*")
+    ) == ["changed.txt", "src", os.path.join("src", "new.h"), "unchanged.txt"]
+    assert (target_dir / "changed.txt").read_text() == "after"
+    assert (target_dir / "unchanged.txt").stat().st_mtime == OLD_MTIME
+    assert (target_dir / "changed.txt").stat().st_mtime > OLD_MTIME
+
+
+def test_write_file_if_changed(tmp_path: Path):
+    file_path = tmp_path / "conanfile.txt"
+
+    assert write_file_if_changed(str(file_path), "[requires]\n")
+    os.utime(file_path, (OLD_MTIME, OLD_MTIME))
+    assert not write_file_if_changed(str(file_path), "[requires]\n")
+    assert file_path.stat().st_mtime == OLD_MTIME
+
+    assert write_file_if_changed(str(file_path), "[requires]\nfoo/1.0\n")
+    assert file_path.read_text() == "[requires]\nfoo/1.0\n"
+    assert os.listdir(tmp_path) == ["conanfile.txt"]
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from import_graph import ProtoImportGraph  # noqa
+
+cache_dir = "/cache/import-graphs"
+
+
+@pytest.fixture
+def mock_filesystem(fs: FakeFilesystem) -> FakeFilesystem:
+    fs.create_file(
+        "/proto/types.proto",
+        contents='syntax = "proto3";\nmessage Value { int32 value = 1; }\n',
+    )
+    fs.create_file(
+        "/proto/common.proto",
+        contents='syntax = "proto3";\nimport "types.proto";\n'
+        "message Common { Value value = 1; }\n",
+    )
+    fs.create_file(
+        "/proto/seats.proto",
+        contents='syntax = "proto3";\nimport "common.proto";\n'
+        "service Seats { rpc Move(Common) returns (Common); }\n",
+    )
+    fs.create_file(
+        "/proto/horn.proto",
+        contents='syntax = "proto3";\nimport "google/protobuf/empty.proto";\n'
+        "message Empty {}\nservice Horn { rpc Honk(Empty) returns (Empty); }\n",
+    )
+    return fs
+
+
+def include_dirs() -> dict:
+    return {"/proto/seats.proto": "/proto", "/proto/horn.proto": "/proto"}
+
+
+def test_transitive_imports(mock_filesystem: FakeFilesystem):
+    graph = ProtoImportGraph.build(include_dirs())
+
+    assert graph.get_transitive_imports("/proto/seats.proto") == [
+        "/proto/common.proto",
+        "/proto/types.proto",
+    ]
+    assert graph.get_transitive_imports("/proto/horn.proto") == []
+
+
+def test_dependents(mock_filesystem: FakeFilesystem):
+    graph = ProtoImportGraph.build(include_dirs())
+
+    assert graph.get_dependents("/proto/types.proto") == {
+        "/proto/types.proto",
+        "/proto/common.proto",
+        "/proto/seats.proto",
+    }
+    assert graph.get_dependents("/proto/horn.proto") == {"/proto/horn.proto"}
+
+
+def test_load_or_build_reuses_stored_graph(mock_filesystem: FakeFilesystem):
+    build = ProtoImportGraph.build
+    with mock.patch.object(ProtoImportGraph, "build", side_effect=build) as spy:
+        ProtoImportGraph.load_or_build(include_dirs(), cache_dir)
+        ProtoImportGraph.load_or_build(include_dirs(), cache_dir)
+        assert spy.call_count == 1
+
+        with open("/proto/horn.proto", "a") as file:
+            file.write('import "types.proto";\n')
+        graph = ProtoImportGraph.load_or_build(include_dirs(), cache_dir)
+        assert spy.call_count == 2
+
+    assert "/proto/horn.proto" in graph.get_dependents("/proto/types.proto")
@@ -0,0 +1,172 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+# main requires the project cache directory at import time
+os.environ.setdefault("VELOCITAS_CACHE_DIR", tempfile.gettempdir())
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+import main  # noqa
+import proto  # noqa
+from generator import GrpcServiceSdkGeneratorFactory  # noqa
+from watcher import ProtoFileWatcher  # noqa
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("VELOCITAS_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(proto, "_parse_cache", None)
+    monkeypatch.setattr(
+        main, "GENERATION_CACHE_PATH", str(cache_dir / "generation-cache.json")
+    )
+    monkeypatch.setattr(main, "IMPORT_GRAPH_CACHE_DIR", str(cache_dir / "graphs"))
+    monkeypatch.setattr(main, "get_programming_language", lambda: "python")
+
+    proto_dir = tmp_path / "proto"
+    proto_dir.mkdir()
+    (proto_dir / "service.proto").write_text(
+        'syntax = "proto3";\nimport "types.proto";\nservice A { rpc Get(B) returns (B); }\n'
+    )
+    (proto_dir / "types.proto").write_text('syntax = "proto3";\nmessage B {}\n')
+    (tmp_path / "templates").mkdir()
+    return tmp_path
+
+
+def create_factory(project: Path) -> mock.Mock:
+    factory = mock.create_autospec(GrpcServiceSdkGeneratorFactory, instance=True)
+    factory.is_tooling_installed.return_value = True
+    factory.get_template_dir.return_value = str(project / "templates")
+    factory.get_generation_environment.return_value = {}
+    factory.generate_descriptor_set.side_effect = AssertionError("protoc was run")
+    return factory
+
+
+def test_plan_neither_runs_protoc_nor_modifies_caches(project: Path):
+    factory = create_factory(project)
+    interfaces = [
+        {
+            "type": "grpc-interface",
+            "config": {"src": str(project / "proto"), "required": {}},
+        }
+    ]
+
+    with mock.patch.object(
+        main, "get_factory", return_value=factory
+    ), mock.patch.object(main, "get_interfaces_for_type", return_value=interfaces):
+        assert main.plan_sdks(False)
+
+    factory.generate_descriptor_set.assert_not_called()
+    factory.install_tooling.assert_not_called()
+    assert not (project / "cache").exists()
+
+
+def create_task(tmp_path: Path, name: str, is_up_to_date: bool) -> SimpleNamespace:
+    proto_file_handle = mock.Mock(file_path=str(tmp_path / f"{name}.proto"))
+    proto_file_handle.get_service_name.return_value = name
+    (tmp_path / name).mkdir()
+    return SimpleNamespace(
+        proto_file_handle=proto_file_handle,
+        service_sdk_dir=str(tmp_path / name),
+        is_up_to_date=is_up_to_date,
+        reason="up to date" if is_up_to_date else "changed inputs: proto",
+    )
+
+
+def test_cache_decides_within_affected_services(tmp_path: Path):
+    touched = create_task(tmp_path, "touched", True)
+    edited = create_task(tmp_path, "edited", False)
+    unaffected = create_task(tmp_path, "unaffected", False)
+    import_graph = mock.Mock()
+    import_graph.get_dependents.return_value = {
+        touched.proto_file_handle.file_path,
+        edited.proto_file_handle.file_path,
+    }
+
+    main.select_affected_services(
+        [touched, edited, unaffected], ["types.proto"], import_graph
+    )
+
+    assert touched.is_up_to_date and touched.reason == "up to date"
+    assert not edited.is_up_to_date
+    assert unaffected.is_up_to_date
+    assert unaffected.reason == "not affected by the changed proto files"
+
+
+def test_only_new_directories_are_watched():
+    watcher = mock.create_autospec(ProtoFileWatcher, instance=True)
+    watched_directories = set()
+
+    main.watch_directories(watcher, watched_directories, ["/a", "/b"])
+    main.watch_directories(watcher, watched_directories, ["/a", "/b"])
+    main.watch_directories(watcher, watched_directories, ["/a", "/b", "/c"])
+
+    assert watcher.watch.call_args_list == [
+        mock.call(["/a", "/b"]),
+        mock.call(["/c"]),
+    ]
+    assert watched_directories == {"/a", "/b", "/c"}
+
+
+def test_plan_does_not_verify_installation(project: Path):
+    factory = create_factory(project)
+    task = mock.Mock(
+        proto_file_handle=mock.Mock(file_path=str(project / "proto" / "service.proto")),
+        imported_files=[],
+        generate_client=True,
+        generate_server=False,
+        common_type_files=[],
+        service_options={},
+        service_sdk_dir=str(project / "sdk"),
+    )
+
+    with mock.patch.object(main, "get_outdated_reason", return_value=None):
+        main.evaluate_cache(factory, task, mock.Mock(), False)
+
+    task.create_generator.assert_not_called()
+    assert task.is_up_to_date
+    assert task.reason == main.UNVERIFIED_INSTALLATION_REASON
+
+
+def test_plan_does_not_fetch_unavailable_sources(
+    project: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+):
+    monkeypatch.setenv("VELOCITAS_WORKSPACE_DIR", str(project))
+    monkeypatch.setattr(main, "DOWNLOAD_PATH", str(project / "cache" / "downloads"))
+    interfaces = [
+        {
+            "type": "grpc-interface",
+            "config": {"src": "https://example.com/catalogue.zip", "required": {}},
+        }
+    ]
+
+    with mock.patch.object(
+        main, "get_factory", return_value=create_factory(project)
+    ), mock.patch.object(
+        main, "get_interfaces_for_type", return_value=interfaces
+    ), mock.patch.object(
+        main, "obtain_local_file_path", side_effect=AssertionError("downloaded")
+    ):
+        assert main.plan_sdks(False)
+
+    assert "source not available locally" in capsys.readouterr().out
+    assert not (project / "cache").exists()
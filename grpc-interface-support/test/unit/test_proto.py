@@ -14,12 +14,22 @@
 
 import os
 import sys
+from pathlib import Path
+from unittest import mock
 
 import pytest
+from proto_schema_parser.parser import Parser
 from pyfakefs.fake_filesystem import FakeFilesystem
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-from proto import ProtoFileHandle  # noqa
+import proto  # noqa
+from proto import (  # noqa
+    ProtoFileHandle,
+    ProtoFileMetadata,
+    ProtoParseCache,
+    load_descriptor_set_into_parse_cache,
+    parse_proto_file,
+)
 
 
 proto_file_contents = """
@@ -60,3 +70,77 @@ def test_get_imports(mock_filesystem: FakeFilesystem, env):
 def test_get_package(mock_filesystem: FakeFilesystem, env):
     proto_file = ProtoFileHandle(proto_file_path)
     assert proto_file.get_package() == "velocitas.toolchain.test.v1"
+
+
+def test_parse_proto_file_is_served_from_cache(mock_filesystem: FakeFilesystem, env):
+    mock_filesystem.create_file("/cached.proto", contents=proto_file_contents + "\n")
+
+    with mock.patch.object(
+        Parser, "parse", autospec=True, side_effect=Parser.parse
+    ) as parse:
+        first = parse_proto_file("/cached.proto")
+        second = parse_proto_file("/cached.proto")
+
+    assert parse.call_count == 1
+    assert first.service_names == second.service_names == ["TestService"]
+    assert first.package == "velocitas.toolchain.test.v1"
+
+
+def test_parse_cache_is_persisted(fs: FakeFilesystem):
+    metadata = ProtoFileMetadata(["A", "B"], "pkg.v1", ["types.proto"])
+    ProtoParseCache("/cache").put("abc", metadata)
+
+    restored = ProtoParseCache("/cache").get("abc")
+
+    assert restored is not None
+    assert restored.service_names == ["A", "B"]
+    assert restored.package == "pkg.v1"
+    assert restored.imports == ["types.proto"]
+    assert ProtoParseCache("/cache").get("def") is None
+
+
+def test_parse_cache_is_located_in_project_cache(
+    fs: FakeFilesystem, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(proto, "_parse_cache", None)
+    monkeypatch.setenv("VELOCITAS_CACHE_DIR", "/project-cache")
+
+    proto.get_parse_cache().put("abc", ProtoFileMetadata([], "pkg.v1", []))
+
+    assert os.path.isfile("/project-cache/proto-parse-cache/abc.json")
+
+
+def test_parse_cache_ignores_invalid_records(fs: FakeFilesystem):
+    fs.create_file("/cache/abc.json", contents='{"v": 0}')
+    assert ProtoParseCache("/cache").get("abc") is None
+
+
+def test_descriptor_set_is_loaded_into_parse_cache(tmp_path: Path):
+    descriptor_pb2 = pytest.importorskip("google.protobuf.descriptor_pb2")
+    (tmp_path / "service.proto").write_text("// content only used for hashing")
+    (tmp_path / "types.proto").write_text("// types")
+
+    descriptor_set = descriptor_pb2.FileDescriptorSet()
+    service_file = descriptor_set.file.add(name="service.proto", package="a.v1")
+    service_file.dependency.append("types.proto")
+    service = service_file.service.add(name="AService")
+    service.method.add(name="Get")
+    service.method.add(name="Set")
+    descriptor_set.file.add(name="types.proto", package="a.v1")
+    descriptor_set.file.add(name="google/protobuf/empty.proto")
+    descriptor_set_path = tmp_path / "descriptors.pb"
+    descriptor_set_path.write_bytes(descriptor_set.SerializeToString())
+
+    assert (
+        load_descriptor_set_into_parse_cache(str(descriptor_set_path), str(tmp_path))
+        == 2
+    )
+
+    with mock.patch.object(Parser, "parse", side_effect=AssertionError):
+        proto_file = ProtoFileHandle(str(tmp_path / "service.proto"))
+        assert parse_proto_file(str(tmp_path / "types.proto")).imports == []
+
+    assert proto_file.get_service_name() == "AService"
+    assert proto_file.get_package() == "a.v1"
+    assert proto_file.get_imports() == ["types.proto"]
+    assert proto_file.get_method_names() == ["Get", "Set"]
@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from protoc_gen_velocitas import decode_service_options, parse_parameter  # noqa
+from protoc import (  # noqa
+    copy_protoc_outputs,
+    get_output_stem,
+    get_plugin_args,
+    get_plugin_output_path,
+    write_plugin_launcher,
+)
+
+
+def test_get_output_stem():
+    assert (
+        get_output_stem("/include/bcm/horn/v1/horn.proto", "/include")
+        == "bcm/horn/v1/horn"
+    )
+
+
+def test_copy_protoc_outputs(fs: FakeFilesystem):
+    fs.create_file("/batch/bcm/horn/v1/horn.pb.h")
+    fs.create_file("/batch/bcm/horn/v1/horn.pb.cc")
+    fs.create_file("/batch/bcm/horn/v1/horn.grpc.pb.h")
+
+    copy_protoc_outputs(
+        "/batch",
+        "/package",
+        "/include/bcm/horn/v1/horn.proto",
+        "/include",
+        [".pb.h", ".pb.cc"],
+    )
+
+    assert os.path.isfile("/package/bcm/horn/v1/horn.pb.h")
+    assert os.path.isfile("/package/bcm/horn/v1/horn.pb.cc")
+    assert not os.path.exists("/package/bcm/horn/v1/horn.grpc.pb.h")
+
+
+def test_plugin_launcher_runs_plugin(tmp_path):
+    launcher_path = write_plugin_launcher(str(tmp_path))
+    modification_time = os.stat(launcher_path).st_mtime_ns
+
+    assert write_plugin_launcher(str(tmp_path)) == launcher_path
+    assert os.stat(launcher_path).st_mtime_ns == modification_time
+    # Errors of the plugin are reported to protoc within the response
+    response = subprocess.run(
+        [launcher_path], input=b"", capture_output=True, check=True
+    ).stdout
+    assert b"Unsupported language" in response
+
+
+def test_plugin_outputs_are_separated_from_protoc_outputs(tmp_path):
+    args = get_plugin_args("/launcher", "cpp", "/templates", str(tmp_path), "/include")
+
+    assert args == [
+        "--plugin=protoc-gen-velocitas=/launcher",
+        "--velocitas_opt=language=cpp,templates=/templates",
+        f"--velocitas_out={os.path.join(tmp_path, '.velocitas')}",
+    ]
+    assert os.path.isdir(os.path.join(tmp_path, ".velocitas"))
+    assert get_plugin_output_path(
+        "/batch", "/include/bcm/horn/v1/horn.proto", "/include"
+    ) == os.path.join("/batch", ".velocitas", "bcm/horn/v1/horn")
+
+
+def test_service_options_are_passed_to_plugin_by_output_stem(tmp_path):
+    args = get_plugin_args(
+        "/launcher",
+        "python",
+        "/templates",
+        str(tmp_path),
+        "/include",
+        {"/include/bcm/horn/v1/horn.proto": {"serverMode": "async"}},
+    )
+
+    parameter = parse_parameter(args[1].split("=", 1)[1])
+    assert decode_service_options(parameter["options"]) == {
+        "bcm/horn/v1/horn": {"serverMode": "async"}
+    }
@@ -0,0 +1,299 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from protoc_gen_velocitas import (  # noqa
+    CodeGeneratorRequest,
+    decode_message,
+    encode_field,
+    encode_parameter,
+    encode_response,
+    encode_service_options,
+    generate,
+    parse_parameter,
+)
+
+template_base_dir = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "templates"
+)
+
+
+def encode_method(
+    name: str, client_streaming: bool = False, server_streaming: bool = False
+) -> bytes:
+    return (
+        encode_field(1, name)
+        + encode_field(2, f".bcm.horn.v1.{name}Request")
+        + encode_field(3, f".bcm.horn.v1.{name}Response")
+        + encode_field(5, int(client_streaming))
+        + encode_field(6, int(server_streaming))
+    )
+
+
+def create_request(
+    language: str, server_mode: str = "", **options: Any
+) -> CodeGeneratorRequest:
+    service = (
+        encode_field(1, "HornService")
+        + encode_field(2, encode_method("Start"))
+        + encode_field(2, encode_method("Upload", client_streaming=True))
+        + encode_field(2, encode_method("Chat", True, True))
+    )
+    horn_file = (
+        encode_field(1, "bcm/horn/v1/horn.proto")
+        + encode_field(2, "bcm.horn.v1")
+        + encode_field(6, service)
+    )
+    types_file = encode_field(1, "bcm/types.proto") + encode_field(2, "bcm")
+    parameter = f"language={language},templates={template_base_dir}/{language}"
+    if server_mode:
+        options["serverMode"] = server_mode
+    if options:
+        service_options = {"bcm/horn/v1/horn": options}
+        parameter += f",options={encode_service_options(service_options)}"
+    return CodeGeneratorRequest.decode(
+        encode_field(1, "bcm/horn/v1/horn.proto")
+        + encode_field(1, "bcm/types.proto")
+        + encode_field(2, parameter)
+        + encode_field(15, types_file)
+        + encode_field(15, horn_file)
+    )
+
+
+def test_encoded_response_can_be_decoded():
+    response = decode_message(encode_response({"a/b.py": "content" * 50}, "failed"))
+
+    assert response[1] == [b"failed"]
+    assert response[2] == [1]
+    file = decode_message(response[15][0])
+    assert file[1] == [b"a/b.py"]
+    assert file[15] == [b"content" * 50]
+
+
+def test_request_is_decoded():
+    request = create_request("python")
+
+    assert request.files_to_generate == ["bcm/horn/v1/horn.proto", "bcm/types.proto"]
+    service = request.proto_files[1].services[0]
+    assert service.name == "HornService"
+    assert [method.name for method in service.methods] == ["Start", "Upload", "Chat"]
+    assert service.methods[0].input_type == ".bcm.horn.v1.StartRequest"
+    assert service.methods[1].client_streaming
+    assert not service.methods[1].server_streaming
+
+
+def test_python_files_are_generated_for_files_with_services_only():
+    outputs = generate(create_request("python"))
+
+    assert sorted(outputs) == [
+        "bcm/horn/v1/horn/HornServiceServiceClientFactory.py",
+        "bcm/horn/v1/horn/HornServiceServiceImpl.py",
+        "bcm/horn/v1/horn/HornServiceServiceServerFactory.py",
+        "bcm/horn/v1/horn/HornServiceServiceStub.py",
+    ]
+    stub = outputs["bcm/horn/v1/horn/HornServiceServiceStub.py"]
+    assert (
+        "from hornservice_service_sdk.horn_pb2_grpc import HornServiceServicer" in stub
+    )
+    assert "    def Upload(self, request_iterator, context):\n" in stub
+    assert "context.set_code(grpc.StatusCode.UNIMPLEMENTED)" in stub
+    impl = outputs["bcm/horn/v1/horn/HornServiceServiceImpl.py"]
+    assert "class HornServiceService(HornServiceServiceStub):" in impl
+    assert "    def Start(self, request, context):\n" in impl
+    assert "context.set_code" not in impl
+
+
+def test_python_async_server_mode_generates_aio_server_and_coroutines():
+    outputs = generate(create_request("python", "async"))
+
+    factory = outputs["bcm/horn/v1/horn/HornServiceServiceServerFactory.py"]
+    assert "server = grpc.aio.server()" in factory
+    assert "ThreadPoolExecutor" not in factory
+    stub = outputs["bcm/horn/v1/horn/HornServiceServiceStub.py"]
+    assert "    async def Start(self, request, context):\n" in stub
+    impl = outputs["bcm/horn/v1/horn/HornServiceServiceImpl.py"]
+    assert "    async def Chat(self, request_iterator, context):\n" in impl
+
+
+def test_python_client_factory_uses_channel_options():
+    channel_options = {
+        "keepaliveTimeMs": 10000,
+        "maxReceiveMessageLength": 8388608,
+        "compression": "gzip",
+        "serviceConfig": {"methodConfig": [{"name": [{}], "timeout": "1s"}]},
+        "cacheServiceLocation": True,
+        "poolSize": 4,
+    }
+    outputs = generate(create_request("python", channelOptions=channel_options))
+
+    factory = outputs["bcm/horn/v1/horn/HornServiceServiceClientFactory.py"]
+    compile(factory, "HornServiceServiceClientFactory.py", "exec")
+    assert '    ("grpc.keepalive_time_ms", 10000),\n' in factory
+    assert '    ("grpc.max_receive_message_length", 8388608),\n' in factory
+    assert '    ("grpc.enable_retries", 1),\n' in factory
+    assert "COMPRESSION: Optional[grpc.Compression] = grpc.Compression.Gzip" in factory
+    assert "CACHE_SERVICE_LOCATION = True" in factory
+    assert "CHANNEL_POOL_SIZE = 4" in factory
+
+
+def test_python_client_factory_without_channel_options():
+    outputs = generate(create_request("python"))
+
+    factory = outputs["bcm/horn/v1/horn/HornServiceServiceClientFactory.py"]
+    compile(factory, "HornServiceServiceClientFactory.py", "exec")
+    assert "CHANNEL_OPTIONS: List[Tuple[str, Union[int, str]]] = []" in factory
+    assert "CACHE_SERVICE_LOCATION = False" in factory
+    assert "CHANNEL_POOL_SIZE = 1" in factory
+
+
+@pytest.mark.parametrize(
+    "channel_options", [{"keepalive": 1}, {"poolSize": 0}, {"poolSize": "4"}]
+)
+def test_invalid_channel_options_are_rejected(channel_options):
+    with pytest.raises(ValueError):
+        generate(create_request("python", channelOptions=channel_options))
+
+
+def test_cpp_client_factory_uses_channel_pool_and_options():
+    channel_options = {
+        "keepaliveTimeMs": 10000,
+        "compression": "gzip",
+        "serviceConfig": {"methodConfig": [{"name": [{}], "timeout": "1s"}]},
+        "poolSize": 4,
+    }
+    outputs = generate(create_request("cpp", channelOptions=channel_options))
+
+    factory = outputs["bcm/horn/v1/horn/HornserviceServiceClientFactory.cc"]
+    assert "constexpr std::size_t CHANNEL_POOL_SIZE      = 4;" in factory
+    assert "constexpr bool        CACHE_SERVICE_LOCATION = false;" in factory
+    assert (
+        "    grpc::ChannelArguments arguments;\n"
+        '    arguments.SetInt("grpc.keepalive_time_ms", 10000);\n'
+        '    arguments.SetString("grpc.service_config", '
+        '"{\\"methodConfig\\": [{\\"name\\": [{}], \\"timeout\\": \\"1s\\"}]}");\n'
+        '    arguments.SetInt("grpc.enable_retries", 1);\n'
+        "    arguments.SetCompressionAlgorithm(GRPC_COMPRESS_GZIP);\n"
+    ) in factory
+
+
+def test_unsupported_server_mode_is_rejected():
+    with pytest.raises(ValueError):
+        generate(create_request("cpp", "async"))
+
+
+def test_cpp_stubs_match_signatures_of_grpc_service():
+    outputs = generate(create_request("cpp"))
+
+    header = outputs["bcm/horn/v1/horn/HornserviceServiceImpl.h"]
+    assert (
+        "    ::grpc::Status Upload(::grpc::ServerContext* context, "
+        "::grpc::ServerReader< ::bcm::horn::v1::UploadRequest>* reader, "
+        "::bcm::horn::v1::UploadResponse* response) override;"
+    ) in header
+    assert "#include <services/hornservice/bcm/horn/v1/horn.grpc.pb.h>" in header
+    source = outputs["bcm/horn/v1/horn/HornserviceServiceImpl.cpp"]
+    assert (
+        "::grpc::Status HornserviceService::Chat(::grpc::ServerContext* context, "
+        "::grpc::ServerReaderWriter< ::bcm::horn::v1::ChatResponse, "
+        "::bcm::horn::v1::ChatRequest>* stream) {\n"
+        "  (void) context;\n"
+        "  (void) stream;\n"
+    ) in source
+
+
+def test_cpp_callback_server_mode_generates_reactors():
+    outputs = generate(create_request("cpp", "callback"))
+
+    header = outputs["bcm/horn/v1/horn/HornserviceServiceImpl.h"]
+    assert "public bcm::horn::v1::HornService::CallbackService {" in header
+    assert (
+        "    ::grpc::ServerReadReactor< ::bcm::horn::v1::UploadRequest>* "
+        "Upload(::grpc::CallbackServerContext* context, "
+        "::bcm::horn::v1::UploadResponse* response) override;"
+    ) in header
+    source = outputs["bcm/horn/v1/horn/HornserviceServiceImpl.cpp"]
+    assert "::grpc::ServerUnaryReactor* HornserviceService::Start(" in source
+    assert "  return context->DefaultReactor();" not in source
+    assert "  auto* reactor = context->DefaultReactor();" in source
+    server_factory = outputs["bcm/horn/v1/horn/HornserviceServiceServerFactory.h"]
+    assert "HornService::CallbackService>&& service" in server_factory
+
+
+def test_cpp_server_builder_is_configured_from_server_options():
+    outputs = generate(
+        create_request(
+            "cpp",
+            serverOptions={
+                "resourceQuotaMaxThreads": 8,
+                "minPollers": 2,
+                "numCompletionQueues": 4,
+            },
+        )
+    )
+
+    server_factory = outputs["bcm/horn/v1/horn/HornserviceServiceServerFactory.cc"]
+    assert (
+        "    grpc::ServerBuilder builder;\n"
+        '    grpc::ResourceQuota resourceQuota("HornService");\n'
+        "    resourceQuota.SetMaxThreads(8);\n"
+        "    builder.SetResourceQuota(resourceQuota);\n"
+        "    builder.SetSyncServerOption("
+        "grpc::ServerBuilder::SyncServerOption::MIN_POLLERS, 2);\n"
+        "    builder.SetSyncServerOption("
+        "grpc::ServerBuilder::SyncServerOption::NUM_CQS, 4);\n"
+    ) in server_factory
+
+
+def test_cpp_server_builder_without_server_options():
+    outputs = generate(create_request("cpp"))
+
+    server_factory = outputs["bcm/horn/v1/horn/HornserviceServiceServerFactory.cc"]
+    assert "    grpc::ServerBuilder builder;\n    // Listen" in server_factory
+    assert "*synchronous* service" in server_factory
+
+
+@pytest.mark.parametrize(
+    "language, server_options",
+    [
+        ("cpp", {"maxPollers": 0}),
+        ("cpp", {"threads": 4}),
+        ("python", {"maxPollers": 4}),
+    ],
+)
+def test_invalid_server_options_are_rejected(language, server_options):
+    with pytest.raises(ValueError):
+        generate(create_request(language, serverOptions=server_options))
+
+
+def test_unsupported_language_is_rejected():
+    request = create_request("python")
+    request.parameter = "language=rust,templates=/templates"
+
+    with pytest.raises(ValueError):
+        generate(request)
+
+
+def test_parameter_values_may_contain_commas_and_equal_signs():
+    options = {"language": "cpp", "templates": "/work space/a,b=c/templates"}
+
+    parameter = encode_parameter(options)
+
+    assert parameter.count(",") == 1
+    assert parse_parameter(parameter) == options
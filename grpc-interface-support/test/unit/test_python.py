@@ -0,0 +1,306 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from protoc import copy_protoc_outputs, get_output_stem  # noqa
+from proto import ProtoFileHandle  # noqa
+from python import (  # noqa
+    GrpcToolsProtoc,
+    PythonCommonTypesSdkGenerator,
+    PythonGrpcInterfaceGenerator,
+    PythonToolingManager,
+    WheelhouseInstaller,
+)
+
+pytest.importorskip("grpc_tools")
+
+BENCHMARK_ITERATIONS = 5
+
+proto_file_contents = """
+syntax = "proto3";
+
+package velocitas.toolchain.test.v1;
+
+message Request {}
+message Response {}
+
+service TestService {
+  rpc Method(Request) returns (Response);
+}
+"""
+
+
+@pytest.fixture
+def proto_dir(tmp_path: Path) -> Path:
+    (tmp_path / "test.proto").write_text(proto_file_contents)
+    return tmp_path
+
+
+def protoc_args(proto_dir: Path, output_dir: Path) -> List[str]:
+    return [
+        f"-I{proto_dir}",
+        f"--python_out={output_dir}",
+        f"--pyi_out={output_dir}",
+        f"--grpc_python_out={output_dir}",
+        str(proto_dir / "test.proto"),
+    ]
+
+
+def test_in_process_protoc_generates_code(proto_dir: Path, tmp_path: Path):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    GrpcToolsProtoc().run(protoc_args(proto_dir, output_dir))
+
+    assert (output_dir / "test_pb2.py").is_file()
+    assert (output_dir / "test_pb2.pyi").is_file()
+    assert (output_dir / "test_pb2_grpc.py").is_file()
+
+
+def test_in_process_protoc_raises_with_diagnostics(proto_dir: Path, tmp_path: Path):
+    (proto_dir / "broken.proto").write_text("syntax = 'proto3'; message {")
+
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        GrpcToolsProtoc().run(
+            [
+                f"-I{proto_dir}",
+                f"--python_out={tmp_path}",
+                str(proto_dir / "broken.proto"),
+            ]
+        )
+
+    assert "broken.proto" in error.value.output
+
+
+def test_benchmark_in_process_protoc_is_faster_than_subprocess(
+    proto_dir: Path, tmp_path: Path
+):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    args = protoc_args(proto_dir, output_dir)
+
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_ITERATIONS):
+        subprocess.check_call([sys.executable, "-m", "grpc_tools.protoc", *args])
+    subprocess_time = (time.perf_counter() - start) / BENCHMARK_ITERATIONS
+
+    protoc = GrpcToolsProtoc()
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_ITERATIONS):
+        protoc.run(args)
+    in_process_time = (time.perf_counter() - start) / BENCHMARK_ITERATIONS
+
+    print(
+        f"protoc per service: subprocess {subprocess_time * 1000:.1f} ms, "
+        f"in-process {in_process_time * 1000:.1f} ms"
+    )
+    assert in_process_time < subprocess_time
+
+
+def test_common_types_package_keeps_module_locations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv(
+        "VELOCITAS_PACKAGE_DIR",
+        os.path.join(os.path.dirname(__file__), "..", "..", ".."),
+    )
+    proto_dir = tmp_path / "proto"
+    (proto_dir / "common" / "v1").mkdir(parents=True)
+    (proto_dir / "types.proto").write_text('syntax = "proto3";\nmessage A {}\n')
+    (proto_dir / "common" / "v1" / "types.proto").write_text(
+        'syntax = "proto3";\nmessage B {}\n'
+    )
+    package_dir = tmp_path / "common-types"
+    package_dir.mkdir()
+
+    generator = PythonCommonTypesSdkGenerator(
+        str(package_dir),
+        {
+            str(proto_dir / "types.proto"): str(proto_dir),
+            str(proto_dir / "common" / "v1" / "types.proto"): str(proto_dir),
+        },
+    )
+    generator.generate_package(False, False)
+
+    assert (package_dir / "types_pb2.py").is_file()
+    assert (package_dir / "common" / "v1" / "types_pb2.py").is_file()
+    pyproject = (package_dir / "pyproject.toml").read_text()
+    assert 'name = "common-types-sdk"' in pyproject
+    assert 'py-modules = ["types_pb2"]' in pyproject
+    assert 'packages = ["common", "common.v1"]' in pyproject
+
+
+def test_generation_without_batch_compiles_transitive_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv(
+        "VELOCITAS_PACKAGE_DIR",
+        os.path.join(os.path.dirname(__file__), "..", "..", ".."),
+    )
+    monkeypatch.setenv("VELOCITAS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("VELOCITAS_WORKSPACE_DIR", str(tmp_path))
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "requirements.txt").write_text("vehicle-app-sdk==0.15.0\n")
+    proto_dir = tmp_path / "proto"
+    proto_dir.mkdir()
+    (proto_dir / "service.proto").write_text(
+        'syntax = "proto3";\nimport "direct.proto";\n'
+        "service Test { rpc Get(A) returns (A); }\n"
+    )
+    (proto_dir / "direct.proto").write_text(
+        'syntax = "proto3";\nimport "transitive.proto";\nmessage A { B b = 1; }\n'
+    )
+    (proto_dir / "transitive.proto").write_text('syntax = "proto3";\nmessage B {}\n')
+    package_dir = tmp_path / "sdk"
+    package_dir.mkdir()
+
+    generator = PythonGrpcInterfaceGenerator(
+        str(package_dir),
+        ProtoFileHandle(str(proto_dir / "service.proto")),
+        False,
+        str(proto_dir),
+        True,
+        imported_files=[
+            str(proto_dir / "direct.proto"),
+            str(proto_dir / "transitive.proto"),
+        ],
+    )
+    generator.generate_package(True, False)
+
+    assert (package_dir / "test_service_sdk" / "direct_pb2.pyi").is_file()
+    assert (package_dir / "test_service_sdk" / "transitive_pb2.pyi").is_file()
+
+
+def fake_pip(args: List[str]) -> None:
+    if args[1] == "wheel":
+        wheel_dir = args[args.index("--wheel-dir") + 1]
+        for package_path in args[args.index("--wheel-dir") + 2 :]:
+            name = Path(package_path).name
+            Path(wheel_dir, f"{name}_service_sdk-1.0.0-py3-none-any.whl").touch()
+
+
+def test_wheelhouse_installs_all_packages_at_once(tmp_path: Path):
+    for name in ["seats", "horn"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text(name)
+
+    installer = WheelhouseInstaller(str(tmp_path / "wheelhouse"))
+    with mock.patch("subprocess.check_call", side_effect=fake_pip) as check_call:
+        for name in ["seats", "horn"]:
+            installer.add_package(f"{name}-service-sdk", str(tmp_path / name))
+        installer.install_pending_packages()
+
+    commands = [call.args[0][:2] for call in check_call.call_args_list]
+    assert commands == [["pip", "wheel"], ["pip", "uninstall"], ["pip", "install"]]
+    assert check_call.call_args_list[2].args[0][-2:] == [
+        str(tmp_path / "wheelhouse" / "seats_service_sdk-1.0.0-py3-none-any.whl"),
+        str(tmp_path / "wheelhouse" / "horn_service_sdk-1.0.0-py3-none-any.whl"),
+    ]
+
+
+def test_wheelhouse_rebuilds_only_changed_packages(tmp_path: Path):
+    for name in ["seats", "horn"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text(name)
+
+    installer = WheelhouseInstaller(str(tmp_path / "wheelhouse"))
+    with mock.patch("subprocess.check_call", side_effect=fake_pip) as check_call:
+        for name in ["seats", "horn"]:
+            installer.add_package(f"{name}-service-sdk", str(tmp_path / name))
+        installer.install_pending_packages()
+
+        check_call.reset_mock()
+        (tmp_path / "horn" / "pyproject.toml").write_text("changed")
+        for name in ["seats", "horn"]:
+            installer.add_package(f"{name}-service-sdk", str(tmp_path / name))
+        installer.install_pending_packages()
+
+    wheel_args = check_call.call_args_list[0].args[0]
+    assert wheel_args[1] == "wheel"
+    assert wheel_args[-1] == str(tmp_path / "horn")
+    assert str(tmp_path / "seats") not in wheel_args
+    assert check_call.call_args_list[1].args[0] == [
+        "pip",
+        "uninstall",
+        "-y",
+        "horn-service-sdk",
+    ]
+
+
+def test_wheelhouse_removes_wheel_and_uninstalls_package(tmp_path: Path):
+    for name in ["seats", "horn"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text(name)
+
+    installer = WheelhouseInstaller(str(tmp_path / "wheelhouse"))
+    with mock.patch("subprocess.check_call", side_effect=fake_pip) as check_call:
+        for name in ["seats", "horn"]:
+            installer.add_package(f"{name}-service-sdk", str(tmp_path / name))
+        installer.install_pending_packages()
+
+        check_call.reset_mock()
+        with mock.patch("python.is_distribution_installed", return_value=True):
+            installer.remove_package("horn-service-sdk")
+
+    check_call.assert_called_once_with(["pip", "uninstall", "-y", "horn-service-sdk"])
+    assert sorted(os.listdir(tmp_path / "wheelhouse")) == [
+        "seats_service_sdk-1.0.0-py3-none-any.whl",
+        WheelhouseInstaller.STATE_FILE_NAME,
+    ]
+
+
+@pytest.mark.parametrize(
+    "version, is_compatible",
+    [("1.57.0", True), ("1.62.2", True), ("1.63.0rc1", True), ("1.56.2", False)],
+)
+def test_tooling_version_range(version: str, is_compatible: bool):
+    assert PythonToolingManager.is_compatible(version) == is_compatible
+
+
+def test_tooling_install_is_skipped_for_compatible_version(tmp_path: Path):
+    manager = PythonToolingManager(str(tmp_path / "tooling.json"))
+    with mock.patch.object(
+        PythonToolingManager, "get_installed_version", return_value="1.62.2"
+    ), mock.patch("subprocess.check_call") as check_call:
+        manager.ensure_installed()
+        assert (tmp_path / "tooling.json").is_file()
+
+        with mock.patch("importlib.util.find_spec") as find_spec:
+            manager.ensure_installed()
+            find_spec.assert_not_called()
+
+    check_call.assert_not_called()
+
+
+def test_tooling_is_installed_for_incompatible_version(tmp_path: Path):
+    manager = PythonToolingManager(str(tmp_path / "tooling.json"))
+    with mock.patch.object(
+        PythonToolingManager, "get_installed_version", side_effect=["1.50.0", "1.62.2"]
+    ), mock.patch("subprocess.check_call") as check_call:
+        manager.ensure_installed()
+
+    check_call.assert_called_once_with(
+        ["pip", "install", PythonToolingManager.get_requirement()]
+    )
+    assert "1.62.2" in (tmp_path / "tooling.json").read_text()
@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from tracing import TRACE_ENV_VAR, Tracer  # noqa
+
+
+@pytest.fixture
+def tracer(monkeypatch: pytest.MonkeyPatch) -> Tracer:
+    monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+    tracer = Tracer()
+    tracer.enable()
+    return tracer
+
+
+def test_stage_is_not_recorded_if_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+    tracer = Tracer()
+
+    with tracer.stage("generate_package", service="HornService"):
+        pass
+
+    assert not tracer.is_enabled()
+    assert tracer.take_events() == []
+
+
+def test_enable_is_inherited_via_environment(tracer: Tracer):
+    assert os.environ[TRACE_ENV_VAR] == "1"
+    assert Tracer().is_enabled()
+
+
+def test_stage_records_complete_event(tracer: Tracer):
+    with pytest.raises(ValueError):
+        with tracer.stage("generate_package", service="HornService") as event_args:
+            event_args["files"] = 2
+            raise ValueError()
+
+    [event] = tracer.take_events()
+    assert event["name"] == "generate_package"
+    assert event["cat"] == "stage"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["pid"] == os.getpid()
+    assert event["args"] == {
+        "service": "HornService",
+        "files": 2,
+        "error": "ValueError",
+    }
+    assert tracer.take_events() == []
+
+
+def test_check_call_records_command_and_exit_code(tracer: Tracer):
+    tracer.check_call([sys.executable, "-c", "pass"])
+    with pytest.raises(subprocess.CalledProcessError):
+        tracer.check_call([sys.executable, "-c", "raise SystemExit(3)"])
+
+    succeeded, failed = tracer.take_events()
+    assert succeeded["cat"] == "subprocess"
+    assert succeeded["name"] == os.path.basename(sys.executable)
+    assert succeeded["args"]["command"].endswith(" -c pass")
+    assert succeeded["args"]["exit_code"] == 0
+    assert failed["args"]["exit_code"] == 3
+    assert failed["args"]["error"] == "CalledProcessError"
+
+
+def test_write_creates_trace_and_summary(tracer: Tracer, tmp_path: Path):
+    for _ in range(2):
+        with tracer.stage("install_package"):
+            pass
+    tracer.add_events(
+        [
+            {
+                "name": "pip",
+                "cat": "subprocess",
+                "ph": "X",
+                "ts": 0,
+                "dur": 5000000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"command": "pip install .", "exit_code": 0},
+            }
+        ]
+    )
+
+    trace_path = tracer.write(str(tmp_path / "traces"))
+
+    with open(trace_path, encoding="utf-8") as trace_file:
+        trace = json.load(trace_file)
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        "install_package",
+        "install_package",
+        "pip",
+    ]
+    summary = Path(trace_path).with_suffix(".txt").read_text(encoding="utf-8")
+    lines = summary.splitlines()
+    assert lines[0].split() == [
+        "category",
+        "name",
+        "calls",
+        "total",
+        "ms",
+        "mean",
+        "ms",
+        "max",
+        "ms",
+    ]
+    assert lines[1].split() == ["subprocess", "pip", "1", "5000.0", "5000.0", "5000.0"]
+    assert lines[2].split()[:3] == ["stage", "install_package", "2"]
@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+from watcher import (  # noqa
+    InotifyProtoFileWatcher,
+    PollingProtoFileWatcher,
+    ProtoFileWatcher,
+    remove_nested_directories,
+)
+
+
+class FakeWatcher(ProtoFileWatcher):
+    def __init__(self, changes: List[Set[str]]):
+        self.changes = changes
+        self.timeouts: List[Optional[float]] = []
+
+    def watch(self, directory_paths: List[str]) -> None:
+        pass
+
+    def get_changes(self, timeout: Optional[float]) -> Set[str]:
+        self.timeouts.append(timeout)
+        return self.changes.pop(0) if self.changes else set()
+
+
+def create_watcher(kind: str) -> ProtoFileWatcher:
+    if kind == "polling":
+        return PollingProtoFileWatcher(poll_interval=0.01)
+    try:
+        return InotifyProtoFileWatcher()
+    except (OSError, AttributeError, TypeError):
+        pytest.skip("inotify is not available")
+
+
+def test_remove_nested_directories():
+    assert remove_nested_directories(["/a/b", "/a", "/ab", "/a/b/c", "/a"]) == [
+        "/a",
+        "/ab",
+    ]
+
+
+def test_wait_for_changes_debounces_bursts():
+    watcher = FakeWatcher([set(), {"a.proto"}, {"b.proto"}, {"a.proto"}, set()])
+
+    assert watcher.wait_for_changes(0.3) == {"a.proto", "b.proto"}
+    assert watcher.timeouts == [None, None, 0.3, 0.3, 0.3]
+
+
+@pytest.mark.parametrize("kind", ["polling", "inotify"])
+def test_watcher_reports_proto_file_changes(tmp_path: Path, kind: str):
+    (tmp_path / "service.proto").write_text("service A {}")
+    (tmp_path / ".git").mkdir()
+    watcher = create_watcher(kind)
+    try:
+        watcher.watch([str(tmp_path)])
+        assert watcher.get_changes(0.05) == set()
+
+        (tmp_path / "service.proto").write_text("service A { }")
+        (tmp_path / "notes.txt").write_text("ignored")
+        (tmp_path / ".git" / "hidden.proto").write_text("ignored")
+        assert watcher.get_changes(1) == {str(tmp_path / "service.proto")}
+
+        (tmp_path / "types").mkdir()
+        (tmp_path / "types" / "types.proto").write_text("message B {}")
+        (tmp_path / "service.proto").unlink()
+        changes: Set[str] = set()
+        while len(changes) < 2:
+            further_changes = watcher.get_changes(1)
+            assert len(further_changes) > 0
+            changes.update(further_changes)
+        assert changes == {
+            str(tmp_path / "types" / "types.proto"),
+            str(tmp_path / "service.proto"),
+        }
+    finally:
+        watcher.close()